@@ -0,0 +1,549 @@
+"""성능 측정 스크립트
+
+임시 데이터베이스에 합성 데이터를 만들어 측정하므로 실제 DB(data/carenote.db)는 건드리지 않는다.
+
+    python benchmark.py                  # 전체 측정
+    python benchmark.py connection       # 일부만 (이름은 --list 로 확인)
+    python benchmark.py --scale 0.1      # 데이터 양을 줄여서 빠르게
+
+결과는 PC/디스크에 따라 다르므로 같은 PC 에서 변경 전후를 비교할 때 쓴다.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict
+
+from carenote import database, statistics
+from carenote.crud import CONSULTING_SELECT, JOINED_CONSULTING_ORDER, ConsultingCRUD, StudentCRUD, \
+    search_cache_clear, session
+from carenote.export import export_consultings
+from carenote.models import Consulting, Student, day_key, rollover_year
+
+# 이름 → (설명, 함수)
+BENCHMARKS = {}
+
+
+def benchmark(name: str, description: str):
+    """측정 함수 등록 (함수는 scale 을 받아 결과 줄을 출력한다)"""
+    def register(func):
+        BENCHMARKS[name] = (description, func)
+        return func
+    return register
+
+
+# ---------- 공통 ----------
+
+@contextmanager
+def temp_database(profile: str = None):
+    """임시 파일 데이터베이스로 전환 (profile 을 주면 그 성능 프로필로 연결)"""
+    saved = database.DB_PATH, database.DB_PROFILE
+    with tempfile.TemporaryDirectory() as tmp:
+        database.close_all_connections()
+        database.DB_PATH = os.path.join(tmp, 'bench.db')
+        database.DB_PROFILE = profile or database.DB_PROFILE
+        try:
+            database.init_database(progress=None)
+            yield database.get_connection()
+        finally:
+            database.close_all_connections()
+            database.DB_PATH, database.DB_PROFILE = saved
+
+
+def count(n: float, scale: float) -> int:
+    return max(1, int(n * scale))
+
+
+def per_call(func, repeat: int) -> float:
+    """func 한 번 실행에 걸린 평균 시간 (초)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def us(seconds: float) -> str:
+    return f"{seconds * 1e6:.1f} us"
+
+
+def ms(seconds: float) -> str:
+    return f"{seconds * 1e3:.1f} ms"
+
+
+def with_peak_memory(func, repeat: int) -> str:
+    """평균 실행 시간과 최대 메모리 사용량 (tracemalloc 기준)"""
+    tracemalloc.start()
+    try:
+        seconds = per_call(func, repeat)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return f"{ms(seconds)}, 최대 {peak / 2**20:.1f} MiB"
+
+
+def report(label: str, value: str):
+    print(f"  {label}: {value}")
+
+
+def seed_students(n: int) -> list:
+    surnames = '김이박최정강조윤장임'
+    return StudentCRUD.create_many(
+        Student(f"{surnames[i % 10]}민{i}", student_grade=i % 6 + 1, student_class=i % 4 + 1)
+        for i in range(n)
+    )
+
+
+def seed_consultings(student_ids: list, n: int, text_size: int = 0) -> list:
+    text = ("학교 생활과 교우 관계에 대한 상담 내용 " * (text_size // 20 + 1))[:text_size] or None
+    return ConsultingCRUD.create_many(
+        Consulting(f"상담 {i}", student_ids[i % len(student_ids)],
+                   consulting_date=f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d} 00:00:00",
+                   consulting_type=('전화', '대면', '기타')[i % 3],
+                   consulting_content=text)
+        for i in range(n)
+    )
+
+
+# ---------- 측정 ----------
+
+@benchmark('connection', "호출마다 연결 열기 vs 스레드별 연결 재사용")
+def bench_connection(scale: float):
+    with temp_database():
+        student_ids = seed_students(count(5000, scale))
+        seed_consultings(student_ids, count(50000, scale))
+        repeat = count(2000, min(scale, 1))
+        sql = "SELECT student_name FROM students WHERE student_id = ?"
+
+        def connect_per_call():
+            # 기존 방식: 호출마다 connect + PRAGMA + 조회 + close
+            fresh = sqlite3.connect(database.DB_PATH)
+            fresh.execute("PRAGMA foreign_keys = ON")
+            database.apply_profile(fresh)
+            fresh.execute(sql, (student_ids[0],)).fetchone()
+            fresh.close()
+
+        def pooled():
+            database.get_connection().execute(sql, (student_ids[0],)).fetchone()
+
+        report("학생 1명 조회, 매번 연결", us(per_call(connect_per_call, repeat)))
+        report("학생 1명 조회, 연결 재사용", us(per_call(pooled, repeat)))
+        report("ConsultingCRUD.get", us(per_call(lambda: ConsultingCRUD.get(1), repeat)))
+        report("ConsultingCRUD.get_by_student",
+               us(per_call(lambda: ConsultingCRUD.get_by_student(student_ids[0]), repeat)))
+
+
+@benchmark('profiles', "성능 프로필별 한 건씩 저장(commit) 속도와 전체 조회 시간")
+def bench_profiles(scale: float):
+    for profile in database.DB_PROFILES:
+        with temp_database(profile):
+            student_ids = seed_students(count(1000, scale))
+            seed_consultings(student_ids, count(100000, scale))
+            n = count(2000, scale)
+            create = per_call(lambda: ConsultingCRUD.create(Consulting("상담", student_ids[0])), n)
+            get_all = per_call(ConsultingCRUD.get_all, 1)
+            report(f"{profile} 저장", f"{1 / create:.0f}/s")
+            report(f"{profile} ConsultingCRUD.get_all", ms(get_all))
+
+
+
+@benchmark('session', "학생 1명 + 상담 3건 저장: 호출마다 commit vs session() 한 번")
+def bench_session(scale: float):
+    repeat = count(300, scale)
+
+    def separate():
+        student_id = StudentCRUD.create(Student("김민수", student_grade=3, student_class=1))
+        for i in range(3):
+            ConsultingCRUD.create(Consulting(f"상담 {i}", student_id))
+
+    def shared():
+        with session():
+            separate()
+
+    for profile in ('safe', 'balanced'):
+        with temp_database(profile):
+            report(f"{profile} 호출마다 commit", ms(per_call(separate, repeat)))
+            report(f"{profile} session()", ms(per_call(shared, repeat)))
+
+@benchmark('bulk', "한 건씩 저장 vs create_many / update_many 일괄 저장 (1만, 10만 건)")
+def bench_bulk(scale: float):
+    surnames = '김이박최정강조윤장임'
+    for size in (10_000, 100_000):
+        n = count(size, scale)
+        students = [Student(f"{surnames[i % 10]}민{i}", student_grade=i % 6 + 1,
+                            student_class=i % 4 + 1) for i in range(n)]
+        # 한 건씩 저장한 행과 일괄 저장한 행이 섞이지 않도록 측정마다 새 데이터베이스
+        with temp_database():
+            report(f"학생 {n}건 create 반복",
+                   ms(per_call(lambda: [StudentCRUD.create(s) for s in students], 1)))
+        with temp_database():
+            student_ids = []
+            report(f"학생 {n}건 create_many",
+                   ms(per_call(lambda: student_ids.extend(StudentCRUD.create_many(students)), 1)))
+            consultings = [Consulting(f"상담 {i}", student_ids[i % len(student_ids)])
+                           for i in range(n)]
+            report(f"상담 {n}건 create 반복",
+                   ms(per_call(lambda: [ConsultingCRUD.create(c) for c in consultings], 1)))
+            ids = []
+            report(f"상담 {n}건 create_many",
+                   ms(per_call(lambda: ids.extend(ConsultingCRUD.create_many(consultings)), 1)))
+            report(f"상담 {n}건 update 반복", ms(per_call(lambda: [
+                ConsultingCRUD.update(consulting_id, consulting_note="메모") for consulting_id in ids
+            ], 1)))
+            report(f"상담 {n}건 update_many", ms(per_call(lambda: ConsultingCRUD.update_many(
+                {consulting_id: {'consulting_note': "일괄"} for consulting_id in ids}), 1)))
+
+
+@benchmark('export', "전체 목록(get_all) vs 커서 스트리밍 내보내기의 최대 메모리")
+def bench_export(scale: float):
+    with temp_database(), tempfile.TemporaryDirectory() as tmp:
+        student_ids = seed_students(count(1000, scale))
+        seed_consultings(student_ids, count(50000, scale), text_size=500)
+
+        def write_all(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                for c in ConsultingCRUD.get_all():
+                    f.write(json.dumps(c.to_dict(), ensure_ascii=False) + '\n')
+
+        for label, func in [
+            ("get_all 후 쓰기", lambda: write_all(os.path.join(tmp, 'all.jsonl'))),
+            ("export_consultings(csv)",
+             lambda: export_consultings(os.path.join(tmp, 'out.csv'), 'csv')),
+            ("export_consultings(jsonl)",
+             lambda: export_consultings(os.path.join(tmp, 'out.jsonl'), 'jsonl')),
+        ]:
+            report(label, with_peak_memory(func, 1))
+
+
+@benchmark('fts', "내용 LIKE '%검색어%' vs FTS5 전문 검색")
+def bench_fts(scale: float):
+    with temp_database() as conn:
+        student_ids = seed_students(count(1000, scale))
+        seed_consultings(student_ids, count(50000, scale), text_size=300)
+        # 일부 기록에만 있는 단어를 찾는다 (흔한 단어는 LIKE 도 LIMIT 에서 바로 끝남)
+        ConsultingCRUD.create_many(Consulting("전학 상담", student_ids[i % len(student_ids)],
+                                              consulting_content="전학 예정")
+                                   for i in range(count(50, scale)))
+        repeat = count(20, min(scale, 1))
+
+        def like():
+            conn.execute(
+                "SELECT consulting_id FROM consultings WHERE consulting_title LIKE ? "
+                "OR consulting_content LIKE ? OR consulting_opinion LIKE ? "
+                "OR consulting_note LIKE ? LIMIT 200", ['%전학%'] * 4
+            ).fetchall()
+
+        report("LIKE 검색", ms(per_call(like, repeat)))
+        report("ConsultingCRUD.fulltext_search",
+               ms(per_call(lambda: ConsultingCRUD.fulltext_search("전학"), repeat)))
+
+
+
+@benchmark('names', "학생 이름 검색: 부분 일치(스캔) vs 앞부분 / 초성 (색인)")
+def bench_names(scale: float):
+    with temp_database():
+        n = count(50000, scale)
+        surnames, first, last = '김이박최정강조윤장임', '민지서현준도하', '수성아우호영진'
+        StudentCRUD.create_many(
+            Student(surnames[i % 10] + first[i // 10 % 7] + last[i // 70 % 7]) for i in range(n)
+        )
+        repeat = count(200, min(scale, 1))
+
+        for label, name, match in [("'박지성' 부분 일치", "박지성", 'contains'),
+                                   ("'박지성' 앞부분", "박지성", 'prefix'),
+                                   ("'ㄱㅁㅅ' 초성", "ㄱㅁㅅ", 'choseong')]:
+            def run():
+                search_cache_clear()
+                return StudentCRUD.search(name=name, match=match)
+            report(f"{label} ({len(run())}명)", ms(per_call(run, repeat)))
+
+
+@benchmark('pages', "상담 목록 페이지: 키셋 커서 (첫 / 마지막 페이지) vs OFFSET")
+def bench_pages(scale: float):
+    with temp_database() as conn:
+        student_ids = seed_students(count(3000, scale))
+        n = len(seed_consultings(student_ids, count(100000, scale)))
+        page_size = 50
+        repeat = count(100, min(scale, 1))
+
+        # 마지막 페이지 커서는 처음부터 넘겨 가며 찾는다
+        cursor, last_cursor = None, None
+        while True:
+            page = ConsultingCRUD.get_page(page_size=page_size, cursor=cursor)
+            if page.next_cursor is None:
+                break
+            last_cursor = cursor = page.next_cursor
+
+        offset_sql = (f"SELECT {CONSULTING_SELECT['summary']} FROM consultings c "
+                      f"JOIN students s ON c.student_id = s.student_id "
+                      f"ORDER BY {JOINED_CONSULTING_ORDER} LIMIT ? OFFSET ?")
+        report(f"{n}건 중 첫 페이지",
+               ms(per_call(lambda: ConsultingCRUD.get_page(page_size=page_size), repeat)))
+        report(f"{n}건 중 마지막 페이지", ms(per_call(
+            lambda: ConsultingCRUD.get_page(page_size=page_size, cursor=last_cursor), repeat)))
+        report(f"{n}건 중 마지막 페이지 (OFFSET)", ms(per_call(
+            lambda: conn.execute(offset_sql, (page_size, max(n - page_size, 0))).fetchall(),
+            repeat)))
+
+@benchmark('joined', "상담 목록 + 행마다 학생 조회 vs JOIN 한 번")
+def bench_joined(scale: float):
+    with temp_database() as conn:
+        student_ids = seed_students(count(3000, scale))
+        seed_consultings(student_ids, count(20000, scale))
+
+        def per_row_query():
+            search_cache_clear()
+            return [(c, conn.execute("SELECT * FROM students WHERE student_id = ?",
+                                     (c.student_id,)).fetchone())
+                    for c in ConsultingCRUD.search()]
+
+        def per_row():
+            StudentCRUD.cache_clear()
+            search_cache_clear()
+            return [(c, StudentCRUD.get(c.student_id)) for c in ConsultingCRUD.search()]
+
+        def joined():
+            search_cache_clear()
+            return ConsultingCRUD.search_with_student()
+
+        report("search + 행마다 학생 쿼리", ms(per_call(per_row_query, 3)))
+        report("search + 행마다 StudentCRUD.get (학생 캐시)", ms(per_call(per_row, 3)))
+        report("search_with_student", ms(per_call(joined, 3)))
+
+
+@benchmark('summaries', "목록 화면: 본문 포함 전체 컬럼 vs 요약 컬럼만 조회")
+def bench_summaries(scale: float):
+    with temp_database():
+        student_ids = seed_students(count(1000, scale))
+        seed_consultings(student_ids, count(20000, scale), text_size=2000)
+
+        for label, func in [("search_with_student", ConsultingCRUD.search_with_student),
+                            ("search_summaries", ConsultingCRUD.search_summaries)]:
+            def run():
+                search_cache_clear()
+                return func()
+            report(label, with_peak_memory(run, 3))
+
+
+@benchmark('records', "모델 생성/변환: Model(**dict(row)) vs from_row, asdict vs to_dict")
+def bench_records(scale: float):
+    with temp_database() as conn:
+        student_ids = seed_students(count(100, scale))
+        seed_consultings(student_ids, count(20000, scale), text_size=100)
+        rows = conn.execute(f"SELECT {', '.join(Consulting.COLUMNS)} FROM consultings").fetchall()
+        records = [Consulting.from_row(row) for row in rows]
+
+        report(f"{len(rows)}행 Consulting(**dict(row))",
+               ms(per_call(lambda: [Consulting(**dict(row)) for row in rows], 3)))
+        report(f"{len(rows)}행 Consulting.from_row",
+               ms(per_call(lambda: [Consulting.from_row(row) for row in rows], 3)))
+        report(f"{len(rows)}건 dataclasses.asdict",
+               ms(per_call(lambda: [asdict(c) for c in records], 3)))
+        report(f"{len(rows)}건 to_dict", ms(per_call(lambda: [c.to_dict() for c in records], 3)))
+        report(f"{len(rows)}건 메모리", with_peak_memory(
+            lambda: [Consulting.from_row(row) for row in rows], 1))
+
+
+@benchmark('rollover', "학년도 진급: 학생마다 update vs SQL 몇 개로 일괄 처리")
+def bench_rollover(scale: float):
+    n = count(3000, scale)
+    year = rollover_year()
+
+    def per_student():
+        # 한 트랜잭션 안에서 학생마다 조회 + 수정 (이력 기록 포함)
+        with session():
+            for student in StudentCRUD.search():
+                if student.student_grade == 6:
+                    StudentCRUD.update(student.student_id, student_graduated=year - 1,
+                                       student_grade=None, student_class=None)
+                elif student.student_grade:
+                    StudentCRUD.update(student.student_id, student_grade=student.student_grade + 1)
+
+    for label, func in [(f"학생 {n}명 update 반복", per_student),
+                        (f"학생 {n}명 StudentCRUD.rollover",
+                         lambda: StudentCRUD.rollover(year))]:
+        with temp_database():
+            seed_students(n)
+            report(label, ms(per_call(func, 1)))
+
+
+
+@benchmark('dates', "한 달 기간 검색: 날짜 문자열 비교 vs consulting_day 색인 (날짜 형식 3가지)")
+def bench_dates(scale: float):
+    with temp_database() as conn:
+        student_ids = seed_students(count(3000, scale))
+        formats = ("2024-{m:02d}-{d:02d} 10:00:00", "2024/{m:02d}/{d:02d}", "2024.{m:02d}.{d:02d}")
+        ConsultingCRUD.create_many(
+            Consulting(f"상담 {i}", student_ids[i % len(student_ids)],
+                       consulting_date=formats[i % 3].format(m=i // 3 % 12 + 1,
+                                                         d=i // 36 % 28 + 1))
+            for i in range(count(200000, scale))
+        )
+        # 변경 전처럼 consulting_date 문자열 색인으로 범위 검색
+        conn.execute("CREATE INDEX idx_bench_consulting_date ON consultings(consulting_date)")
+        conn.commit()
+        string_sql = (f"SELECT {CONSULTING_SELECT['summary']} FROM consultings c "
+                      f"JOIN students s ON c.student_id = s.student_id "
+                      f"WHERE c.consulting_date BETWEEN ? AND ? ORDER BY c.consulting_date DESC")
+        repeat = count(20, min(scale, 1))
+
+        def by_string():
+            return conn.execute(string_sql, ('2024-03-01 00:00:00', '2024-03-31 23:59:59')).fetchall()
+
+        def by_day():
+            search_cache_clear()
+            return ConsultingCRUD.search_summaries(start_date='2024-03-01', end_date='2024-03-31')
+
+        report(f"문자열 비교 ({len(by_string())}건, '/' '.' 형식 누락)", ms(per_call(by_string, repeat)))
+        report(f"consulting_day ({len(by_day())}건)", ms(per_call(by_day, repeat)))
+
+
+
+@benchmark('statistics', "상담 통계: 요약 테이블 vs 전체 행을 읽어 Python 집계, 트리거의 쓰기 비용")
+def bench_statistics(scale: float):
+    def aggregate_in_python():
+        search_cache_clear()
+        rows = ConsultingCRUD.get_all_with_student()
+        return [Counter(key(c) for c in rows) for key in (
+            lambda c: c.consulting_type,
+            lambda c: c.consulting_object,
+            lambda c: (day_key(c.consulting_date) or 0) // 100,
+            lambda c: c.student_grade,
+            lambda c: (c.student_grade, c.student_class),
+        )]
+
+    n = count(100000, scale)
+    for triggers in (False, True):
+        label = "트리거 있음" if triggers else "트리거 없음"
+        with temp_database() as conn:
+            if not triggers:
+                # 요약 테이블 도입 전과 같은 쓰기 비용 (전문 검색 트리거는 그대로)
+                for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' "
+                                            "AND name LIKE 'consulting_stats%'").fetchall():
+                    conn.execute(f"DROP TRIGGER {name}")
+                conn.commit()
+            student_ids = seed_students(count(3000, scale))
+            report(f"{label}: 상담 {n}건 create_many",
+                   ms(per_call(lambda: seed_consultings(student_ids, n), 1)))
+            report(f"{label}: StudentCRUD.rollover",
+                   ms(per_call(lambda: StudentCRUD.rollover(rollover_year()), 1)))
+            if triggers:
+                report("statistics.report", ms(per_call(statistics.report, count(20, min(scale, 1)))))
+                report("get_all_with_student + Python 집계", ms(per_call(aggregate_in_python, 1)))
+
+
+
+@benchmark('student_cache', "StudentCRUD.get: 캐시 적중 vs DB 조회, get_many vs get 반복")
+def bench_student_cache(scale: float):
+    with temp_database():
+        student_ids = seed_students(count(5000, scale))
+        repeat = count(10000, min(scale, 1))
+        student_id = student_ids[0]
+
+        def uncached():
+            StudentCRUD.cache_clear()
+            return StudentCRUD.get(student_id)
+
+        StudentCRUD.get(student_id)
+        report("캐시 적중", us(per_call(lambda: StudentCRUD.get(student_id), repeat)))
+        report("캐시 없음", us(per_call(uncached, repeat)))
+
+        cold = student_ids[:500]
+
+        def get_each():
+            StudentCRUD.cache_clear()
+            return [StudentCRUD.get(i) for i in cold]
+
+        def get_many():
+            StudentCRUD.cache_clear()
+            return StudentCRUD.get_many(cold)
+
+        rounds = count(20, min(scale, 1))
+        report(f"학생 {len(cold)}명 get 반복", ms(per_call(get_each, rounds)))
+        report(f"학생 {len(cold)}명 get_many", ms(per_call(get_many, rounds)))
+
+
+
+@benchmark('search_cache', "같은 조건 상담 검색 반복: 검색 결과 캐시 적중 vs 매번 조회")
+def bench_search_cache(scale: float):
+    with temp_database():
+        student_ids = seed_students(count(3000, scale))
+        seed_consultings(student_ids, count(100000, scale))
+        repeat = count(50, min(scale, 1))
+        filters = dict(student_name="김", consulting_type='대면',
+                       start_date='2024-01-01', end_date='2024-06-30')
+
+        def uncached():
+            search_cache_clear()
+            return ConsultingCRUD.search_summaries(**filters)
+
+        rows = len(uncached())
+        report(f"이름 + 유형 + 기간 요약 검색 ({rows}건), 매번 조회", ms(per_call(uncached, repeat)))
+        report("같은 검색, 캐시 적중",
+               us(per_call(lambda: ConsultingCRUD.search_summaries(**filters), repeat)))
+
+
+
+@benchmark('detail_cache', "상담 상세 열기 (내용 4 KB): 상세 캐시 적중 vs 매번 조회, 이웃 행 미리 읽기")
+def bench_detail_cache(scale: float):
+    with temp_database():
+        student_ids = seed_students(count(1000, scale))
+        ids = seed_consultings(student_ids, count(10000, scale), text_size=4000)
+        target = ids[len(ids) // 2]
+        repeat = count(10000, min(scale, 1))
+
+        def uncached():
+            ConsultingCRUD.cache_clear()
+            return ConsultingCRUD.get_with_student(target)
+
+        report("상세 조회, 매번 조회", us(per_call(uncached, repeat)))
+        report("상세 조회, 캐시 적중",
+               us(per_call(lambda: ConsultingCRUD.get_with_student(target), repeat)))
+
+        # 목록에서 위아래로 옮겨 다닐 때: 이웃 20건을 한 번에 읽어 두면 이후 열기는 캐시 적중
+        neighbours = ids[:20]
+        rounds = count(200, min(scale, 1))
+
+        def one_by_one():
+            ConsultingCRUD.cache_clear()
+            for consulting_id in neighbours:
+                ConsultingCRUD.get_with_student(consulting_id)
+
+        def prefetched():
+            ConsultingCRUD.cache_clear()
+            ConsultingCRUD.get_many_with_student(neighbours)
+            for consulting_id in neighbours:
+                ConsultingCRUD.get_with_student(consulting_id)
+
+        report(f"이웃 {len(neighbours)}건 차례로 열기", us(per_call(one_by_one, rounds)))
+        report(f"이웃 {len(neighbours)}건 미리 읽은 뒤 열기", us(per_call(prefetched, rounds)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CareNote 성능 측정")
+    parser.add_argument('names', nargs='*', help="측정할 항목 (기본: 전체)")
+    parser.add_argument('--scale', type=float, default=1.0, help="데이터 양 배율 (기본 1.0)")
+    parser.add_argument('--list', action='store_true', help="측정 항목 목록")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (description, _) in BENCHMARKS.items():
+            print(f"{name:<12} {description}")
+        return
+
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"알 수 없는 항목: {', '.join(sorted(unknown))}")
+
+    for name in args.names or BENCHMARKS:
+        description, func = BENCHMARKS[name]
+        print(f"\n[{name}] {description}")
+        func(args.scale)
+
+
+if __name__ == "__main__":
+    main()
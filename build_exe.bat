@@ -8,8 +8,15 @@ pyinstaller --onedir ^
     --hidden-import PyQt6.QtGui ^
     --hidden-import PyQt6.QtPrintSupport ^
     --hidden-import carenote.database ^
+    --hidden-import carenote.migrations ^
     --hidden-import carenote.models ^
     --hidden-import carenote.crud ^
+    --hidden-import carenote.importer ^
+    --hidden-import carenote.export ^
+    --hidden-import carenote.hangul ^
+    --hidden-import carenote.statistics ^
+    --hidden-import carenote.cache ^
+    --hidden-import carenote.writebehind ^
     --hidden-import carenote.gui ^
     --hidden-import carenote.config ^
     --collect-all qt_material ^
@@ -0,0 +1,89 @@
+"""프로세스 내 조회 캐시 (LRU)"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+# functools.lru_cache 의 cache_info() 와 같은 형태
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_MISSING = object()
+
+
+class LRUCache:
+    """최대 maxsize 개를 보관하고, 넘치면 가장 오래 쓰지 않은 항목부터 버리는 캐시
+
+    ttl(초) 을 주면 저장 후 ttl 이 지난 항목은 없는 것으로 본다.
+
+    validate(token) 으로 데이터 변경 여부를 알려주면 token 이 바뀌었을 때 전체를 비운다.
+    여러 스레드에서 함께 사용할 수 있다. 저장된 객체를 그대로 반환하므로 호출한 쪽에서 수정하지 않는다.
+
+    조회하는 동안 다른 스레드가 무효화하면 이미 읽은 값은 오래된 값일 수 있으므로,
+    조회 전에 stamp() 를 받아 put(..., stamp=) 로 넘기면 그 사이 무효화가 있었을 때 저장하지 않는다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._token = _MISSING
+        self._invalidations = 0
+        self.hits = 0
+        self.misses = 0
+
+    def validate(self, token):
+        """token 이 지난 호출과 다르면 캐시를 비운다"""
+        if token != self._token:
+            with self._lock:
+                self._data.clear()
+                self._invalidations += 1
+                self._token = token
+
+    def stamp(self) -> int:
+        """현재 무효화 횟수 (put 의 stamp 인자용)"""
+        return self._invalidations
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and self.ttl and entry[1] < time.monotonic():
+                del self._data[key]
+                entry = _MISSING
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, stamp: int = None):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if stamp is not None and stamp != self._invalidations:
+                return
+            expires = time.monotonic() + self.ttl if self.ttl else None
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, *keys):
+        """해당 키 항목 제거 (없으면 무시)"""
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+            self._invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._invalidations += 1
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = 0
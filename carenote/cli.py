@@ -1,6 +1,14 @@
 """CLI 인터페이스"""
-from carenote.models import Student, Consulting
+import time
+
+from carenote.models import Student, Consulting, rollover_year
 from carenote.crud import StudentCRUD, ConsultingCRUD
+from carenote.importer import import_students
+from carenote.export import export_students, export_consultings
+from carenote import statistics
+
+# 목록 화면 한 페이지에 표시할 건수
+PAGE_SIZE = 20
 
 
 def main_menu():
@@ -9,6 +17,8 @@ def main_menu():
         print("\n=== CareNote 개인상담기록 시스템 ===")
         print("1. 학생 관리")
         print("2. 상담 기록 관리")
+        print("3. 데이터 내보내기")
+        print("4. 상담 통계")
         print("0. 종료")
         
         choice = input("\n선택: ").strip()
@@ -17,6 +27,10 @@ def main_menu():
             student_menu()
         elif choice == '2':
             consulting_menu()
+        elif choice == '3':
+            export_data()
+        elif choice == '4':
+            show_statistics()
         elif choice == '0':
             print("프로그램을 종료합니다.")
             break
@@ -24,6 +38,51 @@ def main_menu():
             print("잘못된 입력입니다.")
 
 
+def export_data():
+    """학생/상담 기록 내보내기"""
+    print("\n=== 데이터 내보내기 ===")
+    target = input("대상 (1: 학생, 2: 상담 기록): ").strip()
+    if target not in ('1', '2'):
+        print("잘못된 입력입니다.")
+        return
+    
+    fmt = input("형식 (csv/jsonl) [csv]: ").strip().lower() or 'csv'
+    default_path = f"{'students' if target == '1' else 'consultings'}.{fmt}"
+    path = input(f"저장할 파일 경로 [{default_path}]: ").strip().strip('"') or default_path
+    
+    try:
+        if target == '1':
+            count = export_students(path, fmt)
+        else:
+            count = export_consultings(path, fmt)
+    except (OSError, ValueError) as e:
+        print(f"내보내기 실패: {e}")
+        return
+    
+    print(f"✓ {count}건 내보내기 완료: {path}")
+
+
+def show_statistics():
+    """상담 통계 보고서"""
+    print("\n=== 상담 통계 ===")
+    start_date = input("시작일 (yyyy-MM-dd, 선택): ").strip() or None
+    end_date = input("종료일 (yyyy-MM-dd, 선택): ").strip() or None
+
+    try:
+        sections = statistics.report(start_date, end_date)
+    except ValueError as e:
+        print(e)
+        return
+
+    print(f"\n전체 상담: {statistics.total(start_date, end_date)}건 (기간은 월 단위로 집계)")
+    for title, rows in sections:
+        print(f"\n[{title}]")
+        if not rows:
+            print("  (없음)")
+        for label, count in rows:
+            print(f"  {label:<12} {count:>6}건")
+
+
 def student_menu():
     """학생 관리 메뉴"""
     while True:
@@ -33,6 +92,8 @@ def student_menu():
         print("3. 학생 검색")
         print("4. 학생 정보 수정")
         print("5. 학생 삭제")
+        print("6. 명단 가져오기 (CSV)")
+        print("7. 학년도 진급 처리")
         print("0. 뒤로가기")
         
         choice = input("\n선택: ").strip()
@@ -47,6 +108,10 @@ def student_menu():
             update_student()
         elif choice == '5':
             delete_student()
+        elif choice == '6':
+            import_roster()
+        elif choice == '7':
+            rollover_school_year()
         elif choice == '0':
             break
         else:
@@ -175,6 +240,61 @@ def delete_student():
         print("취소되었습니다.")
 
 
+def import_roster():
+    """CSV 명단 가져오기"""
+    print("\n=== 명단 가져오기 ===")
+    print("CSV 헤더: 이름(필수), 전화번호, 학년, 반, 성별")
+    path = input("CSV 파일 경로: ").strip().strip('"')
+    
+    try:
+        report = import_students(
+            path,
+            progress=lambda count: print(f"\r{count}행 처리 중...", end="")
+        )
+    except (OSError, ValueError) as e:
+        print(f"가져오기 실패: {e}")
+        return
+    
+    print(f"\n✓ {report.summary()}")
+    for line_num, reason in report.errors:
+        print(f"  {line_num}행: {reason}")
+
+
+def rollover_school_year():
+    """새 학년도 진급 처리 (1~5학년 진급, 6학년 졸업)"""
+    print("\n=== 학년도 진급 처리 ===")
+    default = rollover_year()
+    while True:
+        year_input = input(f"새 학년도 [{default}]: ").strip()
+        if not year_input:
+            year = default
+            break
+        try:
+            year = int(year_input)
+            break
+        except ValueError:
+            print("학년도는 숫자로 입력하세요. (예: 2027)")
+
+    try:
+        preview = StudentCRUD.rollover(year, dry_run=True)
+    except ValueError as e:
+        print(e)
+        return
+
+    print(f"{year}학년도: 진급 {preview.promoted}명, 졸업 {preview.graduated}명")
+    if year < rollover_year():
+        print(f"주의: {year}학년도는 이미 진행 중입니다. 진급 처리하면 학생들이 한 학년 더 올라갑니다.")
+    confirm = input("진급 처리하시겠습니까? (y/n): ").strip().lower()
+    if confirm != 'y':
+        print("취소되었습니다.")
+        return
+
+    start = time.perf_counter()
+    result = StudentCRUD.rollover(year)
+    elapsed = time.perf_counter() - start
+    print(f"✓ 진급 {result.promoted}명, 졸업 {result.graduated}명 처리 완료 ({elapsed:.2f}초)")
+
+
 def consulting_menu():
     """상담 기록 관리 메뉴"""
     while True:
@@ -268,22 +388,44 @@ def view_consulting_by_student():
 
 
 def list_all_consultings():
-    """전체 상담 기록 조회"""
-    consultings = ConsultingCRUD.get_all()
+    """전체 상담 기록 조회 (페이지 단위)"""
+    page = ConsultingCRUD.get_page(PAGE_SIZE)
     
-    if not consultings:
+    if not page.items:
         print("\n등록된 상담 기록이 없습니다.")
         return
     
-    print(f"\n=== 전체 상담 기록 ({len(consultings)}건) ===")
-    
-    for c in consultings:
-        student = StudentCRUD.get(c.student_id)
-        print(f"\n[ID: {c.consulting_id}] {c.consulting_title}")
-        print(f"학생: {student.student_name if student else '알 수 없음'}")
-        print(f"일시: {c.consulting_date}")
-        print(f"유형: {c.consulting_type or '-'}")
-        print("-" * 60)
+    page_num = 1
+    while True:
+        print(f"\n=== 전체 상담 기록 ({page_num}페이지) ===")
+        
+        for c in page.items:
+            print(f"\n[ID: {c.consulting_id}] {c.consulting_title}")
+            print(f"학생: {c.student_name or '알 수 없음'}")
+            print(f"일시: {c.consulting_date}")
+            print(f"유형: {c.consulting_type or '-'}")
+            print("-" * 60)
+        
+        options = []
+        if page.next_cursor:
+            options.append("n: 다음")
+        if page.prev_cursor:
+            options.append("p: 이전")
+        if not options:
+            return
+        options.append("q: 그만 보기")
+        
+        choice = input(f"\n{' / '.join(options)}: ").strip().lower()
+        if choice == 'n' and page.next_cursor:
+            page = ConsultingCRUD.get_page(PAGE_SIZE, page.next_cursor)
+            page_num += 1
+        elif choice == 'p' and page.prev_cursor:
+            page = ConsultingCRUD.get_page(PAGE_SIZE, page.prev_cursor)
+            page_num -= 1
+        elif choice == 'q':
+            return
+        else:
+            print("잘못된 입력입니다.")
 
 
 def search_consultings():
@@ -293,7 +435,7 @@ def search_consultings():
     student_name = input("학생 이름 (선택): ").strip() or None
     consulting_type = input("상담 유형 (선택): ").strip() or None
     
-    consultings = ConsultingCRUD.search(
+    consultings = ConsultingCRUD.search_summaries(
         title=title, 
         student_name=student_name, 
         consulting_type=consulting_type
@@ -306,9 +448,8 @@ def search_consultings():
     print(f"\n검색 결과: {len(consultings)}건")
     
     for c in consultings:
-        student = StudentCRUD.get(c.student_id)
         print(f"\n[ID: {c.consulting_id}] {c.consulting_title}")
-        print(f"학생: {student.student_name if student else '알 수 없음'}")
+        print(f"학생: {c.student_name or '알 수 없음'}")
         print(f"일시: {c.consulting_date}")
         print("-" * 60)
 
@@ -15,3 +15,68 @@ DB_PATH = os.path.join(DB_DIR, 'carenote.db')
 
 # 데이터베이스 디렉토리가 없으면 생성
 os.makedirs(DB_DIR, exist_ok=True)
+
+# SQLite 성능 프로필
+# - safe: 기본 롤백 저널 + FULL 동기화 (기본값, 공유 네트워크 드라이브에서도 안전)
+# - balanced: WAL + NORMAL 동기화 (쓰기 중에도 읽기가 막히지 않음)
+# - fast: 대용량 캐시/mmap, 동기화 OFF (전원 차단 시 마지막 트랜잭션 유실 가능)
+# WAL 은 공유 메모리가 필요해 네트워크 드라이브에서는 깨지고, journal_mode 는 DB 파일에 저장되어
+# 같은 DB 를 쓰는 모든 PC 에 적용된다. DB 가 로컬 디스크에 있고 모든 PC 가 같은 설정일 때만
+# balanced/fast 를 선택한다.
+DB_PROFILES = {
+    'safe': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'cache_size': -2000,        # KiB 단위 (음수), 약 2MB
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+        'busy_timeout': 5000,       # ms
+    },
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000,       # 약 16MB
+        'mmap_size': 64 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+    },
+    'fast': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -64000,       # 약 64MB
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 10000,
+    },
+}
+
+# 사용할 프로필 (환경 변수 CARENOTE_DB_PROFILE 로 변경 가능)
+DB_PROFILE = os.environ.get('CARENOTE_DB_PROFILE', 'safe')
+
+# StudentCRUD.get 캐시에 보관할 최대 학생 수 (0 이면 캐시 사용 안 함)
+STUDENT_CACHE_SIZE = 1024
+
+# 다른 프로세스의 변경을 확인하는 최소 간격 (초) - 캐시된 조회 결과는 최대 이만큼 늦게 반영된다
+EXTERNAL_CHECK_INTERVAL = 0.5
+
+# 학생/상담 검색 결과 캐시 (같은 조건으로 다시 검색할 때 쿼리 생략)
+SEARCH_CACHE_SIZE = 64      # 보관할 검색 조건 수 (0 이면 캐시 사용 안 함)
+SEARCH_CACHE_TTL = 300      # 초, 데이터가 바뀌지 않아도 이 시간이 지나면 다시 조회
+
+# 상담 상세(본문 포함) 캐시 - 목록에서 행을 옮기거나 인쇄할 때 다시 조회하지 않도록
+CONSULTING_DETAIL_CACHE_SIZE = 256  # 보관할 상담 기록 수 (0 이면 캐시 사용 안 함)
+
+# 저장 지연 쓰기 (write-behind) - 느린 공유 드라이브에서 저장할 때 화면이 멈추지 않도록
+# 저장 요청을 로컬 저널에 먼저 기록하고 백그라운드에서 모아 DB 에 반영한다
+# (환경 변수 CARENOTE_WRITE_BEHIND=1 로 켬, 꺼져 있어도 저널에 남은 요청은 시작할 때 반영)
+WRITE_BEHIND = os.environ.get('CARENOTE_WRITE_BEHIND', '0') == '1'
+
+# 저장 요청 저널 (DB 가 공유 드라이브에 있어도 이 파일은 PC 로컬 디스크에 둔다)
+# 같은 PC 에서 여러 개를 실행하면 두 번째부터는 write_journal.1.jsonl 처럼 번호 붙은 저널을 쓴다
+WRITE_JOURNAL_PATH = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), 'CareNote', 'write_journal.jsonl'
+)
+WRITE_BATCH_SIZE = 100        # 한 트랜잭션에 반영할 최대 저장 요청 수
+WRITE_BATCH_DELAY = 0.2       # 초, 연달아 들어온 저장을 한 트랜잭션으로 모으려고 기다리는 시간
+WRITE_RETRY_MAX_DELAY = 10    # 초, DB 잠김(SQLITE_BUSY) 등으로 실패했을 때 재시도 간격 상한
+WRITE_CLOSE_TIMEOUT = 10      # 초, 종료할 때 남은 저장을 반영하려고 기다리는 최대 시간
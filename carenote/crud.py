@@ -1,8 +1,355 @@
 """CRUD 작업"""
+import base64
+import binascii
 import json
-from typing import List, Optional
-from carenote.database import get_connection
-from carenote.models import Student, Consulting
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from carenote.cache import CacheInfo, LRUCache
+from carenote.config import (
+    CONSULTING_DETAIL_CACHE_SIZE, SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL, STUDENT_CACHE_SIZE
+)
+from carenote.database import after_commit, data_token, external_epoch, get_connection, transaction
+from carenote.hangul import PREFIX_UPPER, choseong, has_choseong, is_syllable, normalize, search_keys
+from carenote.models import (
+    Student, Enrollment, Consulting, ConsultingWithStudent, ConsultingSummary,
+    ConsultingSearchHit, Page, RolloverResult, STUDENT_CONSTRAINTS, CONSULTING_CONSTRAINTS,
+    day_key, rollover_year, school_year, validate_fields
+)
+
+# iter_* 메서드가 한 번에 커서에서 가져오는 행 수
+ITER_CHUNK_SIZE = 500
+
+# students 조회 컬럼 (모델 필드 순서 = from_row 순서, 검색 키 컬럼은 제외)
+STUDENT_COLUMNS = ', '.join(Student.COLUMNS)
+
+# 학생 검색/목록 정렬 순서 (이름순, idx_students_name 순서와 일치)
+STUDENT_ORDER = "student_name, student_id"
+
+# student_enrollments 조회 컬럼
+ENROLLMENT_COLUMNS = ', '.join(Enrollment.COLUMNS)
+
+# consultings 조회 컬럼 (모델 필드 순서)
+CONSULTING_COLUMNS = ', '.join(Consulting.COLUMNS)
+
+# StudentCRUD.search 이름 검색 방식
+# contains: 이름 일부 (LIKE, 전체 스캔) / prefix: 이름 앞부분 (인덱스)
+# choseong: 초성 앞부분 (인덱스) / auto: 초성이 섞여 있으면 choseong, 아니면 prefix
+NAME_MATCH_MODES = ('contains', 'prefix', 'choseong', 'auto')
+
+
+# consultings 테이블 컬럼 (모델 필드 + 생성 컬럼)
+_CONSULTING_TABLE_COLUMNS = (*Consulting.COLUMNS, 'consulting_day')
+
+# 상담 기록 정렬 순서 (최신순, idx_consultings_day / idx_consultings_student_day 순서와 일치)
+CONSULTING_ORDER = "consulting_day DESC, consulting_id DESC"
+JOINED_CONSULTING_ORDER = "c.consulting_day DESC, c.consulting_id DESC"
+
+
+def _joined_columns(model) -> str:
+    """consultings c JOIN students s 조회용 컬럼 목록 (모델 필드 순서)"""
+    return ', '.join(
+        f"c.{name}" if name in _CONSULTING_TABLE_COLUMNS else f"s.{name}"
+        for name in model.COLUMNS
+    )
+
+
+# 상담 기록 조회 컬럼 (ConsultingCRUD._search_query 의 columns)
+CONSULTING_SELECT = {
+    'full': _joined_columns(Consulting),
+    'with_student': _joined_columns(ConsultingWithStudent),
+    # 목록 화면용: 긴 본문(진술 내용/소견/특이사항)은 가져오지 않는다
+    'summary': _joined_columns(ConsultingSummary),
+}
+
+# get_page 기본 페이지 크기
+PAGE_SIZE = 50
+
+# ConsultingCRUD.get_page 정렬 기준 → 정렬 식 (뒤에 c.consulting_id 가 붙는다)
+# 날짜/학생순은 idx_consultings_day / idx_students_name, 유형/주제순은 v10 인덱스를 따라 읽는다
+CONSULTING_SORTS = {
+    'date': ["c.consulting_day"],
+    'student': ["s.student_name", "s.student_id", "c.consulting_day"],
+    'type': ["COALESCE(c.consulting_type, '')", "c.consulting_day"],
+    'title': ["c.consulting_title", "c.consulting_day"],
+}
+
+# 전문 검색 bm25 가중치 (주제, 진술 내용, 소견, 특이사항 순)
+FTS_WEIGHTS = (5.0, 1.0, 1.0, 1.0)
+
+# 전문 검색 기본 최대 결과 수 (관련도순 상위)
+FULLTEXT_LIMIT = 200
+
+# 일괄 작업에서 받는 업데이트 목록: {id: {컬럼: 값}} 또는 [(id, {컬럼: 값}), ...]
+Updates = Union[Dict[int, dict], Iterable[Tuple[int, dict]]]
+
+
+# StudentCRUD.get / get_many 캐시 (StudentCRUD 의 쓰기 메서드가 commit 후 해당 학생을 무효화하고,
+# 다른 연결의 변경은 PRAGMA data_version 으로 감지해 전체를 비운다)
+_student_cache = LRUCache(STUDENT_CACHE_SIZE)
+
+
+def _student_cache_for(conn) -> Optional[LRUCache]:
+    """외부 변경을 확인한 학생 캐시 반환
+
+    트랜잭션 중에는 commit 전 값(rollback 될 수 있음)을 캐시하지 않도록 None 을 반환한다.
+    """
+    if conn.in_transaction or _student_cache.maxsize <= 0:
+        return None
+    _student_cache.validate(external_epoch())
+    return _student_cache
+
+
+# ConsultingCRUD.get_with_student / get_many_with_student 캐시 (상세 화면, 인쇄)
+# 학생 이름/학년/반도 함께 담기므로 이 프로세스의 쓰기나 다른 연결의 commit 이 있으면 전체를 비운다
+_detail_cache = LRUCache(CONSULTING_DETAIL_CACHE_SIZE)
+
+
+def _detail_cache_for(conn) -> Optional[LRUCache]:
+    """변경 여부를 확인한 상담 상세 캐시 반환 (트랜잭션 중이면 None)"""
+    if conn.in_transaction or _detail_cache.maxsize <= 0:
+        return None
+    _detail_cache.validate(data_token())
+    return _detail_cache
+
+
+# StudentCRUD.search / ConsultingCRUD.search* 결과 캐시 (키: 정규화한 검색 조건)
+# 이 프로세스의 쓰기(transaction) 나 다른 연결의 commit 이 있으면 전체를 비운다
+_search_cache = LRUCache(SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
+
+def _cached_search(key: tuple, run: Callable[[], list]) -> list:
+    """run() 결과를 key 로 캐시해서 반환 (결과 리스트는 복사본, 항목 객체는 수정하지 않는다)"""
+    conn = get_connection()
+    if conn.in_transaction or _search_cache.maxsize <= 0:
+        return run()
+
+    _search_cache.validate(data_token())
+    result = _search_cache.get(key)
+    if result is None:
+        stamp = _search_cache.stamp()
+        result = run()
+        _search_cache.put(key, result, stamp)
+    return list(result)
+
+
+def search_cache_info() -> CacheInfo:
+    """검색 결과 캐시 적중/실패 횟수와 크기"""
+    return _search_cache.info()
+
+
+def search_cache_clear():
+    """검색 결과 캐시 비우기 (적중/실패 횟수도 초기화)"""
+    _search_cache.clear()
+    _search_cache.reset_stats()
+
+
+@contextmanager
+def session():
+    """여러 CRUD 호출을 하나의 트랜잭션으로 묶는다
+
+    with session():
+        student_id = StudentCRUD.create(student)
+        ConsultingCRUD.create(Consulting(..., student_id=student_id))
+
+    블록 안의 CRUD 호출은 같은 연결을 쓰며, 블록이 끝날 때 한 번만 commit 된다.
+    예외가 발생하면 블록 안의 변경이 모두 rollback 된다.
+    as 로 받는 값은 트랜잭션에 사용되는 연결이다.
+    """
+    with transaction() as conn:
+        yield conn
+
+
+def _iter_rows(query: str, params=(), chunk_size: int = ITER_CHUNK_SIZE) -> Iterator:
+    """커서에서 chunk_size 행씩 가져오며 한 행씩 반환 (전체를 메모리에 올리지 않음)"""
+    cursor = get_connection().cursor()
+    cursor.execute(query, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield from rows
+    finally:
+        cursor.close()
+
+
+def _encode_cursor(direction: str, key: list) -> str:
+    """페이지 커서 생성 (방향 + 기준 행의 정렬 키)"""
+    raw = json.dumps([direction, key], ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, list]:
+    try:
+        direction, key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError(f"잘못된 페이지 커서: {cursor!r}") from None
+    if direction not in ('next', 'prev') or not isinstance(key, list):
+        raise ValueError(f"잘못된 페이지 커서: {cursor!r}")
+    return direction, key
+
+
+def _fetch_page(query: str, params: list, order: List[str], page_size: int,
+                cursor: str = None, descending: bool = False) -> Tuple[list, Optional[str], Optional[str]]:
+    """키셋(커서) 방식으로 한 페이지 조회, (행 목록, 다음 커서, 이전 커서) 반환
+
+    query 는 SELECT 로 시작하고 ORDER BY 없이 WHERE 절로 끝나야 한다. order 는 정렬 식
+    (NULL 이 나오지 않는 컬럼 또는 식) 목록으로 마지막은 고유 컬럼(ID)이어야 하며,
+    기준 행보다 뒤의 행을 인덱스로 바로 찾으므로 몇 번째 페이지든 첫 페이지와 비용이 같다.
+    """
+    direction, key = _decode_cursor(cursor) if cursor else ('next', None)
+    if key is not None and len(key) != len(order):
+        raise ValueError(f"잘못된 페이지 커서: {cursor!r}")
+    backwards = direction == 'prev'
+
+    # 이전 페이지는 정렬을 뒤집어 기준 행 앞쪽을 읽은 뒤 순서를 되돌린다
+    forward_desc = descending != backwards
+    sort = 'DESC' if forward_desc else 'ASC'
+    columns = ', '.join(order)
+
+    # 정렬 키 값을 행 앞쪽에 함께 조회해 커서로 쓴다 (식으로 정렬해도 같은 값을 비교하도록)
+    query = query.replace('SELECT', f'SELECT {columns},', 1)
+    params = list(params)
+    if key is not None:
+        query += f" AND ({columns}) {'<' if forward_desc else '>'} ({', '.join(['?'] * len(order))})"
+        params.extend(key)
+    query += " ORDER BY " + ', '.join(f"{c} {sort}" for c in order) + " LIMIT ?"
+    params.append(page_size + 1)
+
+    rows = get_connection().execute(query, params).fetchall()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+    if not rows:
+        return rows, None, None
+
+    first_key = list(rows[0][:len(order)])
+    last_key = list(rows[-1][:len(order)])
+    rows = [row[len(order):] for row in rows]
+
+    if backwards:
+        next_cursor = _encode_cursor('next', last_key)
+        prev_cursor = _encode_cursor('prev', first_key) if has_more else None
+    else:
+        next_cursor = _encode_cursor('next', last_key) if has_more else None
+        prev_cursor = _encode_cursor('prev', first_key) if key is not None else None
+    return rows, next_cursor, prev_cursor
+
+
+def _day_bound(value, label: str) -> int:
+    """검색 날짜 조건을 consulting_day 비교 값으로 변환 (시각 부분은 무시)"""
+    key = day_key(value)
+    if key is None:
+        raise ValueError(f"{label} 형식이 올바르지 않습니다: {value!r} (예: 2024-03-05)")
+    return key
+
+
+def _fts_match_query(text: str) -> str:
+    """검색어를 FTS5 MATCH 식으로 변환
+
+    각 단어를 따옴표로 감싸 특수문자를 무력화하고, 조사가 붙은 형태('학교에서')도
+    찾을 수 있도록 접두어 검색(*)으로 만든다. 모든 단어를 포함해야 일치한다.
+    """
+    return ' '.join('"' + term.replace('"', '""') + '"*' for term in text.split())
+
+
+def _validate_items(items: list, label: str):
+    """일괄 작업 전 모든 항목 검증 (하나라도 위반하면 아무것도 쓰지 않음)"""
+    for index, item in enumerate(items, start=1):
+        try:
+            item.validate()
+        except ValueError as e:
+            raise ValueError(f"{index}번째 {label}: {e}") from None
+
+
+def _insert_many(table: str, id_column: str, columns: List[str],
+                 rows: List[tuple], values_sql: str = None) -> List[int]:
+    """executemany 로 한 트랜잭션에 삽입하고 할당된 ID 목록 반환
+
+    rows 의 첫 번째 값은 id 컬럼이다. id 를 지정한 행이 없으면 AUTOINCREMENT 가
+    쓰기 잠금 안에서 연속된 ID 를 할당하므로 마지막 rowid 로부터 계산한다.
+    """
+    if not rows:
+        return []
+
+    all_columns = ', '.join([id_column] + columns)
+    values_sql = values_sql or ', '.join(['?'] * (len(columns) + 1))
+    query = f"INSERT INTO {table} ({all_columns}) VALUES ({values_sql})"
+
+    with transaction() as conn:
+        cursor = conn.cursor()
+        if any(row[0] is not None for row in rows):
+            # ID 를 직접 지정한 행이 섞여 있으면 행마다 lastrowid 를 받는다
+            ids = []
+            for row in rows:
+                cursor.execute(query, row)
+                ids.append(cursor.lastrowid)
+            return ids
+
+        cursor.executemany(query, rows)
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+    return list(range(last_id - len(rows) + 1, last_id + 1))
+
+
+def _update_many(table: str, id_column: str, updates: Updates, constraints: dict) -> int:
+    """같은 컬럼 조합끼리 묶어 executemany 로 업데이트, 변경된 행 수 반환"""
+    items = list(updates.items() if isinstance(updates, dict) else updates)
+    for index, (_, fields) in enumerate(items, start=1):
+        try:
+            validate_fields(fields, constraints)
+        except ValueError as e:
+            raise ValueError(f"{index}번째 항목: {e}") from None
+
+    groups = {}
+    for row_id, fields in items:
+        if fields:
+            keys = tuple(fields)
+            groups.setdefault(keys, []).append(
+                tuple(fields[k] for k in keys) + (row_id,)
+            )
+
+    changed = 0
+    with transaction() as conn:
+        cursor = conn.cursor()
+        for keys, rows in groups.items():
+            set_clause = ', '.join(f"{k} = ?" for k in keys)
+            cursor.executemany(
+                f"UPDATE {table} SET {set_clause} WHERE {id_column} = ?",
+                rows
+            )
+            changed += cursor.rowcount
+    return changed
+
+
+def _delete_many(table: str, id_column: str, ids: Iterable[int]) -> int:
+    """executemany 로 한 트랜잭션에 삭제, 삭제된 행 수 반환"""
+    rows = [(row_id,) for row_id in ids]
+    if not rows:
+        return 0
+    with transaction() as conn:
+        cursor = conn.cursor()
+        cursor.executemany(f"DELETE FROM {table} WHERE {id_column} = ?", rows)
+        return cursor.rowcount
+
+
+# 학생의 현재 학년/반을 해당 학년도 이력으로 기록 (같은 학년도는 덮어씀)
+# 파라미터: (학년도, WHERE 절 파라미터...)
+_RECORD_ENROLLMENTS = """
+    INSERT INTO student_enrollments (student_id, school_year, student_grade, student_class)
+    SELECT student_id, ?, student_grade, student_class FROM students WHERE {where}
+    ON CONFLICT (student_id, school_year) DO UPDATE SET
+        student_grade = excluded.student_grade,
+        student_class = excluded.student_class"""
+
+_RECORD_ENROLLMENT = _RECORD_ENROLLMENTS.format(where="student_id = ?")
+
+# 지난 학년도 이력 기록용 (이미 있는 이력은 덮어쓰지 않음)
+_RECORD_ENROLLMENTS_KEEP = """
+    INSERT INTO student_enrollments (student_id, school_year, student_grade, student_class)
+    SELECT student_id, ?, student_grade, student_class FROM students WHERE {where}
+    ON CONFLICT (student_id, school_year) DO NOTHING"""
 
 
 class StudentCRUD:
@@ -15,98 +362,335 @@ class StudentCRUD:
         cursor = conn.cursor()
 
         data = student.to_dict()
+        data.update(search_keys(student.student_name))
         columns = ', '.join(data.keys())
         placeholders = ', '.join(['?' for _ in data])
 
-        cursor.execute(
-            f"INSERT INTO students ({columns}) VALUES ({placeholders})",
-            tuple(data.values())
-        )
+        with transaction():  # 성공 시 commit, 예외 시 rollback
+            cursor.execute(
+                f"INSERT INTO students ({columns}) VALUES ({placeholders})",
+                tuple(data.values())
+            )
+            student_id = cursor.lastrowid
+            if student.student_grade is not None or student.student_class is not None:
+                cursor.execute(_RECORD_ENROLLMENT, (school_year(), student_id))
 
-        student_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
         return student_id
 
+    @staticmethod
+    def create_many(students: Iterable[Student]) -> List[int]:
+        """학생 일괄 생성 (한 트랜잭션), 생성된 ID 목록을 입력 순서대로 반환"""
+        students = list(students)
+        _validate_items(students, "학생")
+        rows = [
+            (s.student_id, s.student_name, s.student_phone, s.student_grade,
+             s.student_class, s.student_sex, s.student_graduated,
+             normalize(s.student_name), choseong(s.student_name))
+            for s in students
+        ]
+        year = school_year()
+        with transaction() as conn:
+            ids = _insert_many(
+                "students", "student_id",
+                ["student_name", "student_phone", "student_grade",
+                 "student_class", "student_sex", "student_graduated",
+                 "student_name_key", "student_choseong"],
+                rows
+            )
+            conn.executemany(
+                "INSERT INTO student_enrollments "
+                "(student_id, school_year, student_grade, student_class) VALUES (?, ?, ?, ?)",
+                [(student_id, year, s.student_grade, s.student_class)
+                 for student_id, s in zip(ids, students)
+                 if s.student_grade is not None or s.student_class is not None]
+            )
+        return ids
+
     @staticmethod
     def get(student_id: int) -> Optional[Student]:
-        """학생 조회"""
+        """학생 조회 (최근 조회한 학생은 캐시에서 반환, 반환된 객체는 수정하지 않는다)"""
         conn = get_connection()
+        cache = _student_cache_for(conn)
+        if cache:
+            student = cache.get(student_id)
+            if student is not None:
+                return student
+            stamp = cache.stamp()
+
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM students WHERE student_id = ?", (student_id,))
+        cursor.execute(
+            f"SELECT {STUDENT_COLUMNS} FROM students WHERE student_id = ?", (student_id,)
+        )
         row = cursor.fetchone()
-        conn.close()
 
         if row:
-            return Student(**dict(row))
+            student = Student.from_row(row)
+            if cache:
+                cache.put(student_id, student, stamp)
+            return student
         return None
 
+    @staticmethod
+    def get_many(student_ids: Iterable[int]) -> Dict[int, Student]:
+        """여러 학생 조회 {ID: 학생} (없는 ID 는 빠짐), 캐시에 없는 학생만 한 번에 조회"""
+        conn = get_connection()
+        cache = _student_cache_for(conn)
+        students = {}
+        missing = []
+        for student_id in dict.fromkeys(student_ids):
+            student = cache.get(student_id) if cache else None
+            if student is not None:
+                students[student_id] = student
+            else:
+                missing.append(student_id)
+        stamp = cache.stamp() if cache else None
+
+        for start in range(0, len(missing), ITER_CHUNK_SIZE):
+            chunk = missing[start:start + ITER_CHUNK_SIZE]
+            rows = conn.execute(
+                f"SELECT {STUDENT_COLUMNS} FROM students "
+                f"WHERE student_id IN ({', '.join(['?'] * len(chunk))})",
+                chunk
+            ).fetchall()
+            for row in rows:
+                student = Student.from_row(row)
+                students[student.student_id] = student
+                if cache:
+                    cache.put(student.student_id, student, stamp)
+        return students
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """get / get_many 캐시 적중/실패 횟수와 크기"""
+        return _student_cache.info()
+
+    @staticmethod
+    def cache_clear():
+        """get / get_many 캐시 비우기 (적중/실패 횟수도 초기화)"""
+        _student_cache.clear()
+        _student_cache.reset_stats()
+
     @staticmethod
     def get_all() -> List[Student]:
         """모든 학생 조회"""
         conn = get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM students ORDER BY student_name")
+        cursor.execute(f"SELECT {STUDENT_COLUMNS} FROM students ORDER BY {STUDENT_ORDER}")
         rows = cursor.fetchall()
-        conn.close()
 
-        return [Student(**dict(row)) for row in rows]
+        return [Student.from_row(row) for row in rows]
+
+    @staticmethod
+    def iter_all(chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[Student]:
+        """모든 학생을 커서에서 chunk_size 행씩 읽어 하나씩 반환"""
+        query = f"SELECT {STUDENT_COLUMNS} FROM students ORDER BY {STUDENT_ORDER}"
+        for row in _iter_rows(query, (), chunk_size):
+            yield Student.from_row(row)
 
     @staticmethod
     def update(student_id: int, **kwargs):
-        """학생 정보 업데이트"""
+        """학생 정보 업데이트
+
+        학년/반이 바뀌면 올해 학년도의 이력(student_enrollments)도 함께 갱신된다.
+        """
         conn = get_connection()
         cursor = conn.cursor()
 
-        # 현재 학년/반 정보 가져오기 (히스토리 업데이트용)
-        if 'student_grade' in kwargs or 'student_class' in kwargs:
+        if 'student_name' in kwargs:
+            kwargs.update(search_keys(kwargs['student_name']))
+
+        set_clause = ', '.join([f"{k} = ?" for k in kwargs.keys()])
+        values = tuple(kwargs.values()) + (student_id,)
+
+        with transaction():
             cursor.execute(
-                "SELECT student_grade, student_class, student_history FROM students WHERE student_id = ?",
-                (student_id,)
+                f"UPDATE students SET {set_clause} WHERE student_id = ?",
+                values
             )
-            row = cursor.fetchone()
-            if row:
-                current_grade = row['student_grade']
-                current_class = row['student_class']
-                history = json.loads(row['student_history']) if row['student_history'] else []
+            if 'student_grade' in kwargs or 'student_class' in kwargs:
+                cursor.execute(_RECORD_ENROLLMENT, (school_year(), student_id))
+        after_commit(lambda: _student_cache.discard(student_id))
 
-                # 현재 정보를 히스토리에 추가
-                if current_grade and current_class:
-                    history.append({"grade": current_grade, "class": current_class})
-                    kwargs['student_history'] = json.dumps(history, ensure_ascii=False)
+    @staticmethod
+    def update_many(updates: Updates) -> int:
+        """학생 정보 일괄 업데이트 (한 트랜잭션), 변경된 행 수 반환
 
-        set_clause = ', '.join([f"{k} = ?" for k in kwargs.keys()])
-        values = tuple(kwargs.values()) + (student_id,)
+        학년/반이 바뀌는 항목은 update() 와 같이 올해 학년도 이력도 갱신된다.
+        """
+        items = [
+            (student_id, {**fields, **search_keys(fields['student_name'])}
+             if 'student_name' in fields else fields)
+            for student_id, fields in (updates.items() if isinstance(updates, dict) else updates)
+        ]
+        year = school_year()
+        with transaction() as conn:
+            changed = _update_many("students", "student_id", items, STUDENT_CONSTRAINTS)
+            conn.executemany(_RECORD_ENROLLMENT, [
+                (year, student_id) for student_id, fields in items
+                if 'student_grade' in fields or 'student_class' in fields
+            ])
+        after_commit(lambda: _student_cache.discard(*(student_id for student_id, _ in items)))
+        return changed
 
+    @staticmethod
+    def get_enrollments(student_id: int) -> List[Enrollment]:
+        """학생의 학년도별 학년/반 이력 (오래된 학년도부터)"""
+        conn = get_connection()
+        cursor = conn.cursor()
         cursor.execute(
-            f"UPDATE students SET {set_clause} WHERE student_id = ?",
-            values
+            f"SELECT {ENROLLMENT_COLUMNS} FROM student_enrollments "
+            f"WHERE student_id = ? ORDER BY school_year",
+            (student_id,)
         )
+        return [Enrollment.from_row(row) for row in cursor.fetchall()]
 
-        conn.commit()
-        conn.close()
+    @staticmethod
+    def get_roster(year: int, grade: int = None, class_num: int = None) -> List[Student]:
+        """해당 학년도에 grade 학년 class_num 반이었던 학생 명단 (이름순)
+
+        학생 정보(이름, 연락처 등)는 현재 값이다.
+        """
+        query = f"""
+            SELECT {', '.join('s.' + c for c in Student.COLUMNS)}
+            FROM student_enrollments e
+            JOIN students s ON s.student_id = e.student_id
+            WHERE e.school_year = ?
+        """
+        params = [year]
+        if grade is not None:
+            query += " AND e.student_grade = ?"
+            params.append(grade)
+        if class_num is not None:
+            query += " AND e.student_class = ?"
+            params.append(class_num)
+        query += " ORDER BY s.student_name, s.student_id"
+
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        return [Student.from_row(row) for row in cursor.fetchall()]
 
     @staticmethod
     def delete(student_id: int):
         """학생 삭제 (연결된 상담 기록도 자동 삭제)"""
         conn = get_connection()
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM students WHERE student_id = ?", (student_id,))
-        conn.commit()
-        conn.close()
+        with transaction():
+            cursor.execute("DELETE FROM students WHERE student_id = ?", (student_id,))
+        after_commit(lambda: _student_cache.discard(student_id))
 
     @staticmethod
-    def search(name: str = None, grade: int = None, class_num: int = None) -> List[Student]:
-        """학생 검색"""
-        conn = get_connection()
-        cursor = conn.cursor()
+    def delete_many(student_ids: Iterable[int]) -> int:
+        """학생 일괄 삭제 (연결된 상담 기록도 삭제), 삭제된 행 수 반환"""
+        student_ids = list(student_ids)
+        with transaction():
+            deleted = _delete_many("students", "student_id", student_ids)
+        after_commit(lambda: _student_cache.discard(*student_ids))
+        return deleted
+
+    @staticmethod
+    def rollover(year: int = None, dry_run: bool = False) -> RolloverResult:
+        """새 학년도 진급 처리 (한 트랜잭션, 학생 수와 무관하게 SQL 몇 개로 처리)
+
+        1. 모든 재학생의 현재 학년/반을 지난 학년도 이력으로 기록 (이미 있는 이력은 그대로)
+        2. 6학년은 졸업 처리 (student_graduated = 지난 학년도, 학년/반 비움)
+        3. 1~5학년은 한 학년 올림 (반은 유지, 반 배정은 따로 수정)
+        4. 진급한 학생의 새 학년도 이력 기록
 
-        query = "SELECT * FROM students WHERE 1=1"
+        새 학년도 이력이 이미 있는 학생(새 학년도에 입학/전입했거나 학년/반을 이미 입력한 학생)은
+        현재 학년/반이 새 학년도 것이므로 진급 대상에서 뺀다.
+        year 는 새 학년도 (기본: rollover_year()). 같은 학년도에 두 번 실행하면 ValueError.
+        dry_run 이면 바뀔 학생 수만 계산하고 아무것도 저장하지 않는다 (쓰기 잠금 없이 읽기만).
+        """
+        year = year if year is not None else rollover_year()
+        # 파라미터: (새 학년도,)
+        eligible = ("student_graduated IS NULL AND NOT EXISTS ("
+                    "SELECT 1 FROM student_enrollments e "
+                    "WHERE e.student_id = students.student_id AND e.school_year = ?)")
+
+        if dry_run:
+            return StudentCRUD._rollover_counts(get_connection(), year, eligible, dry_run=True)
+
+        with transaction() as conn:
+            result = StudentCRUD._rollover_counts(conn, year, eligible)
+            conn.execute(_RECORD_ENROLLMENTS_KEEP.format(
+                where=f"{eligible} AND (student_grade IS NOT NULL OR student_class IS NOT NULL)"
+            ), (year - 1, year))
+            conn.execute(f"""
+                UPDATE students
+                SET student_graduated = ?, student_grade = NULL, student_class = NULL
+                WHERE {eligible} AND student_grade = 6
+            """, (year - 1, year))
+            conn.execute(f"""
+                UPDATE students SET student_grade = student_grade + 1
+                WHERE {eligible} AND student_grade BETWEEN 1 AND 5
+            """, (year,))
+            # 새 학년도 이력은 이 문장에서 처음 생기므로 eligible 은 방금 진급한 학생만 가리킨다
+            conn.execute(_RECORD_ENROLLMENTS.format(
+                where=f"{eligible} AND student_grade IS NOT NULL"
+            ), (year, year))
+            conn.execute(
+                "INSERT INTO school_year_rollovers (school_year, promoted, graduated) "
+                "VALUES (?, ?, ?)",
+                (year, result.promoted, result.graduated)
+            )
+        after_commit(_student_cache.clear)
+        return result
+
+    @staticmethod
+    def _rollover_counts(conn, year: int, eligible: str, dry_run: bool = False) -> RolloverResult:
+        """진급/졸업 대상 학생 수 (이미 진급 처리한 학년도면 ValueError)"""
+        done = conn.execute(
+            "SELECT rolled_at FROM school_year_rollovers WHERE school_year = ?", (year,)
+        ).fetchone()
+        if done:
+            raise ValueError(f"{year}학년도 진급 처리는 이미 완료되었습니다. ({done[0]})")
+
+        graduated, promoted = conn.execute(
+            f"SELECT COUNT(*) FILTER (WHERE student_grade = 6), "
+            f"COUNT(*) FILTER (WHERE student_grade BETWEEN 1 AND 5) "
+            f"FROM students WHERE {eligible}", (year,)
+        ).fetchone()
+        return RolloverResult(year, promoted, graduated, dry_run)
+
+    @staticmethod
+    def _name_condition(name: str, match: str = 'contains'):
+        """이름 검색 조건 (SQL 조각, 파라미터 목록)"""
+        if match not in NAME_MATCH_MODES:
+            raise ValueError(f"알 수 없는 이름 검색 방식: {match}")
+
+        key = normalize(name)
+        if match == 'auto':
+            match = 'choseong' if has_choseong(key) else 'prefix'
+
+        if match == 'contains':
+            return " AND student_name_key LIKE ?", [f"%{key}%"]
+        if match == 'prefix':
+            return (" AND student_name_key >= ? AND student_name_key < ?",
+                    [key, key + PREFIX_UPPER])
+
+        # 초성 범위로 인덱스 조회 후, 완성형으로 입력한 글자는 같은 자리 글자와 비교
+        # (예: '김ㅁㅅ' → 초성 'ㄱㅁㅅ' 범위 + 첫 글자 '김')
+        prefix = choseong(key)
+        sql = " AND student_choseong >= ? AND student_choseong < ?"
+        params = [prefix, prefix + PREFIX_UPPER]
+        for position, ch in enumerate(key.replace(' ', ''), start=1):
+            if is_syllable(ch):
+                sql += " AND substr(replace(student_name_key, ' ', ''), ?, 1) = ?"
+                params.extend([position, ch])
+        return sql, params
+
+    @staticmethod
+    def _search_query(name: str = None, grade: int = None, class_num: int = None,
+                      match: str = 'contains'):
+        """검색 조건으로 (쿼리, 파라미터) 생성 (ORDER BY 제외)"""
+        query = f"SELECT {STUDENT_COLUMNS} FROM students WHERE 1=1"
         params = []
 
         if name:
-            query += " AND student_name LIKE ?"
-            params.append(f"%{name}%")
+            sql, name_params = StudentCRUD._name_condition(name, match)
+            query += sql
+            params.extend(name_params)
         if grade:
             query += " AND student_grade = ?"
             params.append(grade)
@@ -114,11 +698,44 @@ class StudentCRUD:
             query += " AND student_class = ?"
             params.append(class_num)
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        return query, params
 
-        return [Student(**dict(row)) for row in rows]
+    @staticmethod
+    def get_page(page_size: int = PAGE_SIZE, cursor: str = None, name: str = None,
+                 grade: int = None, class_num: int = None, match: str = 'contains') -> Page:
+        """학생 목록 한 페이지 (이름순), cursor 는 이전 호출이 돌려준 next/prev_cursor"""
+        query, params = StudentCRUD._search_query(name, grade, class_num, match)
+        rows, next_cursor, prev_cursor = _fetch_page(
+            query, params, ["student_name", "student_id"], page_size, cursor
+        )
+        return Page([Student.from_row(row) for row in rows], next_cursor, prev_cursor)
+
+    @staticmethod
+    def search(name: str = None, grade: int = None, class_num: int = None,
+               match: str = 'contains') -> List[Student]:
+        """학생 검색
+
+        match 로 이름 검색 방식을 고른다 (NAME_MATCH_MODES 참고). 'prefix', 'choseong',
+        'auto' 는 검색 키 인덱스를 사용하며, 'auto' 는 'ㄱㅁㅅ' 같은 초성 입력도 처리한다.
+        """
+        def run():
+            query, params = StudentCRUD._search_query(name, grade, class_num, match)
+            rows = get_connection().execute(query + f" ORDER BY {STUDENT_ORDER}", params).fetchall()
+            return [Student.from_row(row) for row in rows]
+
+        key = ('students', normalize(name) or None, grade or None, class_num or None,
+               match if name else None)
+        return _cached_search(key, run)
+
+    @staticmethod
+    def iter_search(name: str = None, grade: int = None, class_num: int = None,
+                    match: str = 'contains',
+                    chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[Student]:
+        """학생 검색 결과를 chunk_size 행씩 읽어 하나씩 반환"""
+        query, params = StudentCRUD._search_query(name, grade, class_num, match)
+        query += f" ORDER BY {STUDENT_ORDER}"
+        for row in _iter_rows(query, params, chunk_size):
+            yield Student.from_row(row)
 
 
 class ConsultingCRUD:
@@ -134,53 +751,149 @@ class ConsultingCRUD:
         columns = ', '.join(data.keys())
         placeholders = ', '.join(['?' for _ in data])
 
-        cursor.execute(
-            f"INSERT INTO consultings ({columns}) VALUES ({placeholders})",
-            tuple(data.values())
-        )
+        with transaction():  # 성공 시 commit, 예외 시 rollback
+            cursor.execute(
+                f"INSERT INTO consultings ({columns}) VALUES ({placeholders})",
+                tuple(data.values())
+            )
 
-        consulting_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return consulting_id
+        return cursor.lastrowid
+
+    @staticmethod
+    def create_many(consultings: Iterable[Consulting]) -> List[int]:
+        """상담 기록 일괄 생성 (한 트랜잭션), 생성된 ID 목록을 입력 순서대로 반환"""
+        consultings = list(consultings)
+        _validate_items(consultings, "상담 기록")
+        rows = [
+            (c.consulting_id, c.consulting_title, c.consulting_date, c.student_id,
+             c.consulting_type, c.consulting_object, c.consulting_content,
+             c.consulting_opinion, c.consulting_note)
+            for c in consultings
+        ]
+        # 날짜가 없으면 스키마 기본값과 같은 현재 시각 사용
+        return _insert_many(
+            "consultings", "consulting_id",
+            ["consulting_title", "consulting_date", "student_id", "consulting_type",
+             "consulting_object", "consulting_content", "consulting_opinion",
+             "consulting_note"],
+            rows,
+            values_sql="?, ?, COALESCE(?, datetime('now','localtime')), ?, ?, ?, ?, ?, ?"
+        )
 
     @staticmethod
     def get(consulting_id: int) -> Optional[Consulting]:
         """상담 기록 조회"""
         conn = get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM consultings WHERE consulting_id = ?", (consulting_id,))
+        cursor.execute(f"SELECT {CONSULTING_COLUMNS} FROM consultings WHERE consulting_id = ?", (consulting_id,))
         row = cursor.fetchone()
-        conn.close()
 
         if row:
-            return Consulting(**dict(row))
+            return Consulting.from_row(row)
+        return None
+
+    @staticmethod
+    def get_with_student(consulting_id: int) -> Optional[ConsultingWithStudent]:
+        """상담 기록 전체 내용 + 학생 정보 조회 (목록에서 행을 열 때 사용)
+
+        최근 조회한 기록은 캐시에서 반환한다 (반환된 객체는 수정하지 않는다).
+        """
+        conn = get_connection()
+        cache = _detail_cache_for(conn)
+        if cache:
+            consulting = cache.get(consulting_id)
+            if consulting is not None:
+                return consulting
+            stamp = cache.stamp()
+
+        row = conn.execute(
+            f"SELECT {CONSULTING_SELECT['with_student']} FROM consultings c "
+            "JOIN students s ON c.student_id = s.student_id "
+            "WHERE c.consulting_id = ?",
+            (consulting_id,)
+        ).fetchone()
+
+        if row:
+            consulting = ConsultingWithStudent.from_row(row)
+            if cache:
+                cache.put(consulting_id, consulting, stamp)
+            return consulting
         return None
 
+    @staticmethod
+    def get_many_with_student(consulting_ids: Iterable[int]) -> Dict[int, ConsultingWithStudent]:
+        """여러 상담 기록 전체 내용 조회 {ID: 기록} (없는 ID 는 빠짐)
+
+        캐시에 없는 기록만 한 번에 조회해 캐시에 넣는다 (목록 이웃 행 미리 읽기용).
+        """
+        conn = get_connection()
+        cache = _detail_cache_for(conn)
+        consultings = {}
+        missing = []
+        for consulting_id in dict.fromkeys(consulting_ids):
+            consulting = cache.get(consulting_id) if cache else None
+            if consulting is not None:
+                consultings[consulting_id] = consulting
+            else:
+                missing.append(consulting_id)
+        stamp = cache.stamp() if cache else None
+
+        for start in range(0, len(missing), ITER_CHUNK_SIZE):
+            chunk = missing[start:start + ITER_CHUNK_SIZE]
+            rows = conn.execute(
+                f"SELECT {CONSULTING_SELECT['with_student']} FROM consultings c "
+                "JOIN students s ON c.student_id = s.student_id "
+                f"WHERE c.consulting_id IN ({', '.join(['?'] * len(chunk))})",
+                chunk
+            ).fetchall()
+            for row in rows:
+                consulting = ConsultingWithStudent.from_row(row)
+                consultings[consulting.consulting_id] = consulting
+                if cache:
+                    cache.put(consulting.consulting_id, consulting, stamp)
+        return consultings
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """get_with_student / get_many_with_student 캐시 적중/실패 횟수와 크기"""
+        return _detail_cache.info()
+
+    @staticmethod
+    def cache_clear():
+        """get_with_student / get_many_with_student 캐시 비우기 (적중/실패 횟수도 초기화)"""
+        _detail_cache.clear()
+        _detail_cache.reset_stats()
+
     @staticmethod
     def get_by_student(student_id: int) -> List[Consulting]:
         """특정 학생의 모든 상담 기록 조회"""
         conn = get_connection()
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT * FROM consultings WHERE student_id = ? ORDER BY consulting_date DESC",
+            f"SELECT {CONSULTING_COLUMNS} FROM consultings WHERE student_id = ? "
+            f"ORDER BY {CONSULTING_ORDER}",
             (student_id,)
         )
         rows = cursor.fetchall()
-        conn.close()
 
-        return [Consulting(**dict(row)) for row in rows]
+        return [Consulting.from_row(row) for row in rows]
 
     @staticmethod
     def get_all() -> List[Consulting]:
         """모든 상담 기록 조회"""
         conn = get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM consultings ORDER BY consulting_date DESC")
+        cursor.execute(f"SELECT {CONSULTING_COLUMNS} FROM consultings ORDER BY {CONSULTING_ORDER}")
         rows = cursor.fetchall()
-        conn.close()
 
-        return [Consulting(**dict(row)) for row in rows]
+        return [Consulting.from_row(row) for row in rows]
+
+    @staticmethod
+    def iter_all(chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[Consulting]:
+        """모든 상담 기록을 커서에서 chunk_size 행씩 읽어 하나씩 반환"""
+        query = f"SELECT {CONSULTING_COLUMNS} FROM consultings ORDER BY {CONSULTING_ORDER}"
+        for row in _iter_rows(query, (), chunk_size):
+            yield Consulting.from_row(row)
 
     @staticmethod
     def update(consulting_id: int, **kwargs):
@@ -191,32 +904,41 @@ class ConsultingCRUD:
         set_clause = ', '.join([f"{k} = ?" for k in kwargs.keys()])
         values = tuple(kwargs.values()) + (consulting_id,)
 
-        cursor.execute(
-            f"UPDATE consultings SET {set_clause} WHERE consulting_id = ?",
-            values
-        )
+        with transaction():
+            cursor.execute(
+                f"UPDATE consultings SET {set_clause} WHERE consulting_id = ?",
+                values
+            )
 
-        conn.commit()
-        conn.close()
+    @staticmethod
+    def update_many(updates: Updates) -> int:
+        """상담 기록 일괄 업데이트 (한 트랜잭션), 변경된 행 수 반환"""
+        return _update_many("consultings", "consulting_id", updates,
+                            CONSULTING_CONSTRAINTS)
 
     @staticmethod
     def delete(consulting_id: int):
         """상담 기록 삭제"""
         conn = get_connection()
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM consultings WHERE consulting_id = ?", (consulting_id,))
-        conn.commit()
-        conn.close()
+        with transaction():
+            cursor.execute("DELETE FROM consultings WHERE consulting_id = ?", (consulting_id,))
 
     @staticmethod
-    def search(title: str = None, student_name: str = None, 
-               consulting_type: str = None, start_date: str = None, end_date: str = None) -> List[Consulting]:
-        """상담 기록 검색"""
-        conn = get_connection()
-        cursor = conn.cursor()
+    def delete_many(consulting_ids: Iterable[int]) -> int:
+        """상담 기록 일괄 삭제, 삭제된 행 수 반환"""
+        return _delete_many("consultings", "consulting_id", consulting_ids)
+
+    @staticmethod
+    def _search_query(title: str = None, student_name: str = None,
+                      consulting_type: str = None, start_date: str = None, end_date: str = None,
+                      columns: str = 'full'):
+        """검색 조건으로 (쿼리, 파라미터) 생성 (ORDER BY 제외)
 
-        query = """
-            SELECT c.* FROM consultings c
+        columns 는 CONSULTING_SELECT 의 키 (full / with_student / summary)
+        """
+        query = f"""
+            SELECT {CONSULTING_SELECT[columns]} FROM consultings c
             JOIN students s ON c.student_id = s.student_id
             WHERE 1=1
         """
@@ -226,22 +948,156 @@ class ConsultingCRUD:
             query += " AND c.consulting_title LIKE ?"
             params.append(f"%{title}%")
         if student_name:
-            query += " AND s.student_name LIKE ?"
-            params.append(f"%{student_name}%")
+            query += " AND s.student_name_key LIKE ?"
+            params.append(f"%{normalize(student_name)}%")
         if consulting_type:
-            query += " AND c.consulting_type = ?"
+            # idx_consultings_type_day 와 같은 식으로 비교해야 인덱스를 쓴다 (값이 있으면 결과는 같음)
+            query += " AND COALESCE(c.consulting_type, '') = ?"
             params.append(consulting_type)
         if start_date:
-            query += " AND c.consulting_date >= ?"
-            params.append(start_date)
+            query += " AND c.consulting_day >= ?"
+            params.append(_day_bound(start_date, "시작일"))
         if end_date:
-            query += " AND c.consulting_date <= ?"
-            params.append(end_date)
+            query += " AND c.consulting_day <= ?"
+            params.append(_day_bound(end_date, "종료일"))
 
-        query += " ORDER BY c.consulting_date DESC"
+        return query, params
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+    @staticmethod
+    def get_page(page_size: int = PAGE_SIZE, cursor: str = None, title: str = None,
+                 student_name: str = None, consulting_type: str = None,
+                 start_date: str = None, end_date: str = None,
+                 sort: str = 'date', descending: bool = True) -> Page:
+        """상담 기록 요약 한 페이지 (기본: 최신순, 학생 정보 포함)
+
+        sort 는 CONSULTING_SORTS 의 키 (date / student / type / title) 이다.
+        cursor 는 같은 조건/정렬로 이전 호출이 돌려준 next_cursor / prev_cursor 이다.
+        """
+        if sort not in CONSULTING_SORTS:
+            raise ValueError(f"알 수 없는 정렬 기준: {sort} (사용 가능: {', '.join(CONSULTING_SORTS)})")
+        query, params = ConsultingCRUD._search_query(
+            title, student_name, consulting_type, start_date, end_date, columns='summary'
+        )
+        rows, next_cursor, prev_cursor = _fetch_page(
+            query, params, CONSULTING_SORTS[sort] + ["c.consulting_id"], page_size, cursor,
+            descending=descending
+        )
+        return Page([ConsultingSummary.from_row(row) for row in rows], next_cursor, prev_cursor)
+
+    @staticmethod
+    def _search_cached(columns: str, model, title: str = None, student_name: str = None,
+                       consulting_type: str = None, start_date: str = None,
+                       end_date: str = None) -> list:
+        """검색 결과를 최신순으로 조회 (같은 조건이면 검색 결과 캐시에서 반환)"""
+        def run():
+            query, params = ConsultingCRUD._search_query(
+                title, student_name, consulting_type, start_date, end_date, columns=columns
+            )
+            rows = get_connection().execute(
+                query + f" ORDER BY {JOINED_CONSULTING_ORDER}", params
+            ).fetchall()
+            return [model.from_row(row) for row in rows]
+
+        # 같은 결과가 나오는 조건은 같은 키 (예: '2024-03-05' 와 '2024-03-05 00:00:00')
+        key = ('consultings', columns, title or None, normalize(student_name) or None,
+               consulting_type or None,
+               _day_bound(start_date, "시작일") if start_date else None,
+               _day_bound(end_date, "종료일") if end_date else None)
+        return _cached_search(key, run)
+
+    @staticmethod
+    def search(title: str = None, student_name: str = None, 
+               consulting_type: str = None, start_date: str = None, end_date: str = None) -> List[Consulting]:
+        """상담 기록 검색"""
+        return ConsultingCRUD._search_cached(
+            'full', Consulting, title, student_name, consulting_type, start_date, end_date
+        )
+
+    @staticmethod
+    def search_with_student(title: str = None, student_name: str = None,
+                            consulting_type: str = None, start_date: str = None,
+                            end_date: str = None) -> List[ConsultingWithStudent]:
+        """상담 기록 검색 (학생 이름/학년/반 포함, 한 번의 쿼리)"""
+        return ConsultingCRUD._search_cached(
+            'with_student', ConsultingWithStudent,
+            title, student_name, consulting_type, start_date, end_date
+        )
+
+    @staticmethod
+    def get_all_with_student() -> List[ConsultingWithStudent]:
+        """모든 상담 기록 조회 (학생 이름/학년/반 포함, 한 번의 쿼리)"""
+        return ConsultingCRUD.search_with_student()
+
+    @staticmethod
+    def search_summaries(title: str = None, student_name: str = None,
+                         consulting_type: str = None, start_date: str = None,
+                         end_date: str = None) -> List[ConsultingSummary]:
+        """상담 기록 요약 검색 (목록 화면용, 본문 텍스트 제외, 조건이 없으면 전체)"""
+        return ConsultingCRUD._search_cached(
+            'summary', ConsultingSummary,
+            title, student_name, consulting_type, start_date, end_date
+        )
+
+    @staticmethod
+    def iter_search(title: str = None, student_name: str = None,
+                    consulting_type: str = None, start_date: str = None, end_date: str = None,
+                    chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[Consulting]:
+        """상담 기록 검색 결과를 chunk_size 행씩 읽어 하나씩 반환"""
+        query, params = ConsultingCRUD._search_query(
+            title, student_name, consulting_type, start_date, end_date
+        )
+        query += f" ORDER BY {JOINED_CONSULTING_ORDER}"
+        for row in _iter_rows(query, params, chunk_size):
+            yield Consulting.from_row(row)
+
+    @staticmethod
+    def fulltext_search(query: str, student_name: str = None, consulting_type: str = None,
+                        start_date: str = None, end_date: str = None,
+                        limit: int = FULLTEXT_LIMIT,
+                        highlight: Tuple[str, str] = ('[', ']')) -> List[ConsultingSearchHit]:
+        """주제/진술 내용/소견/특이사항 전문 검색 (관련도순, 최대 limit 건)
+
+        검색어가 포함된 부분은 highlight 로 감싼 발췌문(snippet)으로 함께 반환한다.
+        잘린 결과인지 알려면 limit + 1 건을 요청해 limit 건보다 많이 오는지 확인한다.
+        조건(학생 이름/유형/기간)은 search 와 같은 식으로 비교한다.
+        """
+        match = _fts_match_query(query or '')
+        if not match:
+            return []
+
+        weights = ', '.join(str(w) for w in FTS_WEIGHTS)
+        sql = f"""
+            SELECT {CONSULTING_SELECT['with_student']},
+                   snippet(consultings_fts, -1, ?, ?, '…', 16) AS fts_snippet,
+                   bm25(consultings_fts, {weights}) AS fts_rank
+            FROM consultings_fts
+            JOIN consultings c ON c.consulting_id = consultings_fts.rowid
+            JOIN students s ON c.student_id = s.student_id
+            WHERE consultings_fts MATCH ?
+        """
+        params = [highlight[0], highlight[1], match]
+
+        if student_name:
+            sql += " AND s.student_name_key LIKE ?"
+            params.append(f"%{normalize(student_name)}%")
+        if consulting_type:
+            sql += " AND COALESCE(c.consulting_type, '') = ?"
+            params.append(consulting_type)
+        if start_date:
+            sql += " AND c.consulting_day >= ?"
+            params.append(_day_bound(start_date, "시작일"))
+        if end_date:
+            sql += " AND c.consulting_day <= ?"
+            params.append(_day_bound(end_date, "종료일"))
+
+        sql += " ORDER BY fts_rank LIMIT ?"
+        params.append(limit)
+
+        conn = get_connection()
+        rows = conn.execute(sql, params).fetchall()
 
-        return [Consulting(**dict(row)) for row in rows]
+        hits = []
+        for row in rows:
+            *values, snippet, rank = row
+            hits.append(ConsultingSearchHit(ConsultingWithStudent.from_row(values), snippet or '', rank))
+        return hits
@@ -1,61 +1,221 @@
 """데이터베이스 연결 및 초기화"""
+import atexit
 import sqlite3
-from carenote.config import DB_PATH
+import threading
+import time
+from contextlib import contextmanager
+from carenote.config import DB_PATH, DB_PROFILE, DB_PROFILES, EXTERNAL_CHECK_INTERVAL
+from carenote.migrations import LATEST_VERSION, migrate
 
+# 스레드별로 연결을 하나씩 재사용 (매 호출마다 connect/close 하지 않음)
+_local = threading.local()
+_connections = []  # 열려 있는 모든 연결 (close_all_connections 용)
+_lock = threading.Lock()
+_generation = 0  # close_all_connections 호출 시 증가 → 스레드별 연결 무효화
+_external_epoch = 0  # 다른 연결(다른 스레드/프로세스)의 commit 을 감지할 때마다 증가
+_write_generation = 0  # transaction() 범위가 끝날 때마다 증가 (이 프로세스의 쓰기)
 
-def get_connection():
-    """데이터베이스 연결 반환"""
-    conn = sqlite3.connect(DB_PATH)
+
+def get_profile(name: str = None) -> dict:
+    """성능 프로필 설정 반환 (기본: config.DB_PROFILE)"""
+    name = name or DB_PROFILE
+    if name not in DB_PROFILES:
+        raise ValueError(
+            f"알 수 없는 성능 프로필: {name} (사용 가능: {', '.join(DB_PROFILES)})"
+        )
+    return DB_PROFILES[name]
+
+
+def apply_profile(conn, name: str = None):
+    """연결에 성능 프로필 PRAGMA 적용"""
+    profile = get_profile(name)
+    # journal_mode 는 DB 파일에 저장되며, 바꾸려면 다른 연결이 없어야 한다.
+    # 다른 PC/프로세스가 사용 중이면 기다리지 않고 지금 모드를 그대로 쓴다.
+    conn.execute("PRAGMA busy_timeout = 0")
+    try:
+        current = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        if current.upper() != profile['journal_mode'].upper():
+            conn.execute(f"PRAGMA journal_mode = {profile['journal_mode']}")
+    except sqlite3.OperationalError:
+        pass
+    conn.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout'])}")
+    conn.execute(f"PRAGMA synchronous = {profile['synchronous']}")
+    conn.execute(f"PRAGMA cache_size = {int(profile['cache_size'])}")
+    conn.execute(f"PRAGMA mmap_size = {int(profile['mmap_size'])}")
+    conn.execute(f"PRAGMA temp_store = {profile['temp_store']}")
+
+
+def _open_connection():
+    """새 연결 생성 및 공통 설정 적용"""
+    # 다른 스레드에서 close_all_connections 로 닫을 수 있도록 check_same_thread 해제
+    # (연결 자체는 만든 스레드에서만 사용한다)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.execute("PRAGMA foreign_keys = ON")  # Foreign key 활성화
+    apply_profile(conn)
     conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
     return conn
 
 
-def init_database():
-    """데이터베이스 테이블 초기화"""
+def get_connection():
+    """현재 스레드의 데이터베이스 연결 반환 (없으면 생성)
+
+    반환된 연결은 공유되므로 호출한 쪽에서 close() 하지 않는다.
+    """
+    conn = getattr(_local, 'conn', None)
+    if (conn is not None
+            and _local.generation == _generation
+            and _local.path == DB_PATH):
+        return conn
+
+    conn = _open_connection()
+    with _lock:
+        _connections.append(conn)
+        _local.conn = conn
+        _local.generation = _generation
+        _local.path = DB_PATH
+        _local.data_version = None
+    return conn
+
+
+def external_epoch() -> int:
+    """다른 연결의 commit 감지용 값 (바뀌었으면 캐시된 조회 결과를 버린다)
+
+    현재 스레드 연결의 PRAGMA data_version 이 지난 확인 때와 다르면 증가한다.
+    data_version 은 같은 연결의 commit 에는 바뀌지 않으므로, 자기 연결로 쓴 변경은
+    쓰는 쪽에서 직접 캐시를 무효화해야 한다. 새 연결은 열리기 전의 변경을 알 수 없으므로
+    처음 확인할 때도 증가한다.
+    확인 자체도 쿼리이므로 스레드마다 EXTERNAL_CHECK_INTERVAL 초에 한 번만 확인한다.
+    """
+    global _external_epoch
     conn = get_connection()
-    cursor = conn.cursor()
-
-    # students 테이블
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS students (
-            student_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_name TEXT NOT NULL,
-            student_phone TEXT,
-            student_grade INTEGER CHECK(student_grade IN (1,2,3,4,5,6)),
-            student_class INTEGER CHECK(student_class IN (1,2,3,4)),
-            student_sex TEXT CHECK(student_sex IN ('남','여')),
-            student_history TEXT DEFAULT '[]'
-        )
-    """)
-
-    # consultings 테이블
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS consultings (
-            consulting_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            consulting_title TEXT NOT NULL,
-            consulting_date TEXT DEFAULT (datetime('now','localtime')),
-            student_id INTEGER NOT NULL,
-            consulting_type TEXT CHECK(consulting_type IN ('전화','대면','기타')),
-            consulting_object TEXT CHECK(consulting_object IN ('본인','가족','교사','기타')),
-            consulting_content TEXT,
-            consulting_opinion TEXT,
-            consulting_note TEXT,
-            FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE
-        )
-    """)
-
-    # 인덱스 생성
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_consultings_student 
-        ON consultings(student_id)
-    """)
-
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_consultings_date 
-        ON consultings(consulting_date)
-    """)
-
-    conn.commit()
-    conn.close()
-    print(f"데이터베이스 초기화 완료: {DB_PATH}")
+    now = time.monotonic()
+    if _local.data_version is not None and now - _local.data_checked < EXTERNAL_CHECK_INTERVAL:
+        return _external_epoch
+
+    version = conn.execute("PRAGMA data_version").fetchone()[0]
+    _local.data_checked = now
+    if version != _local.data_version:
+        _local.data_version = version
+        with _lock:
+            _external_epoch += 1
+    return _external_epoch
+
+
+@contextmanager
+def transaction():
+    """쓰기 트랜잭션 범위
+
+    가장 바깥 범위에서 BEGIN IMMEDIATE / COMMIT 하고, 예외가 나면 ROLLBACK 한다.
+    중첩된 범위는 SAVEPOINT 로 처리되어 안쪽 실패만 되돌릴 수 있다.
+    """
+    conn = get_connection()
+    depth = getattr(_local, 'depth', 0)
+
+    if depth == 0:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+    else:
+        conn.execute(f"SAVEPOINT sp_{depth}")
+
+    _local.depth = depth + 1
+    try:
+        yield conn
+    except BaseException:
+        _local.depth = depth
+        if depth == 0:
+            conn.rollback()
+        else:
+            conn.execute(f"ROLLBACK TO sp_{depth}")
+            conn.execute(f"RELEASE sp_{depth}")
+        _bump_write_generation()
+        if depth == 0:
+            _run_after_commit()
+        raise
+
+    _local.depth = depth
+    if depth == 0:
+        try:
+            conn.commit()
+        except BaseException:
+            # COMMIT 실패(SQLITE_BUSY 등) 시 트랜잭션이 열린 채로 남으면 쓰기 잠금을 계속 잡고,
+            # 다음 transaction() 이 그 트랜잭션에 합류해 실패한 쓰기까지 함께 commit 된다
+            conn.rollback()
+            _bump_write_generation()
+            _run_after_commit()
+            raise
+    else:
+        conn.execute(f"RELEASE sp_{depth}")
+    _bump_write_generation()
+    if depth == 0:
+        _run_after_commit()
+
+
+def after_commit(callback):
+    """가장 바깥 transaction() 이 끝난 뒤(COMMIT 또는 ROLLBACK) callback() 실행
+
+    트랜잭션 밖에서 호출하면 바로 실행한다. COMMIT 전에 캐시를 비우면 그 사이 다른 스레드가
+    아직 바뀌지 않은 행을 다시 캐시할 수 있으므로, 캐시 무효화는 이 함수로 미룬다.
+    """
+    if getattr(_local, 'depth', 0):
+        _local.__dict__.setdefault('after_commit', []).append(callback)
+    else:
+        callback()
+
+
+def _run_after_commit():
+    callbacks = _local.__dict__.pop('after_commit', [])
+    for callback in callbacks:
+        callback()
+
+
+def _bump_write_generation():
+    global _write_generation
+    with _lock:
+        _write_generation += 1
+
+
+def data_token() -> tuple:
+    """조회 결과 캐시용 데이터 버전 (값이 바뀌었으면 데이터가 바뀌었을 수 있음)
+
+    (이 프로세스의 transaction() 횟수, 다른 연결의 commit 감지 값) 이다.
+    """
+    return _write_generation, external_epoch()
+
+
+def close_all_connections():
+    """열려 있는 모든 연결 종료 (앱 종료 시 호출)
+
+    이후 get_connection() 을 다시 호출하면 새 연결이 만들어진다.
+    """
+    global _generation
+    with _lock:
+        _generation += 1
+        connections = list(_connections)
+        _connections.clear()
+
+    for conn in connections:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(close_all_connections)
+
+
+def _print_progress(step: int, total: int, description: str):
+    print(f"  [{step}/{total}] 스키마 업데이트: {description}")
+
+
+def init_database(progress=_print_progress):
+    """데이터베이스 스키마 준비
+
+    스키마가 최신이면 DDL 없이 바로 반환하고, 아니면 남은 마이그레이션을 적용한다.
+    """
+    conn = get_connection()
+    applied = migrate(conn, progress=progress)
+
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    status = f"스키마 v{LATEST_VERSION}로 업데이트" if applied else "준비 완료"
+    print(f"데이터베이스 {status}: {DB_PATH} "
+          f"(성능 프로필: {DB_PROFILE}, journal_mode={journal_mode})")
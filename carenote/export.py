@@ -0,0 +1,49 @@
+"""학생/상담 기록 내보내기 (CSV / JSONL)
+
+StudentCRUD.iter_all / ConsultingCRUD.iter_all 로 커서에서 조금씩 읽어 바로 파일에 쓰므로
+데이터베이스 크기와 무관하게 메모리 사용량이 일정하다.
+"""
+import csv
+import json
+from dataclasses import fields
+from typing import Iterable
+
+from carenote.crud import StudentCRUD, ConsultingCRUD
+from carenote.models import Student, Consulting
+
+FORMATS = ('csv', 'jsonl')
+
+
+def _write_records(path: str, fmt: str, columns: list, records: Iterable) -> int:
+    """레코드를 한 건씩 파일에 쓰고 건수 반환"""
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (사용 가능: {', '.join(FORMATS)})")
+
+    count = 0
+    if fmt == 'csv':
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for record in records:
+                writer.writerow([getattr(record, c) for c in columns])
+                count += 1
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in records:
+                row = {c: getattr(record, c) for c in columns}
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+                count += 1
+    return count
+
+
+def export_students(path: str, fmt: str = 'csv') -> int:
+    """모든 학생을 파일로 내보내고 건수 반환"""
+    columns = [f.name for f in fields(Student)]
+    return _write_records(path, fmt, columns, StudentCRUD.iter_all())
+
+
+def export_consultings(path: str, fmt: str = 'csv') -> int:
+    """모든 상담 기록을 파일로 내보내고 건수 반환"""
+    columns = [f.name for f in fields(Consulting)]
+    return _write_records(path, fmt, columns, ConsultingCRUD.iter_all())
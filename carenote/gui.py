@@ -1,42 +1,391 @@
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QMainWindow, QTabWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QTextEdit, QMessageBox,
-    QListWidget, QFormLayout, QSpinBox, QTableWidget, QTableWidgetItem,
-    QSplitter, QDateEdit
+    QListView, QFormLayout, QSpinBox, QTableView, QAbstractItemView,
+    QSplitter, QDateEdit, QFileDialog, QProgressBar, QInputDialog
 )
 from PyQt6.QtPrintSupport import (
     QPrintPreviewDialog, QPrinter, QPrintDialog
 )
 from PyQt6.QtGui import QTextDocument, QFont, QPageSize, QPageLayout
-from PyQt6.QtCore import Qt, QDate, QMarginsF
+from PyQt6.QtCore import (
+    Qt, QDate, QMarginsF, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot,
+    QAbstractTableModel, QAbstractListModel, QModelIndex, QSortFilterProxyModel, QTimer
+)
+import bisect
+import html
+import itertools
 import sys
+import threading
+from typing import Optional
+
+from carenote.crud import FULLTEXT_LIMIT, StudentCRUD, ConsultingCRUD
+from carenote.models import Student, Consulting, day_key, rollover_year
+from carenote.database import get_connection, init_database
+from carenote.hangul import has_choseong, name_matches, normalize, search_keys
+from carenote.importer import import_students
+from carenote.writebehind import FlushResult, WriteBehindQueue
+from carenote.config import WRITE_BEHIND
+
+# ---------- 백그라운드 DB 작업 ----------
+
+class WorkerSignals(QObject):
+    """작업 스레드 → UI 스레드 결과 전달용 (QRunnable 은 시그널을 가질 수 없다)"""
+    finished = pyqtSignal(int, object)   # (seq, 결과)
+    failed = pyqtSignal(int, object)     # (seq, 예외)
+
+
+class Worker(QRunnable):
+    """fn(*args, **kwargs) 를 스레드 풀에서 실행하고 결과를 시그널로 보낸다"""
+
+    def __init__(self, seq: int, fn, args, kwargs):
+        super().__init__()
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._conn = None
+        self._lock = threading.Lock()
+        self.setAutoDelete(False)  # DbTaskRunner 가 끝날 때까지 참조를 들고 있는다
+
+    def run(self):
+        conn = get_connection()  # 이 스레드의 연결 (fn 안의 CRUD 호출도 같은 연결을 쓴다)
+        with self._lock:
+            self._conn = conn
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.seq, e)
+            return
+        finally:
+            with self._lock:
+                self._conn = None
+        self.signals.finished.emit(self.seq, result)
+
+    def interrupt(self):
+        """실행 중인 쿼리 중단 (조회 작업에만 사용, 쓰기 중에 부르면 트랜잭션이 롤백된다)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.interrupt()
+
+
+class DbTaskRunner(QObject):
+    """DB 작업을 UI 스레드 밖에서 실행하고 결과를 UI 스레드에서 콜백으로 전달
+
+    같은 key 로 새 작업을 제출하면 이전 작업은 대체된 것으로 보고 결과를 버린다
+    (cancellable=True 면 실행 중인 쿼리도 중단). 저장처럼 끝까지 실행해야 하는 작업은
+    cancellable=False 로 제출하며, 이런 작업은 대체되지 않고 각각 콜백까지 실행된다.
+    """
+
+    # 실행 중인 작업 수 (quiet 작업 제외, 상태 표시줄 busy 표시용)
+    busy_changed = pyqtSignal(int)
+
+    def __init__(self, parent=None, max_threads: int = 2):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        # 스레드마다 DB 연결을 재사용하므로 스레드를 만료시키지 않는다
+        self.pool.setExpiryTimeout(-1)
+        self._seq = itertools.count(1)
+        self._latest = {}   # key → 가장 최근 seq
+        self._tasks = {}    # seq → (key, worker, on_done, on_error, cancellable)
+        self._quiet = set() # busy 표시에서 빼는 작업의 seq
+
+    def submit(self, key: str, fn, *args, on_done=None, on_error=None,
+               cancellable: bool = True, quiet: bool = False, **kwargs) -> int:
+        """fn(*args, **kwargs) 를 백그라운드에서 실행
+
+        on_done(result) / on_error(exc) 는 UI 스레드에서, 이 key 의 최신 작업일 때만 호출된다
+        (cancellable=False 인 작업은 항상 호출된다).
+        quiet=True 면 상태 표시줄 busy 표시에 넣지 않는다 (미리 읽기처럼 자주 도는 짧은 작업).
+        """
+        previous = self._latest.get(key)
+        if previous in self._tasks:
+            _, old_worker, _, _, old_cancellable = self._tasks[previous]
+            if old_cancellable:
+                old_worker.interrupt()
+
+        seq = next(self._seq)
+        worker = Worker(seq, fn, args, kwargs)
+        worker.signals.finished.connect(self._on_finished)
+        worker.signals.failed.connect(self._on_failed)
+        self._latest[key] = seq
+        self._tasks[seq] = (key, worker, on_done, on_error, cancellable)
+        if quiet:
+            self._quiet.add(seq)
+        self._emit_busy()
+        self.pool.start(worker)
+        return seq
+
+    def is_pending(self, key: str) -> bool:
+        return self._latest.get(key) in self._tasks
+
+    def _emit_busy(self):
+        self.busy_changed.emit(len(self._tasks) - len(self._quiet))
+
+    def _pop(self, seq: int):
+        """끝난 작업 정리, 대체된 작업이면 None (중단할 수 없는 쓰기 작업은 대체되지 않음)"""
+        key, _, on_done, on_error, cancellable = self._tasks.pop(seq)
+        self._quiet.discard(seq)
+        self._emit_busy()
+        if self._latest.get(key) == seq:
+            del self._latest[key]
+        elif cancellable:
+            return None
+        return on_done, on_error
+
+    @pyqtSlot(int, object)
+    def _on_finished(self, seq: int, result):
+        callbacks = self._pop(seq)
+        if callbacks and callbacks[0]:
+            callbacks[0](result)
+
+    @pyqtSlot(int, object)
+    def _on_failed(self, seq: int, error):
+        callbacks = self._pop(seq)
+        if callbacks is None:
+            return  # 대체된 작업 (중단되어 난 오류 포함)
+        on_error = callbacks[1]
+        if on_error:
+            on_error(error)
+        else:
+            QMessageBox.critical(None, "데이터베이스 오류", str(error))
+
+    def shutdown(self):
+        """대기 중인 작업 취소, 조회 중단 후 실행 중인 작업이 끝날 때까지 대기 (앱 종료 시)"""
+        self.pool.clear()
+        for _, worker, _, _, cancellable in list(self._tasks.values()):
+            if cancellable:
+                worker.interrupt()
+        self.pool.waitForDone()
+        self._latest.clear()
+
+
+# ---------- 학생 목록 (탭끼리 공유) ----------
+
+# 입력이 멈춘 뒤 필터를 적용할 때까지 기다리는 시간 (ms)
+FILTER_DEBOUNCE_MS = 200
+
+# 목록 항목의 Student 객체 (Qt.ItemDataRole.UserRole 은 student_id)
+STUDENT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class StudentListModel(QAbstractListModel):
+    """전체 학생 목록 (이름순), 한 번 불러온 뒤 바뀐 학생만 다시 조회해 반영
+
+    각 탭은 StudentFilterProxyModel 로 감싸 메모리에서 이름/학년/반을 거른다.
+    """
+
+    def __init__(self, tasks: DbTaskRunner, parent=None):
+        super().__init__(parent)
+        self.tasks = tasks
+        self._students = []     # STUDENT_ORDER (이름, ID) 순
+        self._sort_keys = []    # _students 와 같은 순서의 (이름, ID), 삽입 위치 검색용
+        self._search_keys = {}  # student_id → search_keys(이름)
+        self._pending = set()   # 다시 조회해야 하는 student_id
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._students)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        student = self._students[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            extra = ""
+            if student.student_grade and student.student_class:
+                extra = f" ({student.student_grade}학년 {student.student_class}반)"
+            elif student.student_grade:
+                extra = f" ({student.student_grade}학년)"
+            return f"{student.student_name}{extra}"
+        if role == Qt.ItemDataRole.UserRole:
+            return student.student_id
+        if role == STUDENT_ROLE:
+            return student
+        return None
+
+    def student_at(self, row: int) -> Student:
+        return self._students[row]
+
+    def search_keys_at(self, row: int) -> dict:
+        return self._search_keys[self._students[row].student_id]
+
+    # ---- 불러오기 / 갱신 ----
+
+    def load(self):
+        """전체 목록 다시 불러오기 (명단 가져오기, 진급 처리처럼 여러 학생이 바뀐 뒤)"""
+        self._pending.clear()
+        self.tasks.submit("student_model", StudentCRUD.get_all, on_done=self._on_loaded)
+
+    def refresh(self, student_ids):
+        """해당 학생만 다시 조회해 추가/수정/삭제 반영
+
+        아직 반영되지 않은 이전 요청의 ID 도 함께 조회한다 (같은 key 라 이전 결과는 버려짐).
+        """
+        self._pending.update(student_ids)
+        ids = sorted(self._pending)
+        self.tasks.submit("student_model_refresh", StudentCRUD.get_many, ids,
+                          on_done=lambda found: self._on_refreshed(ids, found))
+
+    def _on_loaded(self, students):
+        self.beginResetModel()
+        self._students = list(students)
+        self._sort_keys = [(s.student_name, s.student_id) for s in self._students]
+        self._search_keys = {s.student_id: search_keys(s.student_name) for s in self._students}
+        self.endResetModel()
+
+    def _on_refreshed(self, ids, found):
+        self._pending.difference_update(ids)
+        for student_id in ids:
+            self._remove(student_id)
+            if student_id in found:
+                self._insert(found[student_id])
+
+    def _row_of(self, student_id: int) -> int:
+        """목록에서의 위치 (없으면 -1), 이름을 모르므로 앞에서부터 찾는다"""
+        for row, student in enumerate(self._students):
+            if student.student_id == student_id:
+                return row
+        return -1
+
+    def _remove(self, student_id: int):
+        row = self._row_of(student_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._students[row]
+        del self._sort_keys[row]
+        del self._search_keys[student_id]
+        self.endRemoveRows()
+
+    def _insert(self, student: Student):
+        sort_key = (student.student_name, student.student_id)
+        row = bisect.bisect_left(self._sort_keys, sort_key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._students.insert(row, student)
+        self._sort_keys.insert(row, sort_key)
+        self._search_keys[student.student_id] = search_keys(student.student_name)
+        self.endInsertRows()
+
+
+class StudentFilterProxyModel(QSortFilterProxyModel):
+    """StudentListModel 을 이름/학년/반으로 거르는 모델
+
+    이름은 초성이 섞여 있으면 초성 검색, 아니면 이름 어디든 포함되면 통과한다 ("민수" → 김민수).
+    메모리에서 거르므로 인덱스 때문에 앞부분 일치로 제한할 필요가 없다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._name = ""
+        self._match = 'contains'
+        self._grade = None
+        self._class_num = None
+
+    def set_filter(self, name: str = "", grade: int = None, class_num: int = None):
+        self._name = name or ""
+        self._match = 'choseong' if has_choseong(normalize(self._name)) else 'contains'
+        self._grade = grade
+        self._class_num = class_num
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        student = model.student_at(source_row)
+        if self._grade and student.student_grade != self._grade:
+            return False
+        if self._class_num and student.student_class != self._class_num:
+            return False
+        return name_matches(model.search_keys_at(source_row), self._name, self._match)
+
+
+class StudentFilterBar(QWidget):
+    """이름/학년/반 필터 입력 (입력이 멈추면 filter_changed 발생)"""
+
+    filter_changed = pyqtSignal(str, object, object)  # (이름, 학년, 반)
+
+    def __init__(self, placeholder: str, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText(placeholder)
+
+        self.grade_combo = QComboBox()
+        self.grade_combo.addItem("학년 전체", None)
+        for g in range(1, 7):
+            self.grade_combo.addItem(f"{g}학년", g)
+
+        self.class_combo = QComboBox()
+        self.class_combo.addItem("반 전체", None)
+        for c in range(1, 5):
+            self.class_combo.addItem(f"{c}반", c)
+
+        layout.addWidget(self.name_input)
+        layout.addWidget(self.grade_combo)
+        layout.addWidget(self.class_combo)
+        self.setLayout(layout)
+
+        # 글자를 칠 때마다 거르지 않고 입력이 멈춘 뒤 한 번만 적용
+        self.debounce = QTimer(self)
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(FILTER_DEBOUNCE_MS)
+        self.debounce.timeout.connect(self.apply)
+
+        self.name_input.textChanged.connect(lambda _text: self.debounce.start())
+        self.name_input.returnPressed.connect(self.apply)
+        self.grade_combo.currentIndexChanged.connect(lambda _index: self.apply())
+        self.class_combo.currentIndexChanged.connect(lambda _index: self.apply())
+
+    def apply(self):
+        self.debounce.stop()
+        self.filter_changed.emit(
+            self.name_input.text().strip(),
+            self.grade_combo.currentData(),
+            self.class_combo.currentData(),
+        )
+
+
+def make_student_list_view(students: StudentListModel, filter_bar: StudentFilterBar, parent):
+    """공유 학생 목록 위에 탭 전용 필터를 씌운 목록 뷰"""
+    proxy = StudentFilterProxyModel(parent)
+    proxy.setSourceModel(students)
+    filter_bar.filter_changed.connect(proxy.set_filter)
+
+    view = QListView()
+    view.setModel(proxy)
+    view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+    view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    view.setUniformItemSizes(True)  # 행 높이를 한 번만 계산 (학생 수가 많아도 빠르게 스크롤)
+    return view
+
+
+def selected_student(view: QListView) -> Optional[Student]:
+    """목록 뷰에서 선택된 학생 (없으면 None)"""
+    indexes = view.selectionModel().selectedIndexes()
+    return indexes[0].data(STUDENT_ROLE) if indexes else None
 
-from carenote.crud import StudentCRUD, ConsultingCRUD
-from carenote.models import Student, Consulting
-from carenote.database import init_database
 
 class StudentTab(QWidget):
-    def __init__(self):
+    def __init__(self, tasks: DbTaskRunner, students: StudentListModel,
+                 writes: WriteBehindQueue = None):
         super().__init__()
+        self.tasks = tasks
+        self.students = students
+        self.writes = writes  # 지연 쓰기 대기열 (없으면 저장이 끝날 때까지 기다림)
         self.init_ui()
 
     def init_ui(self):
         layout = QVBoxLayout()
 
-        # ----- 상단: 학생 검색 / 리스트 -----
-        search_layout = QHBoxLayout()
-        self.search_name_input = QLineEdit()
-        self.search_name_input.setPlaceholderText("이름으로 검색")
-        self.search_btn = QPushButton("검색")
-        self.search_btn.clicked.connect(self.search_students)
-
-        search_layout.addWidget(self.search_name_input)
-        search_layout.addWidget(self.search_btn)
+        # ----- 상단: 학생 검색 / 리스트 (입력하는 대로 거름) -----
+        self.filter_bar = StudentFilterBar("이름 또는 초성으로 검색 (예: ㄱㅁㅅ)")
+        self.student_list = make_student_list_view(self.students, self.filter_bar, self)
+        self.student_list.selectionModel().selectionChanged.connect(self.on_student_selected)
 
-        self.student_list = QListWidget()
-        self.student_list.itemSelectionChanged.connect(self.on_student_selected)
-
-        layout.addLayout(search_layout)
+        layout.addWidget(self.filter_bar)
         layout.addWidget(self.student_list)
 
         # ----- 하단: 학생 상세 입력 폼 -----
@@ -77,14 +426,20 @@ class StudentTab(QWidget):
         self.new_btn = QPushButton("새 학생")
         self.save_btn = QPushButton("저장/업데이트")
         self.delete_btn = QPushButton("삭제")
+        self.import_btn = QPushButton("CSV 가져오기")
+        self.rollover_btn = QPushButton("학년도 진급")
 
         self.new_btn.clicked.connect(self.clear_form)
         self.save_btn.clicked.connect(self.save_student)
         self.delete_btn.clicked.connect(self.delete_student)
+        self.import_btn.clicked.connect(self.import_roster)
+        self.rollover_btn.clicked.connect(self.rollover_school_year)
 
         btn_layout.addWidget(self.new_btn)
         btn_layout.addWidget(self.save_btn)
         btn_layout.addWidget(self.delete_btn)
+        btn_layout.addWidget(self.import_btn)
+        btn_layout.addWidget(self.rollover_btn)
 
         layout.addLayout(btn_layout)
 
@@ -92,7 +447,6 @@ class StudentTab(QWidget):
 
         # 현재 선택된 student_id
         self.current_student_id = None
-        self.load_all_students()
 
     # ---------- 유틸 / 검증 ----------
 
@@ -122,26 +476,9 @@ class StudentTab(QWidget):
 
     # ---------- CRUD 동작 ----------
 
-    def load_all_students(self):
-        self.student_list.clear()
-        students = StudentCRUD.get_all()
-        for s in students:
-            self.student_list.addItem(f"{s.student_id}: {s.student_name}")
-
-    def search_students(self):
-        keyword = self.search_name_input.text().strip() or None
-        students = StudentCRUD.search(name=keyword)
-        self.student_list.clear()
-        for s in students:
-            self.student_list.addItem(f"{s.student_id}: {s.student_name}")
-
     def on_student_selected(self):
-        items = self.student_list.selectedItems()
-        if not items:
-            return
-        text = items[0].text()  # "id: name"
-        student_id = int(text.split(":")[0])
-        student = StudentCRUD.get(student_id)
+        # 목록 모델에 든 학생 정보를 그대로 쓴다 (다시 조회하지 않음)
+        student = selected_student(self.student_list)
         if not student:
             return
 
@@ -202,8 +539,12 @@ class StudentTab(QWidget):
                 student_class=class_num,
                 student_sex=sex,
             )
-            new_id = StudentCRUD.create(student)
-            QMessageBox.information(self, "완료", f"학생이 추가되었습니다. (ID: {new_id})")
+            if self.writes is not None:
+                self.queue_save(self.writes.create_student, student,
+                                message="학생 추가 요청을 저장했습니다.")
+                return
+            self.run_save(StudentCRUD.create, student,
+                          message=lambda new_id: f"학생이 추가되었습니다. (ID: {new_id})")
         else:
             # 업데이트
             updates = {
@@ -213,10 +554,39 @@ class StudentTab(QWidget):
                 "student_class": class_num,
                 "student_sex": sex,
             }
-            StudentCRUD.update(self.current_student_id, **updates)
-            QMessageBox.information(self, "완료", "학생 정보가 수정되었습니다.")
+            if self.writes is not None:
+                self.queue_save(self.writes.update_student, self.current_student_id, **updates,
+                                message="학생 정보 수정 요청을 저장했습니다.")
+                return
+            self.run_save(StudentCRUD.update, self.current_student_id, **updates,
+                          message=lambda _: "학생 정보가 수정되었습니다.")
+
+    def queue_save(self, fn, *args, message, **kwargs):
+        """지연 쓰기 대기열에 넣고 바로 알림 (목록은 DB 에 반영된 뒤 MainWindow 가 갱신)"""
+        try:
+            fn(*args, **kwargs)
+        except (ValueError, RuntimeError, OSError) as e:
+            self.show_error(f"저장 실패: {e}")
+            return
+        self.window().statusBar().showMessage(message, 3000)
+
+    def run_save(self, fn, *args, message, **kwargs):
+        """쓰기 작업을 백그라운드에서 실행 (끝날 때까지 저장 버튼 비활성화, 중단하지 않음)"""
+        student_id = self.current_student_id
+
+        def done(result):
+            self.save_btn.setEnabled(True)
+            QMessageBox.information(self, "완료", message(result))
+            # 새로 만든 학생(create 는 ID 반환) 또는 수정한 학생만 목록에 반영
+            self.students.refresh([student_id if student_id is not None else result])
+
+        def failed(error):
+            self.save_btn.setEnabled(True)
+            self.show_error(f"저장 실패: {error}")
 
-        self.load_all_students()
+        self.save_btn.setEnabled(False)
+        self.tasks.submit("student_save", fn, *args, on_done=done, on_error=failed,
+                          cancellable=False, **kwargs)
 
     def delete_student(self):
         if self.current_student_id is None:
@@ -231,13 +601,103 @@ class StudentTab(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            StudentCRUD.delete(self.current_student_id)
-            self.clear_form()
-            self.load_all_students()
+            student_id = self.current_student_id
+
+            def done(_):
+                self.clear_form()
+                self.students.refresh([student_id])
+
+            self.tasks.submit("student_delete", StudentCRUD.delete, student_id,
+                              on_done=done, cancellable=False)
+
+    def import_roster(self):
+        """CSV 명단 가져오기 (헤더: 이름, 전화번호, 학년, 반, 성별)"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "명단 가져오기", "", "CSV 파일 (*.csv)"
+        )
+        if not file_path:
+            return
+
+        self.import_btn.setEnabled(False)
+        self.tasks.submit("student_import", import_students, file_path,
+                          on_done=self.show_import_report, on_error=self.show_import_error,
+                          cancellable=False)
+
+    def show_import_error(self, error):
+        self.import_btn.setEnabled(True)
+        if isinstance(error, (OSError, ValueError)):
+            self.show_error(f"가져오기 실패: {error}")
+        else:
+            QMessageBox.critical(self, "데이터베이스 오류", str(error))
+
+    def show_import_report(self, report):
+        self.import_btn.setEnabled(True)
+        message = report.summary()
+        if report.errors:
+            # 오류가 많으면 앞부분만 표시
+            lines = [f"{line_num}행: {reason}" for line_num, reason in report.errors[:20]]
+            if len(report.errors) > 20:
+                lines.append(f"... 외 {len(report.errors) - 20}건")
+            message += "\n\n" + "\n".join(lines)
+        QMessageBox.information(self, "가져오기 완료", message)
+        self.students.load()
+
+    def rollover_school_year(self):
+        """새 학년도 진급 처리 (학년도 선택, 미리보기 후 확인)"""
+        default = rollover_year()
+        year, ok = QInputDialog.getInt(self, "학년도 진급", "진급 처리할 새 학년도:",
+                                       default, default - 1, default + 1)
+        if not ok:
+            return
+        self.rollover_btn.setEnabled(False)
+        self.tasks.submit("student_rollover", StudentCRUD.rollover, year, dry_run=True,
+                          on_done=lambda preview: self.confirm_rollover(year, preview),
+                          on_error=self.show_rollover_error, cancellable=False)
+
+    def confirm_rollover(self, year, preview):
+        warning = ""
+        if year < rollover_year():
+            warning = (f"\n\n주의: {year}학년도는 이미 진행 중입니다. "
+                       f"진급 처리하면 학생들이 한 학년 더 올라갑니다.")
+        reply = QMessageBox.question(
+            self,
+            "학년도 진급",
+            f"{year}학년도 진급 처리를 하시겠습니까?\n\n"
+            f"진급: {preview.promoted}명 (1~5학년 → 한 학년 올림, 반 유지)\n"
+            f"졸업: {preview.graduated}명 (6학년)\n\n"
+            f"현재 학년/반은 {year - 1}학년도 기록으로 남습니다.{warning}",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            self.rollover_btn.setEnabled(True)
+            return
+
+        self.tasks.submit("student_rollover", StudentCRUD.rollover, year,
+                          on_done=self.finish_rollover, on_error=self.show_rollover_error,
+                          cancellable=False)
+
+    def finish_rollover(self, result):
+        self.rollover_btn.setEnabled(True)
+        QMessageBox.information(
+            self, "완료", f"진급 {result.promoted}명, 졸업 {result.graduated}명 처리되었습니다."
+        )
+        self.clear_form()
+        self.students.load()
+
+    def show_rollover_error(self, error):
+        self.rollover_btn.setEnabled(True)
+        if isinstance(error, ValueError):
+            self.show_error(str(error))
+        else:
+            QMessageBox.critical(self, "데이터베이스 오류", str(error))
 
 class ConsultingTab(QWidget):
-    def __init__(self):
+    def __init__(self, tasks: DbTaskRunner, students: StudentListModel,
+                 writes: WriteBehindQueue = None):
         super().__init__()
+        self.tasks = tasks
+        self.students = students
+        self.writes = writes  # 지연 쓰기 대기열 (없으면 저장이 끝날 때까지 기다림)
         self.selected_student_id = None
         self.init_ui()
 
@@ -245,21 +705,15 @@ class ConsultingTab(QWidget):
         layout = QVBoxLayout()
 
         # ----- 학생 선택 영역 (이름 검색 -> 목록 선택) -----
-        student_layout = QHBoxLayout()
-        self.student_search_input = QLineEdit()
-        self.student_search_input.setPlaceholderText("학생 이름 검색")
-        self.student_search_btn = QPushButton("검색")
-        self.student_search_btn.clicked.connect(self.search_students)
-
-        self.student_search_list = QListWidget()
-        self.student_search_list.itemSelectionChanged.connect(
+        self.student_filter_bar = StudentFilterBar("학생 이름 또는 초성 검색")
+        self.student_search_list = make_student_list_view(
+            self.students, self.student_filter_bar, self
+        )
+        self.student_search_list.selectionModel().selectionChanged.connect(
             self.on_student_selected
         )
 
-        student_layout.addWidget(self.student_search_input)
-        student_layout.addWidget(self.student_search_btn)
-
-        layout.addLayout(student_layout)
+        layout.addWidget(self.student_filter_bar)
         layout.addWidget(QLabel("검색 결과에서 학생을 선택하세요"))
         layout.addWidget(self.student_search_list)
 
@@ -338,25 +792,9 @@ class ConsultingTab(QWidget):
 
     # ---------- 동작 ----------
 
-    def search_students(self):
-        keyword = self.student_search_input.text().strip() or None
-        students = StudentCRUD.search(name=keyword)
-        self.student_search_list.clear()
-        for s in students:
-            # "id: 이름 (학년/반)" 정도로 보여주기
-            extra = ""
-            if s.student_grade and s.student_class:
-                extra = f" ({s.student_grade}학년 {s.student_class}반)"
-            self.student_search_list.addItem(f"{s.student_id}: {s.student_name}{extra}")
-
     def on_student_selected(self):
-        items = self.student_search_list.selectedItems()
-        if not items:
-            self.selected_student_id = None
-            return
-        text = items[0].text()
-        student_id = int(text.split(":")[0])
-        self.selected_student_id = student_id
+        student = selected_student(self.student_search_list)
+        self.selected_student_id = student.student_id if student else None
 
     def save_consulting(self):
         if not self.validate_form():
@@ -375,10 +813,32 @@ class ConsultingTab(QWidget):
             consulting_opinion=self.opinion_edit.toPlainText().strip() or None,
             consulting_note=self.note_edit.toPlainText().strip() or None,
         )
-        cid = ConsultingCRUD.create(consulting)
+        if self.writes is not None:
+            try:
+                self.writes.create_consulting(consulting)
+            except (ValueError, RuntimeError, OSError) as e:
+                self.show_error(f"저장 실패: {e}")
+                return
+            self.window().statusBar().showMessage("상담 기록 저장 요청을 저장했습니다.", 3000)
+            self.reset_form()
+            return
+
+        self.save_btn.setEnabled(False)
+        self.tasks.submit("consulting_save", ConsultingCRUD.create, consulting,
+                          on_done=self.on_saved, on_error=self.on_save_failed,
+                          cancellable=False)
+
+    def on_save_failed(self, error):
+        self.save_btn.setEnabled(True)
+        self.show_error(f"저장 실패: {error}")
+
+    def on_saved(self, cid):
+        self.save_btn.setEnabled(True)
         QMessageBox.information(self, "완료", f"상담 기록이 추가되었습니다. (ID: {cid})")
+        # 저장이 끝난 뒤에 비워서 실패하면 입력 내용이 남아 있게 한다
+        self.reset_form()
 
-        # 폼 초기화
+    def reset_form(self):
         self.date_edit.setDate(QDate.currentDate())  # 날짜도 오늘로 초기화
         self.title_input.clear()
         self.type_combo.setCurrentIndex(0)
@@ -387,11 +847,185 @@ class ConsultingTab(QWidget):
         self.opinion_edit.clear()
         self.note_edit.clear()
 
+class ConsultingTableModel(QAbstractTableModel):
+    """상담 기록 목록 모델
+
+    ConsultingCRUD.get_page 로 첫 페이지만 불러오고, 스크롤이 끝에 닿으면 (canFetchMore/fetchMore)
+    다음 페이지를 이어 붙인다. 헤더를 누르면 DB 에서 다시 정렬해 첫 페이지부터 불러온다.
+    전문 검색 결과(관련도순, 페이지 없음)는 load_fulltext 로 상위 FULLTEXT_LIMIT 건을 한 번에 채우고,
+    더 있으면 truncated 가 True 가 된다.
+    """
+
+    # (헤더, get_page 정렬 기준 (None 이면 정렬 불가), 표시 값)
+    COLUMNS = [
+        ("ID", None, lambda c: str(c.consulting_id)),
+        ("학생", 'student', lambda c: c.student_name or "알 수 없음"),
+        ("일시", 'date', lambda c: c.consulting_date or ""),
+        ("유형", 'type', lambda c: c.consulting_type or "-"),
+        ("주제", 'title', lambda c: c.consulting_title or ""),
+    ]
+    TITLE_COLUMN = 4
+
+    # 전문 검색 결과를 화면에서 정렬할 때 쓰는 키 (CONSULTING_SORTS 와 같은 순서)
+    LOCAL_SORT_KEYS = {
+        'date': lambda c: (day_key(c.consulting_date) or 0, c.consulting_id),
+        'student': lambda c: (c.student_name or "", c.student_id,
+                              day_key(c.consulting_date) or 0, c.consulting_id),
+        'type': lambda c: (c.consulting_type or "", day_key(c.consulting_date) or 0, c.consulting_id),
+        'title': lambda c: (c.consulting_title, day_key(c.consulting_date) or 0, c.consulting_id),
+    }
+
+    # 새 조건의 첫 결과가 표시되었을 때 (첫 행 선택 / 열 너비 조정용)
+    first_page_loaded = pyqtSignal()
+
+    def __init__(self, tasks: DbTaskRunner, parent=None):
+        super().__init__(parent)
+        self.tasks = tasks
+        self._rows = []
+        self._snippets = {}         # consulting_id → 툴팁 HTML (전문 검색)
+        self._filters = {}
+        self._sort = 'date'
+        self._descending = True
+        self._paged = True          # False 면 전문 검색 결과 (더 불러올 페이지 없음)
+        self._next_cursor = None
+        self._loading = False
+        self.truncated = False      # 전문 검색 결과가 FULLTEXT_LIMIT 건에서 잘렸는지
+
+    # ---- QAbstractTableModel ----
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        consulting = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[index.column()][2](consulting)
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == self.TITLE_COLUMN:
+            return self._snippets.get(consulting.consulting_id)
+        if role == Qt.ItemDataRole.UserRole:
+            return consulting.consulting_id
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section][0]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return (not parent.isValid() and self._paged
+                and self._next_cursor is not None and not self._loading)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self._request_page(self._next_cursor)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        key = self.COLUMNS[column][1]
+        descending = order == Qt.SortOrder.DescendingOrder
+        if key is None or (key, descending) == (self._sort, self._descending):
+            return
+        self._sort, self._descending = key, descending
+
+        if not self._paged:
+            # 전문 검색 결과는 이미 모두 받아 두었으므로 화면에서 정렬
+            self.layoutAboutToBeChanged.emit()
+            self._rows.sort(key=self.LOCAL_SORT_KEYS[key], reverse=descending)
+            self.layoutChanged.emit()
+            return
+        self._request_page(None)
+
+    # ---- 불러오기 ----
+
+    def sort_column(self) -> int:
+        """현재 정렬 기준의 열 번호 (헤더 정렬 표시용)"""
+        return next(i for i, (_, key, _) in enumerate(self.COLUMNS) if key == self._sort)
+
+    def sort_order(self) -> Qt.SortOrder:
+        return Qt.SortOrder.DescendingOrder if self._descending else Qt.SortOrder.AscendingOrder
+
+    def load(self, **filters):
+        """검색 조건으로 첫 페이지부터 다시 불러오기 (조건은 ConsultingCRUD.get_page 인자)"""
+        self._filters = filters
+        self._request_page(None)
+
+    def load_fulltext(self, text: str, **filters):
+        """전문 검색 결과 표시 (관련도순, 발췌문은 주제 칸 툴팁)"""
+        self._loading = True  # 결과가 올 때까지 이전 목록의 다음 페이지 요청 막기
+        # 한 건 더 요청해 잘린 결과인지 확인
+        self.tasks.submit(
+            "consulting_list", ConsultingCRUD.fulltext_search, text,
+            limit=FULLTEXT_LIMIT + 1, highlight=("\x02", "\x03"), **filters,
+            on_done=self._on_hits, on_error=self._on_error,
+        )
+
+    def _request_page(self, cursor):
+        self._loading = True
+        self.tasks.submit(
+            "consulting_list", ConsultingCRUD.get_page, cursor=cursor,
+            sort=self._sort, descending=self._descending, **self._filters,
+            on_done=lambda page: self._on_page(page, first=cursor is None),
+            on_error=self._on_error,
+        )
+
+    def _on_page(self, page, first: bool):
+        self._loading = False
+        self._next_cursor = page.next_cursor
+        if first:
+            self.beginResetModel()
+            self._rows = list(page.items)
+            self._snippets = {}
+            self._paged = True
+            self.truncated = False
+            self.endResetModel()
+            self.first_page_loaded.emit()
+        elif page.items:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(page.items) - 1)
+            self._rows.extend(page.items)
+            self.endInsertRows()
+
+    def _on_hits(self, hits):
+        self._loading = False
+        self.truncated = len(hits) > FULLTEXT_LIMIT
+        hits = hits[:FULLTEXT_LIMIT]
+        self.beginResetModel()
+        self._rows = [hit.consulting for hit in hits]
+        self._snippets = {hit.consulting.consulting_id: self.format_snippet(hit.snippet)
+                          for hit in hits}
+        self._paged = False
+        self._next_cursor = None
+        self.endResetModel()
+        self.first_page_loaded.emit()
+
+    def _on_error(self, error):
+        self._loading = False
+        QMessageBox.critical(None, "데이터베이스 오류", str(error))
+
+    @staticmethod
+    def format_snippet(snippet: str) -> str:
+        """전문 검색 발췌문을 툴팁용 HTML 로 변환 (검색어 굵게)"""
+        text = html.escape(snippet).replace("\x02", "<b>").replace("\x03", "</b>")
+        return text.replace("\n", "<br>")
+
+    def consulting_id(self, row: int):
+        return self._rows[row].consulting_id
+
+
+# 선택한 행 앞뒤로 상세 내용을 미리 읽어 둘 행 수 (방향키로 옮길 때 조회 없이 표시)
+DETAIL_PREFETCH_ROWS = 3
+
+
 class ConsultingListTab(QWidget):
     """상담 기록 조회/검색 탭"""
 
-    def __init__(self):
+    def __init__(self, tasks: DbTaskRunner):
         super().__init__()
+        self.tasks = tasks
         self.init_ui()
 
     def init_ui(self):
@@ -404,7 +1038,7 @@ class ConsultingListTab(QWidget):
         self.search_name_input.setPlaceholderText("학생 이름")
 
         self.search_title_input = QLineEdit()
-        self.search_title_input.setPlaceholderText("상담 주제")
+        self.search_title_input.setPlaceholderText("주제/내용 검색")
 
         self.search_type_combo = QComboBox()
         self.search_type_combo.addItem("상담 유형 전체", None)
@@ -439,17 +1073,38 @@ class ConsultingListTab(QWidget):
         # ---- 목록 + 상세를 나누는 splitter ----
         splitter = QSplitter(Qt.Orientation.Vertical)
 
-        # 상단: 상담 리스트 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            ["ID", "학생", "일시", "유형", "주제"]
+        # 상단: 상담 리스트 (스크롤할 때 페이지 단위로 불러오는 모델)
+        self.model = ConsultingTableModel(self.tasks, self)
+        self.model.first_page_loaded.connect(self.on_first_page_loaded)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.selectionModel().selectionChanged.connect(self.on_row_selected)
+
+        # 헤더를 누르면 DB 에서 정렬 (기본: 일시 최신순)
+        header = self.table.horizontalHeader()
+        header.setSortIndicator(self.model.sort_column(), self.model.sort_order())
+        header.sortIndicatorChanged.connect(self.on_sort_indicator_changed)
+        self.table.setSortingEnabled(True)
+
+        # 전문 검색 결과가 잘렸을 때 안내 (전문 검색은 페이지 없이 관련도 상위만 불러온다)
+        self.truncated_label = QLabel(
+            f"검색 결과가 많아 관련도 상위 {FULLTEXT_LIMIT}건만 표시합니다. "
+            f"검색어를 더 구체적으로 입력하거나 기간을 좁혀 주세요."
         )
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.itemSelectionChanged.connect(self.on_row_selected)
+        self.truncated_label.setStyleSheet("color: #c0392b;")
+        self.truncated_label.setVisible(False)
 
-        splitter.addWidget(self.table)
+        list_widget = QWidget()
+        list_layout = QVBoxLayout()
+        list_layout.setContentsMargins(0, 0, 0, 0)
+        list_layout.addWidget(self.table)
+        list_layout.addWidget(self.truncated_label)
+        list_widget.setLayout(list_layout)
+        splitter.addWidget(list_widget)
 
         # 하단: 상세 내용
         detail_widget = QWidget()
@@ -510,58 +1165,70 @@ class ConsultingListTab(QWidget):
     # ---- 데이터 로딩/검색 ----
 
     def load_all_consultings(self):
-        consultings = ConsultingCRUD.get_all()
-        self.populate_table(consultings)
+        self.model.load()
 
     def search_consultings(self):
         title = self.search_title_input.text().strip() or None
         student_name = self.search_name_input.text().strip() or None
         consulting_type = self.search_type_combo.currentData()
 
-        # 날짜 범위 문자열로 (SQLite TEXT 비교용)
+        # 날짜 범위 (상담일 단위로 비교하므로 시각은 붙이지 않는다, 양 끝 포함)
         start_qdate = self.start_date_edit.date()
         end_qdate = self.end_date_edit.date()
 
-        start_date_str = start_qdate.toString("yyyy-MM-dd") + " 00:00:00"
-        end_date_str = end_qdate.toString("yyyy-MM-dd") + " 23:59:59"
+        start_date_str = start_qdate.toString("yyyy-MM-dd")
+        end_date_str = end_qdate.toString("yyyy-MM-dd")
 
         # 종료일이 시작일보다 빠르면 막기
         if end_qdate < start_qdate:
             QMessageBox.critical(self, "입력 오류", "종료일은 시작일보다 빠를 수 없습니다.")
             return  # 잘못된 입력이므로 검색(NEXT) 막기
 
-        consultings = ConsultingCRUD.search(
-            title=title,
+        filters = dict(
             student_name=student_name,
             consulting_type=consulting_type,
             start_date=start_date_str,
             end_date=end_date_str,
         )
-        self.populate_table(consultings)
+        # 새 검색은 아직 끝나지 않은 이전 조회/검색을 중단시킨다 (같은 key)
+        if title:
+            # 주제/내용 검색어가 있으면 전문 검색 (관련도순, 발췌문은 주제 칸 툴팁으로 표시)
+            self.model.load_fulltext(title, **filters)
+            self.table.horizontalHeader().setSortIndicatorShown(False)
+            return
 
-    def populate_table(self, consultings):
-        self.table.clearContents()
-        self.table.setRowCount(len(consultings))
+        self.table.horizontalHeader().setSortIndicatorShown(True)
+        self.model.load(**filters)
 
-        for row, c in enumerate(consultings):
-            student = StudentCRUD.get(c.student_id)
-            student_name = student.student_name if student else "알 수 없음"
+    def on_sort_indicator_changed(self, column, order):
+        # 정렬할 수 없는 열(ID)을 누르면 표시만 현재 정렬 기준으로 되돌린다
+        header = self.table.horizontalHeader()
+        header.setSortIndicatorShown(True)
+        if self.model.COLUMNS[column][1] is None:
+            header.blockSignals(True)
+            header.setSortIndicator(self.model.sort_column(), self.model.sort_order())
+            header.blockSignals(False)
 
-            self.table.setItem(row, 0, QTableWidgetItem(str(c.consulting_id)))
-            self.table.setItem(row, 1, QTableWidgetItem(student_name))
-            self.table.setItem(row, 2, QTableWidgetItem(c.consulting_date or ""))
-            self.table.setItem(row, 3, QTableWidgetItem(c.consulting_type or "-"))
-            self.table.setItem(row, 4, QTableWidgetItem(c.consulting_title or ""))
+    def on_first_page_loaded(self):
+        self.truncated_label.setVisible(self.model.truncated)
 
+        # 불러온 첫 페이지 기준으로만 열 너비를 맞춘다 (전체 행을 훑지 않음)
         self.table.resizeColumnsToContents()
 
         # 목록이 비었으면 상세 영역 초기화
-        if not consultings:
+        if self.model.rowCount() == 0:
             self.clear_detail()
         else:
             # 첫 행 자동 선택
             self.table.selectRow(0)
 
+    def selected_consulting_id(self):
+        """선택된 행의 상담 ID (없으면 None)"""
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.model.consulting_id(rows[0].row())
+
     # ---- 상세 표시 ----
 
     def clear_detail(self):
@@ -575,25 +1242,32 @@ class ConsultingListTab(QWidget):
         self.detail_note_edit.clear()
 
     def on_row_selected(self):
-        items = self.table.selectedItems()
-        if not items:
+        consulting_id = self.selected_consulting_id()
+        if consulting_id is None:
             self.clear_detail()
             return
 
-        row = items[0].row()
-        consulting_id_item = self.table.item(row, 0)
-        if not consulting_id_item:
-            self.clear_detail()
-            return
-
-        consulting_id = int(consulting_id_item.text())
-        consulting = ConsultingCRUD.get(consulting_id)
+        # 목록에는 요약만 있으므로 전체 내용은 선택할 때 불러온다
+        # (상세 캐시에 있으면 조회 없이 반환, 방향키로 빠르게 옮기면 이전 요청은 버려진다)
+        self.tasks.submit("consulting_detail", ConsultingCRUD.get_with_student, consulting_id,
+                          on_done=self.show_detail, quiet=True)
+        self.prefetch_neighbours(self.table.selectionModel().selectedRows()[0].row())
+
+    def prefetch_neighbours(self, row: int):
+        """앞뒤 DETAIL_PREFETCH_ROWS 행의 전체 내용을 백그라운드에서 상세 캐시에 미리 읽기"""
+        first = max(0, row - DETAIL_PREFETCH_ROWS)
+        last = min(self.model.rowCount(), row + DETAIL_PREFETCH_ROWS + 1)
+        neighbours = [self.model.consulting_id(r) for r in range(first, last) if r != row]
+        if neighbours:
+            self.tasks.submit("consulting_prefetch", ConsultingCRUD.get_many_with_student,
+                              neighbours, quiet=True)
+
+    def show_detail(self, consulting):
         if not consulting:
             self.clear_detail()
             return
 
-        student = StudentCRUD.get(consulting.student_id)
-        student_name = student.student_name if student else "알 수 없음"
+        student_name = consulting.student_name or "알 수 없음"
 
         self.detail_student_label.setText(student_name)
         self.detail_date_label.setText(consulting.consulting_date or "-")
@@ -611,20 +1285,29 @@ class ConsultingListTab(QWidget):
         )
 
     # ---- 프린트 관련 ---- 
-    def get_current_consulting_content(self):
-        """현재 선택된 상담의 전체 내용을 프린트용 HTML로 반환"""
-        if not self.table.selectedItems():
-            return None
-            
-        row = self.table.selectedItems()[0].row()
-        consulting_id = int(self.table.item(row, 0).text())
-        consulting = ConsultingCRUD.get(consulting_id)
-        
-        if not consulting:
-            return None
-            
-        student = StudentCRUD.get(consulting.student_id)
-        student_name = student.student_name if student else "알 수 없음"
+    def load_print_content(self, then, warning: str):
+        """선택된 상담의 전체 내용을 백그라운드에서 불러와 프린트용 HTML 로 then(html) 호출
+
+        상세 화면이 이미 불러온 기록은 상세 캐시에서 바로 반환된다.
+        """
+        consulting_id = self.selected_consulting_id()
+        if consulting_id is None:
+            QMessageBox.warning(self, "경고", warning)
+            return
+
+        def done(consulting):
+            if not consulting:
+                QMessageBox.warning(self, "경고", warning)
+                return
+            then(self.consulting_html(consulting))
+
+        self.tasks.submit("consulting_print", ConsultingCRUD.get_with_student, consulting_id,
+                          on_done=done)
+
+    @staticmethod
+    def consulting_html(consulting) -> str:
+        """상담 기록 전체 내용을 프린트용 HTML로 반환"""
+        student_name = consulting.student_name or "알 수 없음"
         
         # 상담 기록을 HTML 형식으로 포맷팅
         html = f"""
@@ -676,11 +1359,9 @@ class ConsultingListTab(QWidget):
     
     def show_print_preview(self):
         """프린트 미리보기 다이얼로그"""
-        content = self.get_current_consulting_content()
-        if not content:
-            QMessageBox.warning(self, "경고", "프린트할 상담 기록을 먼저 선택하세요.")
-            return
-        
+        self.load_print_content(self.open_print_preview, "프린트할 상담 기록을 먼저 선택하세요.")
+
+    def open_print_preview(self, content: str):
         printer = QPrinter(QPrinter.PrinterMode.HighResolution)
         preview_dialog = QPrintPreviewDialog(printer, self)
         preview_dialog.paintRequested.connect(lambda p: self.print_document(p, content))
@@ -688,11 +1369,9 @@ class ConsultingListTab(QWidget):
     
     def show_print_dialog(self):
         """직접 인쇄 다이얼로그"""
-        content = self.get_current_consulting_content()
-        if not content:
-            QMessageBox.warning(self, "경고", "프린트할 상담 기록을 먼저 선택하세요.")
-            return
-        
+        self.load_print_content(self.open_print_dialog, "프린트할 상담 기록을 먼저 선택하세요.")
+
+    def open_print_dialog(self, content: str):
         printer = QPrinter(QPrinter.PrinterMode.HighResolution)
         print_dialog = QPrintDialog(printer, self)
         if print_dialog.exec() == QPrintDialog.DialogCode.Accepted:
@@ -700,11 +1379,9 @@ class ConsultingListTab(QWidget):
     
     def export_pdf(self):
         """PDF로 저장"""
-        content = self.get_current_consulting_content()
-        if not content:
-            QMessageBox.warning(self, "경고", "PDF로 저장할 상담 기록을 먼저 선택하세요.")
-            return
-        
+        self.load_print_content(self.save_pdf, "PDF로 저장할 상담 기록을 먼저 선택하세요.")
+
+    def save_pdf(self, content: str):
         from PyQt6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getSaveFileName(
             self, 
@@ -740,18 +1417,85 @@ class ConsultingListTab(QWidget):
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # 지연 쓰기 대기열 상태 (쓰기 스레드에서 emit → GUI 스레드에서 처리)
+    writes_changed = pyqtSignal(int, object, object)
+
+    def __init__(self, replay_journal: bool = False):
+        """replay_journal: 시작 전 저널 재생에 실패했으면 True (쓰기 스레드가 다시 시도)"""
         super().__init__()
         self.setWindowTitle("CareNote - 개인상담기록 통합시스템")
 
+        # DB 작업은 모두 백그라운드 스레드에서 실행 (창이 멈추지 않도록)
+        self.tasks = DbTaskRunner(self)
+
+        # 상태 표시줄: 작업 중이면 움직이는 진행 막대 표시 (탭의 첫 로딩도 표시되도록 먼저 연결)
+        self.busy_label = QLabel("불러오는 중...")
+        self.busy_bar = QProgressBar()
+        self.busy_bar.setRange(0, 0)  # 범위 0~0 → 진행률 없이 계속 움직임
+        self.busy_bar.setMaximumWidth(120)
+        self.statusBar().addPermanentWidget(self.busy_label)
+        self.statusBar().addPermanentWidget(self.busy_bar)
+        self.on_busy_changed(0)
+        self.tasks.busy_changed.connect(self.on_busy_changed)
+
+        # 지연 쓰기: 저장은 로컬 저널에 기록하고 바로 반환, DB 반영은 쓰기 스레드가 모아서 한다
+        # 지연 쓰기를 꺼도 저널에 남은 저장을 시작 전에 반영하지 못했으면 쓰기 스레드가 다시 시도한다
+        self.write_queue = None
+        self.write_label = QLabel()
+        self.statusBar().addPermanentWidget(self.write_label)
+        self.write_label.setVisible(WRITE_BEHIND or replay_journal)
+        if WRITE_BEHIND or replay_journal:
+            self.writes_changed.connect(self.on_writes_changed)
+            self.write_queue = WriteBehindQueue(listener=self.writes_changed.emit)
+        self.writes = self.write_queue if WRITE_BEHIND else None  # 탭의 저장용
+
+        # 학생 목록은 한 번만 불러와 두 탭이 함께 쓴다
+        self.students = StudentListModel(self.tasks, self)
+        self.students.load()
+        if self.write_queue is not None:
+            self.write_queue.start()  # 이전 실행에서 저널에 남은 저장부터 반영
+
         tabs = QTabWidget()
-        tabs.addTab(StudentTab(), "학생 관리")
-        tabs.addTab(ConsultingTab(), "상담 기록")
-        tabs.addTab(ConsultingListTab(), "상담 기록 조회")
+        tabs.addTab(StudentTab(self.tasks, self.students, self.writes), "학생 관리")
+        tabs.addTab(ConsultingTab(self.tasks, self.students, self.writes), "상담 기록")
+        tabs.addTab(ConsultingListTab(self.tasks), "상담 기록 조회")
 
         self.setCentralWidget(tabs)
         self.resize(1000, 650)
 
+    def on_busy_changed(self, active: int):
+        self.busy_label.setVisible(active > 0)
+        self.busy_bar.setVisible(active > 0)
+
+    def on_writes_changed(self, pending: int, result: Optional[FlushResult], error):
+        if error is not None:
+            self.write_label.setText(f"저장 대기 {pending}건 (DB 사용 중, 다시 시도합니다)")
+        elif pending:
+            self.write_label.setText(f"저장 대기 {pending}건")
+        else:
+            self.write_label.setText("모두 저장됨")
+        if result is None:
+            return
+
+        # DB 에 반영된 학생만 목록에 반영 (새 학생은 이때 ID 가 정해진다)
+        student_ids = [new_id for entry, new_id in result.applied if entry.op.startswith('student.')]
+        if student_ids:
+            self.students.refresh(student_ids)
+        if result.failed:
+            details = "\n".join(f"- {entry.op}: {e}" for entry, e in result.failed[:5])
+            QMessageBox.warning(self, "저장 실패",
+                                f"저장 요청 {len(result.failed)}건을 반영하지 못했습니다.\n{details}")
+
+    def closeEvent(self, event):
+        # 남은 저장을 먼저 반영하고, 연결을 닫기 전에 실행 중인 작업을 정리한다
+        if self.write_queue is not None:
+            left = self.write_queue.close()
+            if left:
+                QMessageBox.warning(self, "저장 대기",
+                                    f"DB 에 반영하지 못한 저장 {left}건은 다음 실행 때 반영됩니다.")
+        self.tasks.shutdown()
+        super().closeEvent(event)
+
 def apply_basic_style(app: QApplication):
     """라이트 모드 스타일 적용"""
     app.setStyleSheet("""
@@ -778,7 +1522,7 @@ def apply_basic_style(app: QApplication):
             border: 1px solid #3498db;
         }
         
-        QListWidget, QTableWidget {
+        QListView, QTableView {
             background-color: white;
             border: 1px solid #dee2e6;
             color: #212529;
@@ -835,15 +1579,15 @@ def apply_basic_style(app: QApplication):
             background-color: transparent;
         }
         
-        QTableWidget {
+        QTableView {
             gridline-color: #dee2e6;
         }
         
-        QTableWidget::item {
+        QTableView::item {
             padding: 5px;
         }
         
-        QTableWidget::item:selected {
+        QTableView::item:selected {
             background-color: #e3f2fd;
             color: #1976d2;
         }
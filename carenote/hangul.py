@@ -0,0 +1,81 @@
+"""한글 이름 검색 보조 함수 (정규화, 초성 추출)"""
+import unicodedata
+
+# 초성 19자 (호환용 자모, 키보드로 입력되는 문자)
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+_SYLLABLE_FIRST = 0xAC00  # 가
+_SYLLABLE_LAST = 0xD7A3   # 힣
+_SYLLABLES_PER_CHOSEONG = 21 * 28  # 중성 21 × 종성 28
+
+# 문자열 범위 검색 상한 (접두어 뒤에 붙이면 그 접두어로 시작하는 모든 문자열보다 큼)
+PREFIX_UPPER = '\U0010ffff'
+
+
+def normalize(text: str) -> str:
+    """검색 키용 정규화: NFC 결합 + 앞뒤/중복 공백 제거 + 소문자
+
+    다른 시스템에서 NFD(자모 분리)로 저장된 이름도 같은 키가 된다.
+    """
+    return ' '.join(unicodedata.normalize('NFC', text or '').split()).lower()
+
+
+def is_syllable(ch: str) -> bool:
+    return _SYLLABLE_FIRST <= ord(ch) <= _SYLLABLE_LAST
+
+
+def choseong(text: str) -> str:
+    """문자열의 초성 시퀀스 반환 (예: '김민수' → 'ㄱㅁㅅ')
+
+    완성형 음절은 초성으로 바꾸고, 공백은 빼고, 나머지 문자는 그대로 둔다.
+    """
+    result = []
+    for ch in normalize(text):
+        if is_syllable(ch):
+            index = (ord(ch) - _SYLLABLE_FIRST) // _SYLLABLES_PER_CHOSEONG
+            result.append(CHOSEONG[index])
+        elif ch != ' ':
+            result.append(ch)
+    return ''.join(result)
+
+
+def has_choseong(text: str) -> bool:
+    """초성(자음만) 입력이 섞여 있는지 여부 (예: 'ㄱㅁㅅ', '김ㅁ')"""
+    return any(ch in _CHOSEONG_SET for ch in text)
+
+
+def search_keys(name: str) -> dict:
+    """students 테이블에 저장할 검색 키 컬럼 값"""
+    return {
+        'student_name_key': normalize(name),
+        'student_choseong': choseong(name),
+    }
+
+
+def name_matches(keys: dict, query: str, match: str = 'auto') -> bool:
+    """StudentCRUD 이름 검색과 같은 규칙으로 메모리에서 비교 (화면 목록 필터용)
+
+    keys 는 search_keys(이름) 값이고, match 는 'contains' / 'prefix' / 'choseong' / 'auto' 이다.
+    """
+    key = normalize(query)
+    if not key:
+        return True
+    if match == 'auto':
+        match = 'choseong' if has_choseong(key) else 'prefix'
+
+    name_key = keys['student_name_key']
+    if match == 'contains':
+        return key in name_key
+    if match == 'prefix':
+        return name_key.startswith(key)
+    if match != 'choseong':
+        raise ValueError(f"알 수 없는 이름 검색 방식: {match}")
+
+    # 초성이 앞부분과 같고, 완성형으로 입력한 글자는 같은 자리 글자와 같아야 한다
+    if not keys['student_choseong'].startswith(choseong(key)):
+        return False
+    compact = name_key.replace(' ', '')
+    return all(compact[position:position + 1] == ch
+               for position, ch in enumerate(key.replace(' ', ''))
+               if is_syllable(ch))
@@ -0,0 +1,204 @@
+"""학생 명단 가져오기 (CSV)
+
+파일을 한 행씩 읽어 generator 파이프라인으로 처리한다.
+    read_rows → normalize_rows → chunked → 중복 제거 → StudentCRUD.create_many
+한 번에 chunk_size 개의 행만 메모리에 올리므로 파일 크기와 무관하게 메모리 사용량이 일정하다.
+"""
+import codecs
+import csv
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from carenote.crud import StudentCRUD
+from carenote.database import get_connection
+from carenote.hangul import normalize
+from carenote.models import Student, GRADES, CLASSES
+
+# CSV 헤더 → 학생 필드 (소문자/공백 제거 후 비교)
+HEADER_ALIASES = {
+    'student_name': ('이름', '성명', '학생명', '학생이름', 'name', 'student_name'),
+    'student_phone': ('전화번호', '연락처', '휴대폰', 'phone', 'student_phone'),
+    'student_grade': ('학년', 'grade', 'student_grade'),
+    'student_class': ('반', 'class', 'student_class'),
+    'student_sex': ('성별', 'sex', 'gender', 'student_sex'),
+}
+
+SEX_ALIASES = {
+    '남': '남', '남자': '남', '남성': '남', 'm': '남', 'male': '남',
+    '여': '여', '여자': '여', '여성': '여', 'f': '여', 'female': '여',
+}
+
+# 파일 앞부분으로 인코딩 판별 (엑셀에서 저장한 한글 CSV 는 보통 cp949)
+_SNIFF_BYTES = 64 * 1024
+
+
+@dataclass
+class ImportReport:
+    """가져오기 결과"""
+    total: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)  # (행 번호, 사유)
+
+    def summary(self) -> str:
+        return (f"전체 {self.total}행 중 {self.inserted}명 등록, "
+                f"중복 {self.duplicates}건, 오류 {len(self.errors)}건")
+
+
+def detect_encoding(path: str) -> str:
+    """UTF-8 (BOM 포함) 이 아니면 cp949 로 간주"""
+    with open(path, 'rb') as f:
+        sample = f.read(_SNIFF_BYTES)
+    try:
+        # 잘린 멀티바이트 문자에도 실패하지 않도록 incremental decoder 사용
+        codecs.getincrementaldecoder('utf-8')().decode(sample)
+    except UnicodeDecodeError:
+        return 'cp949'
+    return 'utf-8-sig'
+
+
+def _resolve_headers(headers: List[str]) -> dict:
+    """CSV 헤더 이름 → 학생 필드 이름 매핑"""
+    lookup = {
+        alias.lower(): name
+        for name, aliases in HEADER_ALIASES.items()
+        for alias in aliases
+    }
+    mapping = {}
+    for header in headers:
+        name = lookup.get((header or '').strip().lower().replace(' ', ''))
+        if name and name not in mapping.values():
+            mapping[header] = name
+    if 'student_name' not in mapping.values():
+        raise ValueError("이름 열을 찾을 수 없습니다. (헤더: 이름/성명/name)")
+    return mapping
+
+
+def read_rows(path: str, encoding: str = None) -> Iterator[Tuple[int, dict]]:
+    """CSV 파일을 한 행씩 (행 번호, {필드: 원본 문자열}) 로 반환"""
+    encoding = encoding or detect_encoding(path)
+    with open(path, newline='', encoding=encoding) as f:
+        reader = csv.reader(f)
+        headers = next(reader, None)
+        if headers is None:
+            return
+        mapping = _resolve_headers(headers)
+        columns = [(i, mapping.get(h)) for i, h in enumerate(headers)]
+
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue  # 빈 줄
+            values = {
+                name: row[i].strip() if i < len(row) else ''
+                for i, name in columns if name
+            }
+            yield reader.line_num, values
+
+
+def _parse_number(value: str, allowed: tuple, label: str) -> Optional[int]:
+    """'3', '3학년', '2반' 같은 값을 숫자로 변환"""
+    if not value:
+        return None
+    match = re.fullmatch(r'\s*(\d+)\s*(학년|반)?\s*', value)
+    number = int(match.group(1)) if match else None
+    if number not in allowed:
+        raise ValueError(f"{label} 값이 올바르지 않습니다: {value}")
+    return number
+
+
+def normalize_row(values: dict) -> Student:
+    """원본 문자열을 스키마 허용 값으로 정규화 (실패 시 ValueError)"""
+    # 다른 시스템에서 자모 분리(NFD) 형태로 내보낸 이름도 완성형으로 저장
+    name = unicodedata.normalize('NFC', values.get('student_name', ''))
+    if not name:
+        raise ValueError("이름이 비어 있습니다.")
+
+    sex = values.get('student_sex', '')
+    if sex:
+        if sex.lower() not in SEX_ALIASES:
+            raise ValueError(f"성별 값이 올바르지 않습니다: {sex}")
+        sex = SEX_ALIASES[sex.lower()]
+
+    return Student(
+        student_name=name,
+        student_phone=values.get('student_phone') or None,
+        student_grade=_parse_number(values.get('student_grade', ''), GRADES, "학년"),
+        student_class=_parse_number(values.get('student_class', ''), CLASSES, "반"),
+        student_sex=sex or None,
+    )
+
+
+def normalize_rows(rows: Iterable[Tuple[int, dict]],
+                   report: ImportReport) -> Iterator[Tuple[int, Student]]:
+    """정규화에 실패한 행은 report.errors 에 기록하고 건너뛴다"""
+    for line_num, values in rows:
+        report.total += 1
+        try:
+            yield line_num, normalize_row(values)
+        except ValueError as e:
+            report.errors.append((line_num, str(e)))
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """size 개씩 묶어서 반환"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _student_key(student: Student) -> tuple:
+    """중복 판단 키 (이름은 검색 키와 같이 정규화, DB 의 student_name_key 와 비교)"""
+    return (normalize(student.student_name), student.student_grade, student.student_class)
+
+
+def drop_duplicates(chunk: List[Tuple[int, Student]],
+                    report: ImportReport) -> List[Student]:
+    """이미 등록된 학생(이름·학년·반 동일) 및 같은 묶음 안의 중복 제거
+
+    이름은 정규화한 검색 키로 비교하므로 NFD 로 저장된 기존 이름이나 대소문자/공백만 다른
+    이름도 같은 학생으로 본다 (idx_students_name_key 사용).
+    """
+    keys = list({normalize(s.student_name) for _, s in chunk})
+    placeholders = ', '.join(['?'] * len(keys))
+    rows = get_connection().execute(
+        f"SELECT student_name_key, student_grade, student_class FROM students "
+        f"WHERE student_name_key IN ({placeholders})",
+        keys
+    ).fetchall()
+    seen = {tuple(row) for row in rows}
+
+    students = []
+    for line_num, student in chunk:
+        key = _student_key(student)
+        if key in seen:
+            report.duplicates += 1
+            continue
+        seen.add(key)
+        students.append(student)
+    return students
+
+
+def import_students(path: str, chunk_size: int = 500, encoding: str = None,
+                    progress=None) -> ImportReport:
+    """CSV 명단을 가져와 학생을 등록하고 결과 보고서 반환
+
+    chunk_size 행마다 한 트랜잭션으로 등록하며, progress(처리한 행 수) 로 진행 상황을 알린다.
+    이전 묶음은 이미 저장되어 있으므로 파일 안의 중복도 DB 조회로 걸러진다.
+    """
+    report = ImportReport()
+    students = normalize_rows(read_rows(path, encoding), report)
+
+    for chunk in chunked(students, chunk_size):
+        new_students = drop_duplicates(chunk, report)
+        if new_students:
+            report.inserted += len(StudentCRUD.create_many(new_students))
+        if progress:
+            progress(report.total)
+
+    return report
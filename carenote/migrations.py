@@ -0,0 +1,433 @@
+"""스키마 마이그레이션 (PRAGMA user_version 기준)
+
+각 마이그레이션은 (버전, 설명, 함수) 형태로 MIGRATIONS 에 순서대로 등록한다.
+함수는 cursor 하나를 받아 DDL/DML 을 실행하며, 아직 적용되지 않은 마이그레이션은
+하나의 트랜잭션 안에서 순서대로 실행된 뒤 user_version 이 갱신된다.
+"""
+import json
+
+from carenote.hangul import search_keys
+from carenote.models import school_year
+
+
+def _v1_initial_schema(cursor):
+    """기본 테이블 (user_version 도입 전 데이터베이스는 이미 존재할 수 있음)"""
+    # students 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS students (
+            student_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_name TEXT NOT NULL,
+            student_phone TEXT,
+            student_grade INTEGER CHECK(student_grade IN (1,2,3,4,5,6)),
+            student_class INTEGER CHECK(student_class IN (1,2,3,4)),
+            student_sex TEXT CHECK(student_sex IN ('남','여')),
+            student_history TEXT DEFAULT '[]'
+        )
+    """)
+
+    # consultings 테이블
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS consultings (
+            consulting_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            consulting_title TEXT NOT NULL,
+            consulting_date TEXT DEFAULT (datetime('now','localtime')),
+            student_id INTEGER NOT NULL,
+            consulting_type TEXT CHECK(consulting_type IN ('전화','대면','기타')),
+            consulting_object TEXT CHECK(consulting_object IN ('본인','가족','교사','기타')),
+            consulting_content TEXT,
+            consulting_opinion TEXT,
+            consulting_note TEXT,
+            FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE
+        )
+    """)
+
+    # 인덱스 생성
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_consultings_student
+        ON consultings(student_id)
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_consultings_date
+        ON consultings(consulting_date)
+    """)
+
+
+def _v2_student_name_index(cursor):
+    """이름 조회 (명단 가져오기 중복 확인 등) 용 인덱스"""
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_students_name
+        ON students(student_name)
+    """)
+
+
+def _v3_consultings_fts(cursor):
+    """상담 주제/내용/소견/특이사항 전문 검색 (FTS5, 트리거로 동기화)"""
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS consultings_fts USING fts5(
+            consulting_title, consulting_content, consulting_opinion, consulting_note,
+            content='consultings', content_rowid='consulting_id',
+            tokenize='unicode61'
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS consultings_fts_ai AFTER INSERT ON consultings BEGIN
+            INSERT INTO consultings_fts(rowid, consulting_title, consulting_content,
+                                        consulting_opinion, consulting_note)
+            VALUES (new.consulting_id, new.consulting_title, new.consulting_content,
+                    new.consulting_opinion, new.consulting_note);
+        END
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS consultings_fts_ad AFTER DELETE ON consultings BEGIN
+            INSERT INTO consultings_fts(consultings_fts, rowid, consulting_title, consulting_content,
+                                        consulting_opinion, consulting_note)
+            VALUES ('delete', old.consulting_id, old.consulting_title, old.consulting_content,
+                    old.consulting_opinion, old.consulting_note);
+        END
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS consultings_fts_au
+        AFTER UPDATE OF consulting_title, consulting_content, consulting_opinion, consulting_note
+        ON consultings BEGIN
+            INSERT INTO consultings_fts(consultings_fts, rowid, consulting_title, consulting_content,
+                                        consulting_opinion, consulting_note)
+            VALUES ('delete', old.consulting_id, old.consulting_title, old.consulting_content,
+                    old.consulting_opinion, old.consulting_note);
+            INSERT INTO consultings_fts(rowid, consulting_title, consulting_content,
+                                        consulting_opinion, consulting_note)
+            VALUES (new.consulting_id, new.consulting_title, new.consulting_content,
+                    new.consulting_opinion, new.consulting_note);
+        END
+    """)
+
+    # 기존 상담 기록으로 색인 생성
+    cursor.execute("INSERT INTO consultings_fts(consultings_fts) VALUES ('rebuild')")
+
+
+def _v4_student_search_keys(cursor):
+    """이름 검색 키 (NFC 정규화 이름, 초성) 컬럼 및 인덱스"""
+    cursor.execute("ALTER TABLE students ADD COLUMN student_name_key TEXT")
+    cursor.execute("ALTER TABLE students ADD COLUMN student_choseong TEXT")
+
+    rows = cursor.execute("SELECT student_id, student_name FROM students").fetchall()
+    updates = []
+    for student_id, name in rows:
+        keys = search_keys(name)
+        updates.append((keys['student_name_key'], keys['student_choseong'], student_id))
+    cursor.executemany(
+        "UPDATE students SET student_name_key = ?, student_choseong = ? WHERE student_id = ?",
+        updates
+    )
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_students_name_key
+        ON students(student_name_key)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_students_choseong
+        ON students(student_choseong)
+    """)
+
+
+def _history_enrollments(history_json, grade, class_num, current_year):
+    """student_history JSON 을 (학년도, 학년, 반) 목록으로 변환
+
+    기존 프로그램은 학년/반을 수정할 때마다 수정 전 학년/반을 기록했으므로, 학년도 중에 반만
+    고친 경우도 항목이 남아 있다. JSON 에는 학년도가 없으므로 학년이 바뀔 때만 한 해가 지난
+    것으로 보고, 같은 학년 안에서는 마지막으로 기록된 반을 그 학년도의 반으로 쓴다.
+    현재 학년/반은 올해 학년도가 되고, 그 이전 학년은 한 해씩 거슬러 올라가며 배정한다.
+    """
+    try:
+        history = json.loads(history_json) if history_json else []
+    except ValueError:
+        history = []
+
+    entries = []
+    for item in history if isinstance(history, list) else []:
+        if not isinstance(item, dict):
+            continue
+        entry = (item.get('grade'), item.get('class'))
+        if entry[0] not in range(1, 7) or entry[1] not in range(1, 5):
+            continue
+        entries.append(entry)
+    if grade is not None or class_num is not None:
+        entries.append((grade, class_num))
+
+    # 학년이 같은 연속 항목 → 한 학년도 (마지막 반)
+    years = []
+    for entry in entries:
+        if years and years[-1][0] == entry[0]:
+            years[-1] = entry
+        else:
+            years.append(entry)
+
+    if grade is None and class_num is None:
+        # 현재 학년/반이 없으면 이력의 마지막 학년도 지난 학년도로 본다
+        return [(current_year - offset, g, c)
+                for offset, (g, c) in enumerate(reversed(years), start=1)]
+    return [(current_year - offset, g, c) for offset, (g, c) in enumerate(reversed(years))]
+
+
+def _v5_student_enrollments(cursor):
+    """학년도별 학년/반 이력 테이블 (student_history JSON 컬럼 대체)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS student_enrollments (
+            student_id INTEGER NOT NULL,
+            school_year INTEGER NOT NULL,
+            student_grade INTEGER CHECK(student_grade IN (1,2,3,4,5,6)),
+            student_class INTEGER CHECK(student_class IN (1,2,3,4)),
+            PRIMARY KEY (student_id, school_year),
+            FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE
+        )
+    """)
+
+    # 학년도별 학급 명단 조회용
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_enrollments_roster
+        ON student_enrollments(school_year, student_grade, student_class)
+    """)
+
+    current_year = school_year()
+    rows = cursor.execute(
+        "SELECT student_id, student_grade, student_class, student_history FROM students"
+    ).fetchall()
+    cursor.executemany(
+        "INSERT OR IGNORE INTO student_enrollments "
+        "(student_id, school_year, student_grade, student_class) VALUES (?, ?, ?, ?)",
+        ((student_id, *enrollment)
+         for student_id, grade, class_num, history in rows
+         for enrollment in _history_enrollments(history, grade, class_num, current_year))
+    )
+
+    # 원본 JSON 은 되돌릴 수 없으므로 컬럼을 지우지 않고 남겨 둔다 (더 이상 읽거나 쓰지 않음)
+
+
+def _v6_school_year_rollover(cursor):
+    """졸업 학년도 컬럼 및 학년도 진급 처리 기록 테이블"""
+    cursor.execute("ALTER TABLE students ADD COLUMN student_graduated INTEGER")
+
+    # 학년도마다 한 번만 진급 처리되도록 기록
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS school_year_rollovers (
+            school_year INTEGER PRIMARY KEY,
+            rolled_at TEXT NOT NULL DEFAULT (datetime('now','localtime')),
+            promoted INTEGER NOT NULL,
+            graduated INTEGER NOT NULL
+        )
+    """)
+
+
+# consulting_date 앞 10자에서 구분자(-, /, .)를 뺀 문자열 (예: '2024-03-05 10:00:00' → '20240305')
+_DAY_DIGITS = ("replace(replace(replace(substr(trim(consulting_date), 1, 10), "
+               "'-', ''), '/', ''), '.', '')")
+
+
+def _v7_consulting_day(cursor):
+    """정렬/범위 검색용 상담일 키 (yyyymmdd 정수, 형식이 다르면 0) 및 인덱스"""
+    # 가상 생성 컬럼이므로 쓰기 경로와 무관하게 항상 consulting_date 와 일치한다
+    cursor.execute(f"""
+        ALTER TABLE consultings ADD COLUMN consulting_day INTEGER
+        GENERATED ALWAYS AS (
+            CASE WHEN {_DAY_DIGITS} GLOB '[0-9][0-9][0-9][0-9][0-9][0-9][0-9][0-9]'
+                 THEN CAST({_DAY_DIGITS} AS INTEGER) ELSE 0 END
+        ) VIRTUAL
+    """)
+
+    # 학생별 조회 + 날짜순 정렬, 전체 날짜 범위 검색/정렬
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_consultings_student_day
+        ON consultings(student_id, consulting_day)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_consultings_day
+        ON consultings(consulting_day)
+    """)
+
+    # 위 두 인덱스로 대체됨
+    cursor.execute("DROP INDEX IF EXISTS idx_consultings_student")
+    cursor.execute("DROP INDEX IF EXISTS idx_consultings_date")
+
+
+def _v8_student_grade_class_index(cursor):
+    """학년/반 조건 학생 검색용 인덱스"""
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_students_grade_class
+        ON students(student_grade, student_class)
+    """)
+
+
+# consulting_stats 버킷 키 (NULL 은 기본 키로 비교할 수 없으므로 '' / 0 으로 저장)
+_STATS_KEY = """
+    {c}.consulting_day / 100,
+    COALESCE({c}.consulting_type, ''),
+    COALESCE({c}.consulting_object, ''),
+    COALESCE({s}.student_grade, 0),
+    COALESCE({s}.student_class, 0)"""
+
+_STATS_UPSERT = """
+    INSERT INTO consulting_stats
+        (month, consulting_type, consulting_object, student_grade, student_class, count)
+    {select}
+    ON CONFLICT (month, consulting_type, consulting_object, student_grade, student_class)
+    DO UPDATE SET count = count + excluded.count"""
+
+
+def _stats_row_change(row: str, sign: str) -> str:
+    """상담 기록 한 건(new/old)의 버킷 카운트를 ±1 하는 트리거 문장"""
+    student = f"(SELECT student_grade, student_class FROM students WHERE student_id = {row}.student_id)"
+    return _STATS_UPSERT.format(select=f"""
+        SELECT {_STATS_KEY.format(c=row, s='s')}, {sign}1
+        FROM (SELECT 1) LEFT JOIN {student} s ON 1 WHERE 1""") + ";"
+
+
+def _stats_student_change(row: str, sign: str) -> str:
+    """학생 한 명의 상담 기록 전체를 row(new/old) 학년/반 버킷에서 ± 하는 트리거 문장"""
+    return _STATS_UPSERT.format(select=f"""
+        SELECT {_STATS_KEY.format(c='c', s=row)}, {sign}COUNT(*)
+        FROM consultings c WHERE c.student_id = {row}.student_id
+        GROUP BY 1, 2, 3""") + ";"
+
+
+def _v9_consulting_stats(cursor):
+    """상담 통계 요약 테이블 (월 × 유형 × 대상 × 학년 × 반 별 건수, 트리거로 유지)
+
+    학년/반은 학생의 현재 학년/반 기준이며, 학생 학년/반이 바뀌면 그 학생의 건수를 옮긴다.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS consulting_stats (
+            month INTEGER NOT NULL,              -- yyyymm (날짜 형식이 다르면 0)
+            consulting_type TEXT NOT NULL,       -- 미기입은 ''
+            consulting_object TEXT NOT NULL,     -- 미기입은 ''
+            student_grade INTEGER NOT NULL,      -- 미기입은 0
+            student_class INTEGER NOT NULL,      -- 미기입은 0
+            count INTEGER NOT NULL,
+            PRIMARY KEY (month, consulting_type, consulting_object, student_grade, student_class)
+        ) WITHOUT ROWID
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS consulting_stats_ai AFTER INSERT ON consultings BEGIN
+            {_stats_row_change('new', '+')}
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS consulting_stats_ad AFTER DELETE ON consultings BEGIN
+            {_stats_row_change('old', '-')}
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS consulting_stats_au
+        AFTER UPDATE OF consulting_date, consulting_type, consulting_object, student_id
+        ON consultings BEGIN
+            {_stats_row_change('old', '-')}
+            {_stats_row_change('new', '+')}
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS consulting_stats_student_au
+        AFTER UPDATE OF student_grade, student_class ON students
+        WHEN old.student_grade IS NOT new.student_grade
+          OR old.student_class IS NOT new.student_class
+        BEGIN
+            {_stats_student_change('old', '-')}
+            {_stats_student_change('new', '+')}
+        END
+    """)
+    # ON DELETE CASCADE 로 상담 기록이 지워질 때는 학생 행이 이미 없어 학년/반을 알 수 없으므로
+    # 학생을 지우기 전에 상담 기록을 먼저 지운다 (consulting_stats_ad 가 현재 학년/반으로 차감)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS consulting_stats_student_bd
+        BEFORE DELETE ON students BEGIN
+            DELETE FROM consultings WHERE student_id = old.student_id;
+        END
+    """)
+
+    # 기존 상담 기록으로 집계
+    cursor.execute(_STATS_UPSERT.format(select=f"""
+        SELECT {_STATS_KEY.format(c='c', s='s')}, COUNT(*)
+        FROM consultings c LEFT JOIN students s ON s.student_id = c.student_id
+        WHERE 1
+        GROUP BY 1, 2, 3, 4, 5"""))
+
+
+def _v10_consulting_sort_indexes(cursor):
+    """상담 목록 유형/주제순 정렬용 인덱스 (날짜/학생순은 기존 인덱스 사용)"""
+    # 미기입(NULL) 은 행 값 비교에서 키셋 페이지를 끊으므로 '' 로 정렬한다
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_consultings_type_day
+        ON consultings(COALESCE(consulting_type, ''), consulting_day)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_consultings_title_day
+        ON consultings(consulting_title, consulting_day)
+    """)
+
+
+def _v11_write_journal_applied(cursor):
+    """지연 쓰기 저널에서 반영한 저장 요청 ID (저널을 다시 재생해도 두 번 쓰지 않도록)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS write_journal_applied (
+            entry_id TEXT PRIMARY KEY,
+            applied_at TEXT NOT NULL DEFAULT (datetime('now','localtime'))
+        ) WITHOUT ROWID
+    """)
+
+
+# (버전, 설명, 함수) - 버전은 1부터 1씩 증가해야 한다
+MIGRATIONS = [
+    (1, "기본 테이블 생성", _v1_initial_schema),
+    (2, "학생 이름 인덱스 추가", _v2_student_name_index),
+    (3, "상담 기록 전문 검색 색인 생성", _v3_consultings_fts),
+    (4, "학생 이름 검색 키 추가", _v4_student_search_keys),
+    (5, "학년/반 이력 테이블로 전환", _v5_student_enrollments),
+    (6, "학년도 진급 처리 기록 추가", _v6_school_year_rollover),
+    (7, "상담일 정렬 키 및 인덱스 추가", _v7_consulting_day),
+    (8, "학생 학년/반 인덱스 추가", _v8_student_grade_class_index),
+    (9, "상담 통계 요약 테이블 생성", _v9_consulting_stats),
+    (10, "상담 목록 정렬 인덱스 추가", _v10_consulting_sort_indexes),
+    (11, "지연 쓰기 반영 기록 테이블 생성", _v11_write_journal_applied),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_version(conn) -> int:
+    """데이터베이스의 현재 스키마 버전 반환"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn, progress=None) -> int:
+    """적용되지 않은 마이그레이션을 하나의 트랜잭션으로 실행
+
+    progress(순번, 전체 개수, 설명) 콜백으로 진행 상황을 알린다.
+    적용한 마이그레이션 개수를 반환한다 (최신 버전이면 0, DDL 실행 없음).
+    """
+    if get_version(conn) >= LATEST_VERSION:
+        return 0
+
+    if conn.in_transaction:
+        conn.commit()
+
+    # 다른 프로세스가 동시에 마이그레이션하지 못하도록 쓰기 잠금을 먼저 잡는다
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        current = get_version(conn)
+        pending = [m for m in MIGRATIONS if m[0] > current]
+        cursor = conn.cursor()
+
+        for step, (version, description, func) in enumerate(pending, start=1):
+            if progress:
+                progress(step, len(pending), f"v{version}: {description}")
+            func(cursor)
+
+        conn.execute(f"PRAGMA user_version = {LATEST_VERSION}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+    return len(pending)
@@ -1,12 +1,103 @@
 """데이터 모델"""
-import json
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict
-from datetime import datetime
+from dataclasses import dataclass, fields
+from typing import ClassVar, Optional, List, Dict, Tuple
+from datetime import date
 
+# 허용 값 (init_database 스키마의 CHECK 제약과 동일하게 유지)
+GRADES = (1, 2, 3, 4, 5, 6)
+CLASSES = (1, 2, 3, 4)
+SEXES = ('남', '여')
+CONSULTING_TYPES = ('전화', '대면', '기타')
+CONSULTING_OBJECTS = ('본인', '가족', '교사', '기타')
 
-@dataclass
-class Student:
+STUDENT_CONSTRAINTS = {
+    'student_grade': GRADES,
+    'student_class': CLASSES,
+    'student_sex': SEXES,
+}
+
+CONSULTING_CONSTRAINTS = {
+    'consulting_type': CONSULTING_TYPES,
+    'consulting_object': CONSULTING_OBJECTS,
+}
+
+
+def school_year(today: Optional[date] = None) -> int:
+    """학년도 반환 (3월 시작, 1~2월은 전년도 학년도)"""
+    today = today or date.today()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def rollover_year(today: Optional[date] = None) -> int:
+    """진급 처리할 새 학년도 기본값
+
+    진급은 학년도가 바뀌는 때(1~3월)에 한 번 한다. 새 학년도가 시작된 3월에는 올해 학년도,
+    그 밖에는 다음에 시작할 학년도 (school_year() + 1).
+    4~12월에 올해 학년도로 진급하면 진행 중인 학년도의 학생을 한 학년 더 올리게 되고,
+    1~2월에 school_year() 로 진급하면 진행 중인 학년도의 반을 지난 학년도로 기록한다.
+    """
+    today = today or date.today()
+    return school_year(today) + (0 if today.month == 3 else 1)
+
+
+def day_key(value) -> Optional[int]:
+    """날짜를 yyyymmdd 정수로 변환 (consultings.consulting_day 와 같은 규칙)
+
+    date/datetime 또는 'yyyy-MM-dd', 'yyyy/MM/dd', 'yyyy.MM.dd' 로 시작하는 문자열을 받는다.
+    형식이 다르면 None.
+    """
+    if isinstance(value, date):
+        return value.year * 10000 + value.month * 100 + value.day
+    digits = str(value or '').strip()[:10]
+    for sep in '-/.':
+        digits = digits.replace(sep, '')
+    if len(digits) == 8 and digits.isascii() and digits.isdigit():
+        return int(digits)
+    return None
+
+
+def validate_fields(fields: Dict, constraints: Dict, required=()):
+    """필드 값이 CHECK 제약을 만족하는지 확인 (위반 시 ValueError)"""
+    for name in required:
+        if name in fields and fields[name] in (None, ''):
+            raise ValueError(f"{name} 값은 필수입니다.")
+    for name, allowed in constraints.items():
+        value = fields.get(name)
+        if value is not None and value not in allowed:
+            raise ValueError(
+                f"{name} 값이 올바르지 않습니다: {value!r} "
+                f"(허용: {', '.join(map(str, allowed))})"
+            )
+
+
+class Record:
+    """슬롯 기반 레코드 공통 기능
+
+    인스턴스마다 __dict__ 를 만들지 않으므로 대량 조회 시 메모리를 적게 쓴다.
+    COLUMNS 는 필드 순서이며, CRUD 는 이 순서대로 SELECT 해서 from_row 로 바로 생성한다.
+    """
+    __slots__ = ()
+    COLUMNS: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def from_row(cls, row):
+        """COLUMNS 순서로 조회한 sqlite3 행(또는 튜플)에서 생성"""
+        return cls(*row)
+
+    def to_dict(self):
+        """딕셔너리로 변환 (None 인 필드 제외)"""
+        return {k: v for k in self.COLUMNS if (v := getattr(self, k)) is not None}
+
+
+def record(cls):
+    """@dataclass(slots=True) 적용 후 COLUMNS 설정"""
+    cls = dataclass(slots=True)(cls)
+    cls.COLUMNS = tuple(f.name for f in fields(cls))
+    return cls
+
+
+@record
+class Student(Record):
     """학생 모델"""
     student_name: str
     student_id: Optional[int] = None
@@ -14,25 +105,25 @@ class Student:
     student_grade: Optional[int] = None
     student_class: Optional[int] = None
     student_sex: Optional[str] = None
-    student_history: str = '[]'
-    
-    def get_history(self) -> List[Dict]:
-        """히스토리를 리스트로 반환"""
-        return json.loads(self.student_history)
-    
-    def add_history(self, grade: int, class_num: int):
-        """히스토리에 새 항목 추가"""
-        history = self.get_history()
-        history.append({"grade": grade, "class": class_num})
-        self.student_history = json.dumps(history, ensure_ascii=False)
-    
-    def to_dict(self):
-        """딕셔너리로 변환"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+    student_graduated: Optional[int] = None  # 졸업한 학년도 (재학 중이면 None)
 
+    def validate(self):
+        """저장 전 값 검증 (위반 시 ValueError)"""
+        values = {k: getattr(self, k) for k in ('student_name', *STUDENT_CONSTRAINTS)}
+        validate_fields(values, STUDENT_CONSTRAINTS, required=('student_name',))
 
-@dataclass
-class Consulting:
+
+@record
+class Enrollment(Record):
+    """학년도별 학년/반 (student_enrollments 테이블)"""
+    student_id: int
+    school_year: int
+    student_grade: Optional[int] = None
+    student_class: Optional[int] = None
+
+
+@record
+class Consulting(Record):
     """상담 모델"""
     consulting_title: str
     student_id: int
@@ -43,7 +134,61 @@ class Consulting:
     consulting_content: Optional[str] = None
     consulting_opinion: Optional[str] = None
     consulting_note: Optional[str] = None
-    
-    def to_dict(self):
-        """딕셔너리로 변환"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+
+    def validate(self):
+        """저장 전 값 검증 (위반 시 ValueError)"""
+        values = {k: getattr(self, k)
+                  for k in ('consulting_title', 'student_id', *CONSULTING_CONSTRAINTS)}
+        validate_fields(values, CONSULTING_CONSTRAINTS,
+                        required=('consulting_title', 'student_id'))
+        if self.consulting_date and day_key(self.consulting_date) is None:
+            raise ValueError(
+                f"consulting_date 형식이 올바르지 않습니다: {self.consulting_date!r} (예: 2024-03-05)"
+            )
+
+
+@record
+class ConsultingWithStudent(Consulting):
+    """학생 이름/학년/반을 함께 조회한 상담 기록 (목록 화면용)"""
+    student_name: Optional[str] = None
+    student_grade: Optional[int] = None
+    student_class: Optional[int] = None
+
+
+@record
+class ConsultingSummary(Record):
+    """목록 화면용 상담 요약 (본문 텍스트 제외, 전체 내용은 ConsultingCRUD.get 으로 조회)"""
+    consulting_id: int
+    consulting_title: str
+    student_id: int
+    consulting_date: Optional[str] = None
+    consulting_type: Optional[str] = None
+    student_name: Optional[str] = None
+    student_grade: Optional[int] = None
+    student_class: Optional[int] = None
+    consulting_day: int = 0  # yyyymmdd 정렬 키 (페이지 커서용)
+
+
+@dataclass
+class ConsultingSearchHit:
+    """전문 검색 결과 (상담 기록 + 강조 표시된 발췌문 + 관련도)"""
+    consulting: ConsultingWithStudent
+    snippet: str
+    rank: float  # bm25 점수, 작을수록 관련도가 높음
+
+
+@dataclass
+class Page:
+    """목록 한 페이지 (커서는 다음/이전 페이지 조회에 그대로 넘기는 불투명 문자열)"""
+    items: List
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
+    prev_cursor: Optional[str] = None  # 이전 페이지가 없으면 None
+
+
+@dataclass
+class RolloverResult:
+    """학년도 진급 처리 결과 (dry_run 이면 실제로 바뀐 것은 없음)"""
+    school_year: int  # 새 학년도
+    promoted: int     # 한 학년 올라간 학생 수
+    graduated: int    # 졸업 처리된 6학년 학생 수
+    dry_run: bool = False
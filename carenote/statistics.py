@@ -0,0 +1,115 @@
+"""상담 통계 (유형 / 대상 / 월 / 학년 / 반 별 건수)
+
+consulting_stats 요약 테이블(트리거로 유지, 마이그레이션 v9)에서 SQL 로 집계하므로
+상담 기록 수와 무관하게 버킷 수만큼만 읽는다.
+학년/반은 학생의 현재 학년/반 기준이다.
+"""
+from typing import Dict, List, Tuple
+
+from carenote.database import get_connection, transaction
+from carenote.models import day_key
+
+# 집계 기준 이름 → consulting_stats 컬럼
+DIMENSIONS = {
+    'type': 'consulting_type',
+    'object': 'consulting_object',
+    'month': 'month',
+    'grade': 'student_grade',
+    'class': 'student_class',
+}
+
+# 요약 테이블에서 미기입(NULL) 을 나타내는 값
+_MISSING = {'consulting_type': '', 'consulting_object': '', 'month': 0,
+            'student_grade': 0, 'student_class': 0}
+
+# 상담 기록에서 직접 다시 세는 쿼리 (rebuild / 검증용)
+RECOUNT_SQL = """
+    SELECT c.consulting_day / 100 AS month,
+           COALESCE(c.consulting_type, '') AS consulting_type,
+           COALESCE(c.consulting_object, '') AS consulting_object,
+           COALESCE(s.student_grade, 0) AS student_grade,
+           COALESCE(s.student_class, 0) AS student_class,
+           COUNT(*) AS count
+    FROM consultings c LEFT JOIN students s ON s.student_id = c.student_id
+    GROUP BY 1, 2, 3, 4, 5
+"""
+
+
+def _month_bound(value, label: str) -> int:
+    """날짜 조건을 yyyymm 으로 변환 (통계는 월 단위로만 자른다)"""
+    key = day_key(value)
+    if key is None:
+        raise ValueError(f"{label} 형식이 올바르지 않습니다: {value!r} (예: 2024-03-05)")
+    return key // 100
+
+
+def count_by(*dimensions: str, start_date=None, end_date=None) -> Dict:
+    """dimensions 기준 상담 건수 {값: 건수}
+
+    기준이 둘 이상이면 키는 튜플이다 (예: count_by('grade', 'class') → {(3, 2): 5, ...}).
+    미기입 값은 None 으로 반환한다. start_date / end_date 는 해당 월 전체를 포함한다.
+    """
+    if not dimensions:
+        raise ValueError("집계 기준이 필요합니다. (사용 가능: " + ', '.join(DIMENSIONS) + ")")
+    unknown = [d for d in dimensions if d not in DIMENSIONS]
+    if unknown:
+        raise ValueError(f"알 수 없는 집계 기준: {', '.join(unknown)} "
+                         f"(사용 가능: {', '.join(DIMENSIONS)})")
+
+    columns = [DIMENSIONS[d] for d in dimensions]
+    query = f"SELECT {', '.join(columns)}, SUM(count) FROM consulting_stats WHERE 1=1"
+    params = []
+    if start_date:
+        query += " AND month >= ?"
+        params.append(_month_bound(start_date, "시작일"))
+    if end_date:
+        query += " AND month <= ?"
+        params.append(_month_bound(end_date, "종료일"))
+    query += (f" GROUP BY {', '.join(columns)} HAVING SUM(count) > 0"
+              f" ORDER BY {', '.join(columns)}")
+
+    result = {}
+    for *values, count in get_connection().execute(query, params):
+        key = tuple(None if v == _MISSING[c] else v for c, v in zip(columns, values))
+        result[key if len(key) > 1 else key[0]] = count
+    return result
+
+
+def total(start_date=None, end_date=None) -> int:
+    """전체 상담 건수"""
+    return sum(count_by('month', start_date=start_date, end_date=end_date).values())
+
+
+def rebuild():
+    """요약 테이블을 상담 기록에서 다시 계산 (트리거 없이 데이터를 고친 뒤 등)"""
+    with transaction() as conn:
+        conn.execute("DELETE FROM consulting_stats")
+        conn.execute(f"""
+            INSERT INTO consulting_stats
+                (month, consulting_type, consulting_object, student_grade, student_class, count)
+            SELECT * FROM ({RECOUNT_SQL})
+        """)
+
+
+def _label(value, suffix: str = '') -> str:
+    return '미기입' if value is None else f"{value}{suffix}"
+
+
+def report(start_date=None, end_date=None) -> List[Tuple[str, List[Tuple[str, int]]]]:
+    """CLI/화면 표시용 통계 [(제목, [(항목, 건수), ...]), ...]"""
+    def section(title, dimension, fmt):
+        counts = count_by(dimension, start_date=start_date, end_date=end_date)
+        return title, [(fmt(value), count) for value, count in counts.items()]
+
+    def month_label(month):
+        return '날짜 미상' if month is None else f"{month // 100}-{month % 100:02d}"
+
+    grade_class = count_by('grade', 'class', start_date=start_date, end_date=end_date)
+    return [
+        section("상담 유형별", 'type', _label),
+        section("상담 대상별", 'object', _label),
+        section("월별", 'month', month_label),
+        section("학년별", 'grade', lambda g: _label(g, '학년')),
+        ("학년/반별", [(f"{_label(g, '학년')} {_label(c, '반')}", count)
+                     for (g, c), count in grade_class.items()]),
+    ]
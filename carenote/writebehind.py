@@ -0,0 +1,430 @@
+"""저장 지연 쓰기 (write-behind) 대기열
+
+느린 공유 드라이브에서 저장할 때마다 화면이 멈추지 않도록, 저장 요청을 PC 로컬의 저널 파일에
+먼저 기록(fsync)하고 바로 반환한 뒤, 백그라운드 스레드가 여러 요청을 모아 한 트랜잭션으로 반영한다.
+
+- 저널은 한 줄에 JSON 하나: 저장 요청 {"id", "op", "data"} 또는 반영 완료 {"done": [id, ...]}
+- 요청을 반영하는 트랜잭션에서 write_journal_applied 에 ID 를 함께 기록하므로, 반영 직후
+  저널에 완료를 남기기 전에 종료되어 다시 재생해도 두 번 쓰지 않는다.
+- 비정상 종료로 저널에 남은 요청은 다음 시작 때 반영한다 (WriteBehindQueue.start / replay_journal).
+- 저널 파일은 프로세스마다 따로 쓴다. 쓰는 동안 배타적 파일 잠금을 잡고, 이미 다른 프로세스가
+  쓰고 있으면 번호 붙은 저널(write_journal.1.jsonl ...)을 쓴다. 잠금은 프로세스가 끝나면 OS 가
+  풀어 주므로, 잠글 수 있는 저널은 종료된 프로세스가 남긴 것이다.
+- DB 가 잠겨 있으면(SQLITE_BUSY) 간격을 늘려 가며 다시 시도한다.
+"""
+import glob
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from carenote.config import (
+    WRITE_BATCH_DELAY, WRITE_BATCH_SIZE, WRITE_CLOSE_TIMEOUT, WRITE_JOURNAL_PATH,
+    WRITE_RETRY_MAX_DELAY
+)
+from carenote.crud import ConsultingCRUD, StudentCRUD
+from carenote.database import transaction
+from carenote.models import Consulting, Student
+
+try:
+    import msvcrt
+except ImportError:  # Windows 가 아니면 fcntl
+    msvcrt = None
+    import fcntl
+
+# 첫 재시도까지 기다리는 시간 (초), 실패할 때마다 두 배 (WRITE_RETRY_MAX_DELAY 까지)
+RETRY_START_DELAY = 0.5
+
+# student.update 에서 바꿀 수 있는 컬럼 (저널 내용이 그대로 SQL 컬럼 이름이 되므로 제한)
+_STUDENT_UPDATE_COLUMNS = frozenset(Student.COLUMNS) - {'student_id'}
+
+
+def _create_student(data: dict) -> int:
+    return StudentCRUD.create(Student(**data))
+
+
+def _update_student(data: dict) -> int:
+    updates = data['updates']
+    unknown = set(updates) - _STUDENT_UPDATE_COLUMNS
+    if unknown:
+        raise ValueError(f"수정할 수 없는 항목: {', '.join(sorted(unknown))}")
+    StudentCRUD.update(data['student_id'], **updates)
+    return data['student_id']
+
+
+def _create_consulting(data: dict) -> int:
+    return ConsultingCRUD.create(Consulting(**data))
+
+
+# 저장 요청 종류 → DB 반영 함수 (생성/수정된 ID 반환)
+OPERATIONS = {
+    'student.create': _create_student,
+    'student.update': _update_student,
+    'consulting.create': _create_consulting,
+}
+
+
+@dataclass
+class JournalEntry:
+    """저널에 기록된 저장 요청 하나"""
+    entry_id: str
+    op: str
+    data: dict
+
+    def to_record(self) -> dict:
+        return {'id': self.entry_id, 'op': self.op, 'data': self.data}
+
+
+@dataclass
+class FlushResult:
+    """한 번의 일괄 반영 결과"""
+    applied: List[Tuple[JournalEntry, int]] = field(default_factory=list)       # (요청, ID)
+    failed: List[Tuple[JournalEntry, Exception]] = field(default_factory=list)  # 반영 불가, 버림
+    skipped: List[JournalEntry] = field(default_factory=list)  # 이미 반영된 요청 (저널 재생)
+
+
+class _FileLock:
+    """프로세스 사이의 배타적 파일 잠금 (프로세스가 끝나면 OS 가 푼다)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        """기다리지 않고 잠금 시도, 다른 곳에서 잡고 있으면 False"""
+        if self._file is not None:
+            return True
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        f = open(self.path, 'a+b')
+        try:
+            if msvcrt:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return False
+        self._file = f
+        return True
+
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            if msvcrt:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+
+def _numbered_path(path: str, number: int) -> str:
+    """같은 이름의 번호 붙은 저널 경로 (0 이면 path 그대로)"""
+    if number == 0:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{number}{ext}"
+
+
+class Journal:
+    """추가 전용 저널 파일 (기록할 때마다 fsync)
+
+    한 저널에는 한 프로세스만 쓴다. 쓰기 전에 lock() 으로 잠그며, 보통은 claim() 으로
+    다른 프로세스가 쓰지 않는 저널을 잡는다. 같은 프로세스 안의 동시 접근은 호출한 쪽에서 막는다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = _FileLock(path + '.lock')
+
+    @classmethod
+    def claim(cls, path: str) -> 'Journal':
+        """path 또는 번호 붙은 저널 중 다른 프로세스가 쓰지 않는 첫 저널을 잠가서 반환"""
+        for number in itertools.count():
+            journal = cls(_numbered_path(path, number))
+            if journal.lock():
+                return journal
+
+    @classmethod
+    def family(cls, path: str) -> List['Journal']:
+        """path 와 번호 붙은 저널 중 파일이 있는 것 (번호순)"""
+        root, ext = os.path.splitext(path)
+        numbers = []
+        for candidate in glob.glob(f"{glob.escape(root)}.*{ext}"):
+            number = candidate[len(root) + 1:len(candidate) - len(ext)]
+            if number.isdigit() and int(number) > 0:
+                numbers.append(int(number))
+        paths = [_numbered_path(path, number) for number in [0] + sorted(numbers)]
+        return [cls(p) for p in paths if os.path.exists(p)]
+
+    def lock(self) -> bool:
+        """배타적 잠금 (다른 프로세스가 쓰고 있으면 False)"""
+        return self._lock.acquire()
+
+    def unlock(self):
+        self._lock.release()
+
+    def append(self, records: List[dict]):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def pending(self) -> List[JournalEntry]:
+        """반영 완료 기록이 없는 요청 (기록한 순서대로)"""
+        entries = {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # 기록 도중 종료되어 잘린 줄
+                    if not isinstance(record, dict):
+                        continue
+                    if 'done' in record:
+                        done = record['done']
+                        for entry_id in done if isinstance(done, list) else ():
+                            if isinstance(entry_id, str):
+                                entries.pop(entry_id, None)
+                        continue
+                    # JSON 으로는 올바르지만 형식이 다른 줄(다른 버전이 쓴 기록 등)은 건너뜀
+                    entry_id, op, data = record.get('id'), record.get('op'), record.get('data')
+                    if isinstance(entry_id, str) and isinstance(op, str) and isinstance(data, dict):
+                        entries[entry_id] = JournalEntry(entry_id, op, data)
+        except FileNotFoundError:
+            return []
+        return list(entries.values())
+
+    def truncate(self):
+        """모든 요청이 반영된 뒤 파일 비우기"""
+        if os.path.exists(self.path):
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def apply_entries(entries: List[JournalEntry], prune_ids: List[str] = ()) -> FlushResult:
+    """저장 요청들을 한 트랜잭션으로 반영
+
+    이미 반영된 요청(write_journal_applied 에 ID 가 있음)은 건너뛰고, 검증 실패/삭제된 학생 등으로
+    반영할 수 없는 요청은 그 요청만 되돌려 failed 로 돌려준다. DB 잠김(SQLITE_BUSY) 같은
+    sqlite3.OperationalError 는 그대로 올려 보내 호출한 쪽이 전체를 다시 시도하게 한다.
+    prune_ids 는 저널에서 지워져 더 이상 재생될 수 없는 요청 ID 로, 같은 트랜잭션에서
+    write_journal_applied 에서 지운다.
+    """
+    result = FlushResult()
+    with transaction() as conn:
+        conn.executemany("DELETE FROM write_journal_applied WHERE entry_id = ?",
+                         [(entry_id,) for entry_id in prune_ids])
+        for entry in entries:
+            try:
+                with transaction():  # 요청별 SAVEPOINT (실패한 요청만 되돌림)
+                    cursor = conn.execute(
+                        "INSERT OR IGNORE INTO write_journal_applied (entry_id) VALUES (?)",
+                        (entry.entry_id,)
+                    )
+                    if cursor.rowcount == 0:
+                        result.skipped.append(entry)
+                        continue
+                    operation = OPERATIONS.get(entry.op)
+                    if operation is None:
+                        raise ValueError(f"알 수 없는 저장 요청: {entry.op}")
+                    result.applied.append((entry, operation(entry.data)))
+            except sqlite3.OperationalError:
+                raise
+            except Exception as e:
+                result.failed.append((entry, e))
+    return result
+
+
+def replay_journal(path: str = WRITE_JOURNAL_PATH) -> FlushResult:
+    """저널에 남은 요청을 바로 반영하고 저널 비우기 (지연 쓰기를 끈 상태로 시작할 때)
+
+    실행 중인 다른 프로세스가 쓰고 있는 저널은 건너뛴다. DB 가 잠겨 있으면
+    sqlite3.OperationalError 를 그대로 올려 보내며, 저널은 남아 있어 나중에 다시 반영할 수 있다.
+    """
+    result = FlushResult()
+    for journal in Journal.family(path):
+        if not journal.lock():
+            continue
+        try:
+            entries = journal.pending()
+            if entries:
+                flushed = apply_entries(entries)
+                journal.truncate()
+                result.applied += flushed.applied
+                result.failed += flushed.failed
+                result.skipped += flushed.skipped
+        finally:
+            journal.unlock()
+    return result
+
+
+class WriteBehindQueue:
+    """저장 요청 대기열 (저널에 기록하고 바로 반환, 백그라운드 스레드가 모아서 반영)
+
+    listener(pending, result, error) 는 요청이 들어오거나 반영을 시도할 때마다 호출된다.
+    pending 은 아직 반영되지 않은 요청 수, result 는 방금 끝난 일괄 반영 결과(FlushResult, 없으면
+    None), error 는 재시도할 오류(없으면 None) 이다. 쓰기 스레드에서 호출될 수 있다.
+    """
+
+    def __init__(self, journal_path: str = WRITE_JOURNAL_PATH,
+                 listener: Callable[[int, Optional[FlushResult], Optional[Exception]], None] = None,
+                 batch_size: int = WRITE_BATCH_SIZE, batch_delay: float = WRITE_BATCH_DELAY):
+        self.journal_path = journal_path
+        self.journal = Journal.claim(journal_path)  # 이 프로세스 전용 저널 (close 까지 잠금)
+        self.listener = listener
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self._cond = threading.Condition()  # _queue / 저널 파일 보호
+        self._queue = []           # 아직 반영하지 않은 요청
+        self._in_flight = 0        # 반영 중인 요청 수
+        self._journaled_done = []  # 저널에 완료로 기록된 ID (저널을 비우면 prune 대상)
+        self._prunable = []        # 다음 반영 때 write_journal_applied 에서 지울 ID
+        self._stopping = False
+        self._deadline = None
+        self._thread = None
+
+    # ---- 요청 ----
+
+    def create_student(self, student: Student) -> str:
+        student.validate()
+        return self.submit('student.create', student.to_dict())
+
+    def update_student(self, student_id: int, **updates) -> str:
+        unknown = set(updates) - _STUDENT_UPDATE_COLUMNS
+        if unknown:
+            raise ValueError(f"수정할 수 없는 항목: {', '.join(sorted(unknown))}")
+        return self.submit('student.update', {'student_id': student_id, 'updates': updates})
+
+    def create_consulting(self, consulting: Consulting) -> str:
+        consulting.validate()
+        return self.submit('consulting.create', consulting.to_dict())
+
+    def submit(self, op: str, data: dict) -> str:
+        """저장 요청을 저널에 기록하고 대기열에 넣은 뒤 요청 ID 반환 (DB 반영은 나중에)"""
+        if op not in OPERATIONS:
+            raise ValueError(f"알 수 없는 저장 요청: {op}")
+        entry = JournalEntry(uuid.uuid4().hex, op, data)
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("저장 대기열이 종료되었습니다.")
+            self.journal.append([entry.to_record()])
+            self._queue.append(entry)
+            pending = len(self._queue) + self._in_flight
+            self._cond.notify()
+        self._notify(pending, None, None)
+        return entry.entry_id
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._queue) + self._in_flight
+
+    # ---- 시작 / 종료 ----
+
+    def start(self):
+        """쓰기 스레드 시작 (이전 실행에서 저널에 남은 요청부터 반영)
+
+        종료된 다른 프로세스가 남긴 저널의 요청도 이 저널로 옮겨 함께 반영한다. 옮긴 뒤 원래 저널을
+        비우기 전에 종료되어 두 번 재생되더라도, write_journal_applied 로 한 번만 반영된다.
+        """
+        with self._cond:
+            for orphan in Journal.family(self.journal_path):
+                if orphan.path == self.journal.path or not orphan.lock():
+                    continue
+                try:
+                    entries = orphan.pending()
+                    if entries:
+                        self.journal.append([entry.to_record() for entry in entries])
+                    orphan.truncate()
+                finally:
+                    orphan.unlock()
+            self._queue[:0] = self.journal.pending()
+            pending = len(self._queue)
+        self._thread = threading.Thread(target=self._run, name='carenote-write-behind',
+                                        daemon=True)
+        self._thread.start()
+        self._notify(pending, None, None)
+
+    def close(self, timeout: float = WRITE_CLOSE_TIMEOUT) -> int:
+        """남은 요청을 반영하고 스레드 종료, 반영하지 못한 요청 수 반환 (저널에 남아 다음에 반영)"""
+        with self._cond:
+            self._stopping = True
+            self._deadline = time.monotonic() + timeout
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout + 1)
+        if self._thread is None or not self._thread.is_alive():
+            self.journal.unlock()
+        return self.pending_count()
+
+    # ---- 쓰기 스레드 ----
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                stopping = self._stopping
+            if not stopping:
+                time.sleep(self.batch_delay)  # 연달아 들어오는 저장을 한 번에 모은다
+
+            with self._cond:
+                batch = self._queue[:self.batch_size]
+                del self._queue[:len(batch)]
+                self._in_flight = len(batch)
+                prune, self._prunable = self._prunable, []
+
+            result = self._flush(batch, prune)
+            with self._cond:
+                self._in_flight = 0
+                if result is None:
+                    # 종료 시간 안에 반영하지 못함 → 저널에 남겨 다음 시작 때 반영
+                    self._queue[:0] = batch
+                    self._prunable = prune + self._prunable
+                    return
+                done = [entry.entry_id for entry in batch]
+                self.journal.append([{'done': done}])
+                self._journaled_done.extend(done)
+                if not self._queue:
+                    # 남은 요청이 없으면 저널을 비우고, 다시 재생될 수 없는 ID 는 다음 반영 때 정리
+                    self.journal.truncate()
+                    self._prunable.extend(self._journaled_done)
+                    self._journaled_done = []
+                pending = len(self._queue)
+            self._notify(pending, result, None)
+
+    def _flush(self, batch: List[JournalEntry], prune: List[str]) -> Optional[FlushResult]:
+        """batch 반영 (DB 오류면 간격을 늘려 가며 재시도, 종료 시간이 지나면 None)"""
+        delay = RETRY_START_DELAY
+        while True:
+            try:
+                return apply_entries(batch, prune)
+            except sqlite3.OperationalError as e:
+                # 잠김(SQLITE_BUSY) 외에 공유 드라이브 연결이 잠깐 끊긴 경우도 다시 시도
+                with self._cond:
+                    pending = len(self._queue) + self._in_flight
+                    deadline = self._deadline
+                self._notify(pending, None, e)
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    return None
+                time.sleep(delay)
+                delay = min(delay * 2, WRITE_RETRY_MAX_DELAY)
+
+    def _notify(self, pending: int, result: Optional[FlushResult], error: Optional[Exception]):
+        if self.listener:
+            self.listener(pending, result, error)
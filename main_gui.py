@@ -1,19 +1,32 @@
 from PyQt6.QtWidgets import QApplication
+import sqlite3
 import sys
 
 from qt_material import apply_stylesheet
 
-from carenote.database import init_database
+from carenote.config import WRITE_BEHIND
+from carenote.database import init_database, close_all_connections
 from carenote.gui import MainWindow, apply_basic_style
+from carenote.writebehind import replay_journal
 
 if __name__ == "__main__":
     init_database()
+    replay_later = False
+    if not WRITE_BEHIND:
+        # 지연 쓰기를 끈 뒤에도 저널에 남은 저장은 반영 (켜져 있으면 MainWindow 의 대기열이 반영)
+        try:
+            replay_journal()
+        except sqlite3.OperationalError as e:
+            # DB 가 잠겨 있어도 시작은 막지 않는다 (MainWindow 의 쓰기 스레드가 다시 시도)
+            print(f"저널에 남은 저장을 반영하지 못했습니다: {e} (백그라운드에서 다시 시도합니다)")
+            replay_later = True
 
     app = QApplication(sys.argv)
     apply_basic_style(app)
+    app.aboutToQuit.connect(close_all_connections)
 
     # apply_stylesheet(app, theme='dark_teal.xml')
 
-    window = MainWindow()
+    window = MainWindow(replay_journal=replay_later)
     window.show()
     sys.exit(app.exec())
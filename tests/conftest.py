@@ -0,0 +1,13 @@
+import pytest
+
+from carenote import database
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """임시 파일 데이터베이스 (테스트마다 새로 생성)"""
+    database.close_all_connections()
+    monkeypatch.setattr(database, 'DB_PATH', str(tmp_path / 'test.db'))
+    database.init_database(progress=None)
+    yield database.get_connection()
+    database.close_all_connections()
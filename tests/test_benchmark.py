@@ -0,0 +1,13 @@
+"""성능 측정 스크립트가 계속 실행되는지 확인 (아주 작은 데이터로)"""
+import pytest
+
+import benchmark
+from carenote import database
+
+
+@pytest.mark.parametrize('name', list(benchmark.BENCHMARKS))
+def test_benchmark_runs(name, capsys):
+    path, profile = database.DB_PATH, database.DB_PROFILE
+    benchmark.main([name, '--scale', '0.002'])
+    assert f"[{name}]" in capsys.readouterr().out
+    assert (database.DB_PATH, database.DB_PROFILE) == (path, profile)
@@ -0,0 +1,18 @@
+"""CLI 메뉴 테스트"""
+from carenote import cli
+from carenote.crud import StudentCRUD
+from carenote.models import Student, rollover_year
+
+
+def test_rollover_reprompts_on_invalid_year(db, monkeypatch, capsys):
+    StudentCRUD.create(Student("김민수", student_grade=3))
+    answers = iter(['20x7', '', 'n'])
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+
+    cli.rollover_school_year()
+
+    out = capsys.readouterr().out
+    assert "숫자로 입력하세요" in out
+    assert f"{rollover_year()}학년도: 진급 1명, 졸업 0명" in out
+    assert "취소되었습니다." in out
+    assert StudentCRUD.get(1).student_grade == 3
@@ -0,0 +1,921 @@
+"""데이터베이스 스키마 / 쿼리 계획 테스트"""
+import re
+import sqlite3
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from carenote import database
+from carenote.crud import ConsultingCRUD, StudentCRUD, CONSULTING_COLUMNS, CONSULTING_ORDER, \
+    CONSULTING_SORTS, JOINED_CONSULTING_ORDER, search_cache_clear, search_cache_info, session
+from carenote.hangul import name_matches, search_keys
+from carenote.models import Consulting, RolloverResult, Student, rollover_year, school_year
+
+
+def query_plan(conn, sql, params=()):
+    """EXPLAIN QUERY PLAN 의 detail 목록"""
+    return [row['detail'] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+def test_consulting_day_normalizes_date_formats(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    dates = ['2024-03-05 00:00:00', '2024/03/05', '2024.03.05 14:30', '20240305', 'unknown']
+    for date in dates:
+        db.execute(
+            "INSERT INTO consultings (consulting_title, student_id, consulting_date) VALUES (?, ?, ?)",
+            ("상담", student_id, date)
+        )
+    days = [row[0] for row in db.execute("SELECT consulting_day FROM consultings ORDER BY consulting_id")]
+    assert days == [20240305, 20240305, 20240305, 20240305, 0]
+
+
+def test_search_date_range_covers_mixed_formats(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ConsultingCRUD.create_many([
+        Consulting("전날", student_id, consulting_date='2024-03-04 23:59:59'),
+        Consulting("당일 GUI", student_id, consulting_date='2024-03-05 00:00:00'),
+        Consulting("당일 슬래시", student_id, consulting_date='2024/03/05'),
+        Consulting("종료일 오후", student_id, consulting_date='2024-03-06 18:00:00'),
+        Consulting("다음날", student_id, consulting_date='2024.03.07'),
+    ])
+
+    results = ConsultingCRUD.search(start_date='2024-03-05', end_date='2024-03-06')
+
+    # 최신순, 같은 날이면 나중에 등록한 기록 먼저
+    assert [c.consulting_title for c in results] == ["종료일 오후", "당일 슬래시", "당일 GUI"]
+
+
+def test_invalid_date_is_rejected(db):
+    with pytest.raises(ValueError):
+        ConsultingCRUD.search(start_date='3월 5일')
+    with pytest.raises(ValueError):
+        ConsultingCRUD.create_many([Consulting("상담", 1, consulting_date='지난주')])
+
+
+def test_get_by_student_uses_student_day_index(db):
+    plan = query_plan(
+        db,
+        f"SELECT {CONSULTING_COLUMNS} FROM consultings WHERE student_id = ? "
+        f"ORDER BY {CONSULTING_ORDER}",
+        (1,)
+    )
+    assert any('idx_consultings_student_day' in detail for detail in plan)
+    assert not any('TEMP B-TREE' in detail for detail in plan)
+
+
+def test_date_range_search_uses_day_index(db):
+    query, params = ConsultingCRUD._search_query(start_date='2024-03-01', end_date='2024-03-31')
+    plan = query_plan(db, query + f" ORDER BY {JOINED_CONSULTING_ORDER}", params)
+    assert any('idx_consultings_day (consulting_day>? AND consulting_day<?)' in detail
+               for detail in plan)
+    assert not any('TEMP B-TREE' in detail for detail in plan)
+
+
+def test_page_cursor_seeks_on_day_index(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ConsultingCRUD.create_many([
+        Consulting(f"상담 {i}", student_id, consulting_date=f"2024-03-{i % 28 + 1:02d}")
+        for i in range(30)
+    ])
+
+    first = ConsultingCRUD.get_page(page_size=10)
+    second = ConsultingCRUD.get_page(page_size=10, cursor=first.next_cursor)
+    everything = ConsultingCRUD.search_summaries()
+
+    assert [c.consulting_id for c in first.items + second.items] == \
+        [c.consulting_id for c in everything[:20]]
+    assert [c.consulting_day for c in everything] == \
+        sorted((c.consulting_day for c in everything), reverse=True)
+
+    query, params = ConsultingCRUD._search_query(columns='summary')
+    plan = query_plan(
+        db,
+        query + " AND (c.consulting_day, c.consulting_id) < (?, ?) "
+                f"ORDER BY {JOINED_CONSULTING_ORDER} LIMIT 11",
+        params + [20240315, 100]
+    )
+    assert any('idx_consultings_day' in detail for detail in plan)
+    assert not any('TEMP B-TREE' in detail for detail in plan)
+
+
+
+@pytest.mark.parametrize('sort', list(CONSULTING_SORTS))
+@pytest.mark.parametrize('descending', [True, False])
+def test_page_sorts_walk_all_rows(db, sort, descending):
+    # 같은 이름의 학생, 미기입 유형, 같은 날짜/주제가 섞여 있어도 빠짐·중복 없이 정렬되어야 한다
+    ids = StudentCRUD.create_many([Student("김민수"), Student("김민수"), Student("이영희")])
+    ConsultingCRUD.create_many([
+        Consulting(f"상담 {i % 4}", ids[i % 3], consulting_date=f"2024-03-{i % 5 + 1:02d}",
+                   consulting_type=(None, '전화', '대면')[i % 3 - 1])
+        for i in range(23)
+    ])
+    sort_key = {
+        'date': lambda c: (c.consulting_day,),
+        'student': lambda c: (c.student_name, c.student_id, c.consulting_day),
+        'type': lambda c: (c.consulting_type or '', c.consulting_day),
+        'title': lambda c: (c.consulting_title, c.consulting_day),
+    }[sort]
+    expected = sorted(ConsultingCRUD.search_summaries(),
+                      key=lambda c: (*sort_key(c), c.consulting_id), reverse=descending)
+
+    pages = [ConsultingCRUD.get_page(page_size=4, sort=sort, descending=descending)]
+    while pages[-1].next_cursor:
+        pages.append(ConsultingCRUD.get_page(page_size=4, cursor=pages[-1].next_cursor,
+                                             sort=sort, descending=descending))
+    assert [c.consulting_id for page in pages for c in page.items] == \
+        [c.consulting_id for c in expected]
+
+    # 이전 페이지 커서로 돌아가면 같은 페이지
+    back = ConsultingCRUD.get_page(page_size=4, cursor=pages[2].prev_cursor,
+                                   sort=sort, descending=descending)
+    assert back.items == pages[1].items
+
+
+def test_page_unknown_sort(db):
+    with pytest.raises(ValueError):
+        ConsultingCRUD.get_page(sort='teacher')
+
+
+# ---------- 쿼리 계획 회귀 테스트 ----------
+# StudentCRUD / ConsultingCRUD 가 실제로 실행하는 SQL 을 trace 로 모아 EXPLAIN QUERY PLAN 을 확인한다.
+# 인덱스 없이 테이블 전체를 읽는 'SCAN 테이블' 이 나오면 실패한다.
+
+# 부분 문자열 검색 (LIKE '%...%') 은 인덱스를 쓸 수 없으므로, 그 조건만 걸린 테이블의 전체 스캔은 허용
+# (같은 테이블에 날짜/유형 같은 다른 조건이 있거나 다른 테이블이면 계속 확인)
+SUBSTRING_LIKE = re.compile(r"(?:\b(\w+)\.)?\w+ LIKE '%")
+
+# 전체 학생을 대상으로 하는 작업 (한 번에 모든 행을 바꾸므로 스캔이 정상)
+SCAN_ALLOWED_METHODS = ('StudentCRUD.rollover',)
+
+# SQL 을 실행하지 않는 메서드 (캐시 관리)
+NO_SQL_METHODS = ('StudentCRUD.cache_info', 'StudentCRUD.cache_clear',
+                  'ConsultingCRUD.cache_info', 'ConsultingCRUD.cache_clear')
+
+STUDENT_FILTERS = {'name': '김', 'grade': 3, 'class_num': 2}
+STUDENT_NAME_INPUTS = {'contains': '민', 'prefix': '김', 'choseong': 'ㄱㅁ', 'auto': '김ㅁ'}
+
+CONSULTING_FILTERS = {
+    'title': '상담', 'student_name': '김', 'consulting_type': '대면',
+    'start_date': '2024-03-01', 'end_date': '2024-06-30',
+}
+
+
+def _combinations(filters: dict):
+    """선택 필터의 모든 조합 (빈 조합 포함)"""
+    names = list(filters)
+    for mask in range(2 ** len(names)):
+        yield {n: filters[n] for i, n in enumerate(names) if mask & (1 << i)}
+
+
+def _student_search_kwargs():
+    for kwargs in _combinations(STUDENT_FILTERS):
+        if 'name' not in kwargs:
+            yield kwargs
+            continue
+        for match, name in STUDENT_NAME_INPUTS.items():
+            yield {**kwargs, 'name': name, 'match': match}
+
+
+def _next_page(get_page, **kwargs):
+    """첫 페이지와 커서로 이어지는 다음/이전 페이지까지 조회"""
+    page = get_page(page_size=5, **kwargs)
+    if page.next_cursor:
+        page = get_page(page_size=5, cursor=page.next_cursor, **kwargs)
+        if page.prev_cursor:
+            get_page(page_size=5, cursor=page.prev_cursor, **kwargs)
+
+
+def _crud_cases():
+    """(이름, 호출) 목록 - 각 호출은 시드 데이터(학생 1~200, 상담 1~2000) 를 기준으로 한다"""
+    cases = [
+        ("StudentCRUD.create", lambda: StudentCRUD.create(
+            Student("새학생", student_grade=1, student_class=1))),
+        ("StudentCRUD.create_many", lambda: StudentCRUD.create_many(
+            [Student("새학생1", student_grade=2), Student("새학생2")])),
+        ("StudentCRUD.get", lambda: StudentCRUD.get(1)),
+        ("StudentCRUD.get_many", lambda: StudentCRUD.get_many([1, 2, 3, 999])),
+        ("StudentCRUD.get_all", StudentCRUD.get_all),
+        ("StudentCRUD.iter_all", lambda: list(StudentCRUD.iter_all())),
+        ("StudentCRUD.update", lambda: StudentCRUD.update(2, student_name="이름변경", student_grade=4)),
+        ("StudentCRUD.update_many", lambda: StudentCRUD.update_many(
+            {3: {'student_class': 3}, 4: {'student_name': '일괄변경'}})),
+        ("StudentCRUD.get_enrollments", lambda: StudentCRUD.get_enrollments(1)),
+        ("StudentCRUD.get_roster", lambda: StudentCRUD.get_roster(2024)),
+        ("StudentCRUD.get_roster(grade)", lambda: StudentCRUD.get_roster(2024, 3)),
+        ("StudentCRUD.get_roster(grade, class)", lambda: StudentCRUD.get_roster(2024, 3, 2)),
+        ("StudentCRUD.delete", lambda: StudentCRUD.delete(5)),
+        ("StudentCRUD.delete_many", lambda: StudentCRUD.delete_many([6, 7])),
+        ("StudentCRUD.rollover(dry_run)", lambda: StudentCRUD.rollover(2100, dry_run=True)),
+        ("StudentCRUD.rollover", lambda: StudentCRUD.rollover(2101)),
+
+        ("ConsultingCRUD.create", lambda: ConsultingCRUD.create(
+            Consulting("새 상담", 1, consulting_date='2024-05-01'))),
+        ("ConsultingCRUD.create_many", lambda: ConsultingCRUD.create_many(
+            [Consulting("일괄 상담", 1), Consulting("일괄 상담", 2, consulting_date='2024-05-02')])),
+        ("ConsultingCRUD.get", lambda: ConsultingCRUD.get(1)),
+        ("ConsultingCRUD.get_with_student", lambda: ConsultingCRUD.get_with_student(1)),
+        ("ConsultingCRUD.get_many_with_student",
+         lambda: ConsultingCRUD.get_many_with_student([1, 2, 3, 99999])),
+        ("ConsultingCRUD.get_by_student", lambda: ConsultingCRUD.get_by_student(1)),
+        ("ConsultingCRUD.get_all", ConsultingCRUD.get_all),
+        ("ConsultingCRUD.iter_all", lambda: list(ConsultingCRUD.iter_all())),
+        ("ConsultingCRUD.get_all_with_student", ConsultingCRUD.get_all_with_student),
+        ("ConsultingCRUD.update", lambda: ConsultingCRUD.update(2, consulting_title="수정")),
+        ("ConsultingCRUD.update_many", lambda: ConsultingCRUD.update_many(
+            {3: {'consulting_type': '전화'}, 4: {'consulting_note': '메모'}})),
+        ("ConsultingCRUD.delete", lambda: ConsultingCRUD.delete(5)),
+        ("ConsultingCRUD.delete_many", lambda: ConsultingCRUD.delete_many([6, 7])),
+    ]
+
+    for kwargs in _student_search_kwargs():
+        cases += [
+            (f"StudentCRUD.search({kwargs})", lambda kw=kwargs: StudentCRUD.search(**kw)),
+            (f"StudentCRUD.iter_search({kwargs})",
+             lambda kw=kwargs: list(StudentCRUD.iter_search(**kw))),
+            (f"StudentCRUD.get_page({kwargs})",
+             lambda kw=kwargs: _next_page(StudentCRUD.get_page, **kw)),
+        ]
+
+    for kwargs in _combinations(CONSULTING_FILTERS):
+        cases += [
+            (f"ConsultingCRUD.search({kwargs})", lambda kw=kwargs: ConsultingCRUD.search(**kw)),
+            (f"ConsultingCRUD.search_with_student({kwargs})",
+             lambda kw=kwargs: ConsultingCRUD.search_with_student(**kw)),
+            (f"ConsultingCRUD.search_summaries({kwargs})",
+             lambda kw=kwargs: ConsultingCRUD.search_summaries(**kw)),
+            (f"ConsultingCRUD.iter_search({kwargs})",
+             lambda kw=kwargs: list(ConsultingCRUD.iter_search(**kw))),
+            (f"ConsultingCRUD.get_page({kwargs})",
+             lambda kw=kwargs: _next_page(ConsultingCRUD.get_page, **kw)),
+        ]
+        for sort in CONSULTING_SORTS:
+            for descending in (True, False):
+                sort_kwargs = {**kwargs, 'sort': sort, 'descending': descending}
+                cases.append((
+                    f"ConsultingCRUD.get_page({sort_kwargs})",
+                    lambda kw=sort_kwargs: _next_page(ConsultingCRUD.get_page, **kw)
+                ))
+        if 'title' in kwargs:
+            fts_kwargs = {k: v for k, v in kwargs.items() if k != 'title'}
+            cases.append((
+                f"ConsultingCRUD.fulltext_search({kwargs})",
+                lambda kw=fts_kwargs: ConsultingCRUD.fulltext_search('상담', **kw)
+            ))
+    return cases
+
+
+CRUD_CASES = _crud_cases()
+
+
+@pytest.fixture(scope='module')
+def seeded_db(tmp_path_factory):
+    """쿼리 계획 확인용 합성 데이터베이스 (학생 200명, 상담 2000건)"""
+    database.close_all_connections()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(database, 'DB_PATH', str(tmp_path_factory.mktemp('plans') / 'plans.db'))
+        database.init_database(progress=None)
+
+        surnames = '김이박최정'
+        StudentCRUD.create_many(
+            Student(f"{surnames[i % 5]}민{i}", student_grade=i % 6 + 1, student_class=i % 4 + 1,
+                    student_sex='남' if i % 2 else '여')
+            for i in range(200)
+        )
+        ConsultingCRUD.create_many(
+            Consulting(f"상담 {i}", i % 200 + 1,
+                       consulting_date=f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d} 00:00:00",
+                       consulting_type=('전화', '대면', '기타')[i % 3],
+                       consulting_content=f"학교 생활 상담 내용 {i}")
+            for i in range(2000)
+        )
+        yield database.get_connection()
+    database.close_all_connections()
+
+
+def _traced_statements(conn, func) -> list:
+    """func 실행 중 연결에서 실행된 SQL (파라미터가 채워진 형태)
+
+    트랜잭션 제어문과 트리거 본문('-- TRIGGER ...')은 제외한다.
+    """
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        func()
+    finally:
+        conn.set_trace_callback(None)
+
+    skip = ('BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE', 'PRAGMA', '--')
+    return list(dict.fromkeys(
+        s.strip() for s in statements if not s.strip().upper().startswith(skip)
+    ))
+
+
+def _full_scans(plan: list, allowed=()) -> list:
+    """인덱스 없이 테이블 전체를 읽는 단계 (allowed 테이블/별칭 제외)"""
+    return [
+        detail for detail in plan
+        if detail.startswith('SCAN ')
+        and detail.split()[1] not in allowed
+        and not any(ok in detail for ok in ('USING INDEX', 'USING COVERING INDEX',
+                                            'VIRTUAL TABLE', 'CONSTANT ROW'))
+    ]
+
+
+def _substring_only_tables(sql: str) -> set:
+    """WHERE 조건이 부분 문자열 LIKE 뿐인 테이블 (별칭이 있으면 별칭)"""
+    tables = [alias or table for table, alias in re.findall(
+        r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?!ON\b|WHERE\b|JOIN\b|ORDER\b|LIMIT\b)(\w+))?", sql
+    )]
+    where = re.search(r"\bWHERE\b(.*?)(?:\bORDER BY\b|\bGROUP BY\b|\bLIMIT\b|$)", sql, re.S)
+    if not where:
+        return set()
+
+    like, other = set(), set()
+    for condition in (c.strip() for c in re.split(r"\bAND\b", where.group(1))):
+        if condition == '1=1' or condition.startswith('('):
+            continue  # 키셋 커서 조건 (행 값 비교) 은 인덱스 검색으로 확인된다
+        refs = {alias for alias in re.findall(r"\b(\w+)\.", condition) if alias in tables}
+        if not refs and len(tables) == 1:
+            refs = set(tables)
+        (like if SUBSTRING_LIKE.search(condition) else other).update(refs)
+    return like - other
+
+
+@pytest.mark.parametrize('name, call', CRUD_CASES, ids=[name for name, _ in CRUD_CASES])
+def test_crud_queries_use_indexes(seeded_db, name, call):
+    # 캐시에서 반환되면 SQL 이 실행되지 않으므로 비우고 시작
+    StudentCRUD.cache_clear()
+    ConsultingCRUD.cache_clear()
+    search_cache_clear()
+    statements = _traced_statements(seeded_db, call)
+    assert statements, f"{name}: 실행된 SQL 이 없습니다."
+
+    if name.split('(')[0] in SCAN_ALLOWED_METHODS:
+        return
+    for sql in statements:
+        scans = _full_scans(query_plan(seeded_db, sql), allowed=_substring_only_tables(sql))
+        assert not scans, f"{name}: 인덱스를 쓰지 않는 전체 스캔 {scans}\n{sql}"
+
+
+@pytest.mark.parametrize('sql, expected', [
+    ("SELECT * FROM students WHERE 1=1 AND student_name_key LIKE '%민%' ORDER BY student_name",
+     {'students'}),
+    ("SELECT * FROM students WHERE 1=1 AND student_name_key LIKE '%민%' AND student_grade = 3",
+     set()),
+    ("SELECT * FROM consultings c JOIN students s ON c.student_id = s.student_id "
+     "WHERE 1=1 AND c.consulting_title LIKE '%상담%' AND s.student_name_key LIKE '%김%' "
+     "AND c.consulting_day >= 20240301 AND c.consulting_day <= 20240630 "
+     "ORDER BY c.consulting_day DESC", {'s'}),
+    ("SELECT * FROM consultings c JOIN students s ON c.student_id = s.student_id "
+     "WHERE 1=1 AND s.student_name_key LIKE '%김%' AND COALESCE(c.consulting_type, '') = '대면' "
+     "AND (c.consulting_day, c.consulting_id) < (20240301, 5) LIMIT 6", {'s'}),
+    ("SELECT * FROM students WHERE student_name_key >= '김' AND student_name_key < '깁'", set()),
+])
+def test_substring_only_tables(sql, expected):
+    assert _substring_only_tables(sql) == expected
+
+
+@pytest.mark.parametrize('crud', [StudentCRUD, ConsultingCRUD])
+def test_every_crud_method_has_plan_case(crud):
+    """새 CRUD 메서드를 추가하면 CRUD_CASES 에도 추가해야 한다"""
+    covered = {name.split('(')[0] for name, _ in CRUD_CASES} | set(NO_SQL_METHODS)
+    methods = {f"{crud.__name__}.{m}" for m in vars(crud) if not m.startswith('_')}
+    assert methods <= covered, f"쿼리 계획 테스트가 없는 메서드: {sorted(methods - covered)}"
+
+
+# ---------- 이름 검색 (화면 필터) ----------
+
+@pytest.mark.parametrize('match', ['contains', 'prefix', 'choseong', 'auto'])
+def test_name_matches_agrees_with_search(db, match):
+    names = ["김민수", "김민지", "김 민수", "이민수", "Kim Minsu", "박수민", "김수"]
+    students = {sid: name for sid, name in zip(StudentCRUD.create_many(Student(n) for n in names),
+                                                 names)}
+    for query in ["김", "김민", "민수", "ㄱㅁ", "김ㅁ", "ㄱ민", "ㄱㅁㅅ", "kim", "KIM M", " 김 민 "]:
+        expected = {s.student_id for s in StudentCRUD.search(name=query, match=match)}
+        matched = {sid for sid, name in students.items()
+                   if name_matches(search_keys(name), query, match)}
+        assert matched == expected, query
+
+
+# ---------- 학생 조회 캐시 ----------
+
+def test_student_cache_hits_and_local_invalidation(db):
+    student_id = StudentCRUD.create(Student("김민수", student_grade=3))
+    StudentCRUD.cache_clear()
+
+    assert StudentCRUD.get(student_id).student_grade == 3
+    assert StudentCRUD.get(student_id) is StudentCRUD.get(student_id)
+    info = StudentCRUD.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    StudentCRUD.update(student_id, student_grade=4)
+    assert StudentCRUD.get(student_id).student_grade == 4
+
+    StudentCRUD.update_many({student_id: {'student_class': 2}})
+    assert StudentCRUD.get(student_id).student_class == 2
+
+    StudentCRUD.delete(student_id)
+    assert StudentCRUD.get(student_id) is None
+
+
+def test_student_cache_detects_external_changes(db, monkeypatch):
+    monkeypatch.setattr(database, 'EXTERNAL_CHECK_INTERVAL', 0)
+    student_id = StudentCRUD.create(Student("김민수"))
+    assert StudentCRUD.get(student_id).student_name == "김민수"
+
+    # 다른 프로세스의 변경과 같이 별도 연결로 commit
+    other = sqlite3.connect(database.DB_PATH)
+    other.execute("UPDATE students SET student_name = '김민준' WHERE student_id = ?", (student_id,))
+    other.commit()
+    other.close()
+
+    assert StudentCRUD.get(student_id).student_name == "김민준"
+
+
+def test_student_cache_skips_uncommitted_reads(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    StudentCRUD.cache_clear()
+
+    with pytest.raises(RuntimeError):
+        with session():
+            StudentCRUD.update(student_id, student_name="롤백될 이름")
+            assert StudentCRUD.get(student_id).student_name == "롤백될 이름"
+            raise RuntimeError
+
+    assert StudentCRUD.get(student_id).student_name == "김민수"
+
+
+def test_student_cache_invalidated_after_commit(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    assert StudentCRUD.get(student_id).student_name == "김민수"
+
+    def read_in_other_thread():
+        thread = threading.Thread(target=StudentCRUD.get, args=(student_id,))
+        thread.start()
+        thread.join()
+
+    with session():
+        StudentCRUD.update(student_id, student_name="김민준")
+        # commit 전에 다른 스레드가 아직 바뀌지 않은 행을 캐시
+        read_in_other_thread()
+        assert StudentCRUD.cache_info().currsize == 1
+
+    assert StudentCRUD.get(student_id).student_name == "김민준"
+
+
+def test_get_many(db):
+    ids = StudentCRUD.create_many([Student("가"), Student("나"), Student("다")])
+    StudentCRUD.cache_clear()
+    StudentCRUD.get(ids[0])
+
+    students = StudentCRUD.get_many([ids[2], ids[0], 9999, ids[2]])
+
+    assert {k: s.student_name for k, s in students.items()} == {ids[2]: "다", ids[0]: "가"}
+    assert StudentCRUD.cache_info().hits == 1
+
+
+# ---------- 상담 상세 캐시 ----------
+
+def test_detail_cache_shared_and_invalidated_by_edits(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ids = ConsultingCRUD.create_many([Consulting(f"상담 {i}", student_id) for i in range(3)])
+    ConsultingCRUD.cache_clear()
+
+    # 이웃 행 미리 읽기 후 단건 조회는 캐시에서
+    prefetched = ConsultingCRUD.get_many_with_student(ids + [9999])
+    assert sorted(prefetched) == ids
+    assert ConsultingCRUD.get_with_student(ids[1]) is prefetched[ids[1]]
+    assert ConsultingCRUD.cache_info().hits == 1
+
+    ConsultingCRUD.update(ids[1], consulting_content="수정한 내용")
+    assert ConsultingCRUD.get_with_student(ids[1]).consulting_content == "수정한 내용"
+
+    # 학생 이름도 함께 담기므로 학생 수정도 반영
+    StudentCRUD.update(student_id, student_name="김민준")
+    assert ConsultingCRUD.get_with_student(ids[1]).student_name == "김민준"
+
+    ConsultingCRUD.delete(ids[1])
+    assert ConsultingCRUD.get_with_student(ids[1]) is None
+
+
+# ---------- 검색 결과 캐시 ----------
+
+def test_search_cache_reuses_equivalent_queries(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ConsultingCRUD.create_many([Consulting("상담", student_id, consulting_date='2024-03-05')])
+    search_cache_clear()
+
+    first = ConsultingCRUD.search_summaries(student_name=" 김민수 ", start_date='2024-03-05')
+    second = ConsultingCRUD.search_summaries(student_name="김민수",
+                                             start_date='2024-03-05 00:00:00')
+
+    assert [c.consulting_id for c in first] == [c.consulting_id for c in second]
+    assert first is not second
+    assert (search_cache_info().hits, search_cache_info().misses) == (1, 1)
+
+
+def test_search_cache_invalidated_by_writes(db, monkeypatch):
+    monkeypatch.setattr(database, 'EXTERNAL_CHECK_INTERVAL', 0)
+    student_id = StudentCRUD.create(Student("김민수"))
+    assert len(ConsultingCRUD.search()) == 0
+    assert [s.student_name for s in StudentCRUD.search("김")] == ["김민수"]
+
+    # 이 프로세스의 쓰기
+    ConsultingCRUD.create(Consulting("상담", student_id))
+    StudentCRUD.create(Student("김영희"))
+    assert len(ConsultingCRUD.search()) == 1
+    assert [s.student_name for s in StudentCRUD.search("김")] == ["김민수", "김영희"]
+
+    # 다른 프로세스의 쓰기
+    other = sqlite3.connect(database.DB_PATH)
+    other.execute("DELETE FROM consultings")
+    other.commit()
+    other.close()
+    assert len(ConsultingCRUD.search()) == 0
+
+
+def test_search_cache_ttl(db, monkeypatch):
+    from carenote import crud
+    monkeypatch.setattr(crud._search_cache, 'ttl', 0.05)
+    search_cache_clear()
+    StudentCRUD.search("김")
+    StudentCRUD.search("김")
+    time.sleep(0.1)
+    StudentCRUD.search("김")
+    assert (search_cache_info().hits, search_cache_info().misses) == (1, 2)
+
+
+# ---------- 연결 ----------
+
+def test_connection_reused_per_thread(db):
+    assert database.get_connection() is db
+    assert db.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    others = []
+    thread = threading.Thread(target=lambda: others.append(database.get_connection()))
+    thread.start()
+    thread.join()
+    assert others[0] is not db
+
+    database.close_all_connections()
+    with pytest.raises(sqlite3.ProgrammingError):
+        db.execute("SELECT 1")
+    fresh = database.get_connection()
+    assert fresh is not db and fresh is database.get_connection()
+
+
+def test_connection_follows_db_path(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(database, 'DB_PATH', str(tmp_path / 'other.db'))
+    assert database.get_connection() is not db
+
+
+# ---------- 트랜잭션 ----------
+
+def test_nested_transaction_rolls_back_inner_scope_only(db):
+    with session():
+        outer_id = StudentCRUD.create(Student("김민수"))
+        with pytest.raises(ValueError):
+            with session():
+                StudentCRUD.create(Student("이영희"))
+                raise ValueError
+        assert db.in_transaction
+
+    assert not db.in_transaction
+    assert [s.student_id for s in StudentCRUD.search()] == [outer_id]
+
+    with pytest.raises(ValueError):
+        with session():
+            StudentCRUD.create(Student("박지훈"))
+            raise ValueError
+    assert [s.student_id for s in StudentCRUD.search()] == [outer_id]
+
+
+def test_failed_commit_releases_transaction(db):
+    # 롤백 저널에서는 읽는 연결이 있으면 COMMIT 이 SQLITE_BUSY 로 실패한다
+    db.execute("PRAGMA journal_mode = DELETE")
+    db.execute("PRAGMA busy_timeout = 0")
+    reader = sqlite3.connect(database.DB_PATH, isolation_level=None)
+    reader.execute("BEGIN")
+    reader.execute("SELECT COUNT(*) FROM students").fetchone()
+
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        StudentCRUD.create(Student("김민수"))
+    assert not db.in_transaction
+
+    reader.execute("COMMIT")
+    reader.close()
+    StudentCRUD.create(Student("김민수"))  # 사용자가 다시 저장
+    assert [s.student_name for s in StudentCRUD.search()] == ["김민수"]
+
+
+# ---------- 일괄 작업 ----------
+
+def test_create_many_returns_ids_in_input_order(db):
+    StudentCRUD.create(Student("기존"))
+    names = ["가", "나", "다", "라"]
+
+    ids = StudentCRUD.create_many(Student(n) for n in names)
+
+    assert len(set(ids)) == len(names)
+    assert [StudentCRUD.get(i).student_name for i in ids] == names
+    assert StudentCRUD.create_many([]) == []
+
+
+def test_create_many_with_explicit_ids(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ids = ConsultingCRUD.create_many([
+        Consulting("자동 1", student_id),
+        Consulting("지정", student_id, consulting_id=100),
+        Consulting("자동 2", student_id),
+    ])
+
+    assert ids[1] == 100 and ids[2] == 101
+    assert [ConsultingCRUD.get(i).consulting_title for i in ids] == ["자동 1", "지정", "자동 2"]
+
+
+def test_create_many_validates_before_writing(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    with pytest.raises(ValueError, match="3번째"):
+        ConsultingCRUD.create_many([
+            Consulting("상담", student_id),
+            Consulting("상담", student_id),
+            Consulting("상담", student_id, consulting_date='어제'),
+        ])
+    with pytest.raises(ValueError, match="2번째"):
+        StudentCRUD.update_many({student_id: {'student_class': 2},
+                                 9999: {'student_grade': 9}})
+
+    assert ConsultingCRUD.get_by_student(student_id) == []
+    assert StudentCRUD.get(student_id).student_class is None
+
+
+def test_update_and_delete_many_return_counts(db):
+    ids = StudentCRUD.create_many(Student(n) for n in ["가", "나", "다"])
+
+    assert StudentCRUD.update_many({ids[0]: {'student_grade': 2},
+                                    ids[1]: {'student_name': "너"},
+                                    9999: {'student_grade': 3}}) == 2
+    assert StudentCRUD.get(ids[1]).student_name == "너"
+    assert StudentCRUD.search(name="너")[0].student_id == ids[1]
+    assert [e.student_grade for e in StudentCRUD.get_enrollments(ids[0])] == [2]
+
+    assert StudentCRUD.delete_many([ids[0], ids[2], 9999]) == 2
+    assert StudentCRUD.delete_many([]) == 0
+    assert [s.student_id for s in StudentCRUD.search()] == [ids[1]]
+
+
+# ---------- 학생 정보 포함 조회 ----------
+
+def test_search_with_student_includes_student_fields(db):
+    ids = StudentCRUD.create_many([Student("김민수", student_grade=3, student_class=2),
+                                   Student("이영희")])
+    ConsultingCRUD.create_many([
+        Consulting("진로", ids[0], consulting_date='2024-03-05', consulting_content="내용"),
+        Consulting("교우", ids[1], consulting_date='2024-03-06'),
+    ])
+
+    results = ConsultingCRUD.search_with_student()
+
+    assert [(c.consulting_title, c.student_name, c.student_grade, c.student_class)
+            for c in results] == [("교우", "이영희", None, None), ("진로", "김민수", 3, 2)]
+    assert results[1].consulting_content == "내용"
+    assert results[1].to_dict() == {**ConsultingCRUD.get(results[1].consulting_id).to_dict(),
+                                    'student_name': "김민수", 'student_grade': 3,
+                                    'student_class': 2}
+    assert [c.student_name for c in ConsultingCRUD.search_with_student(student_name="민수")] == \
+        ["김민수"]
+    assert ConsultingCRUD.get_all_with_student() == results
+
+    # 학생 정보가 바뀌면 다음 조회에 반영
+    StudentCRUD.update(ids[0], student_name="김민준")
+    assert ConsultingCRUD.search_with_student()[1].student_name == "김민준"
+
+
+def test_search_summaries_leave_out_text_columns(db):
+    student_id = StudentCRUD.create(Student("김민수", student_grade=3, student_class=2))
+    consulting_id = ConsultingCRUD.create(Consulting(
+        "진로", student_id, consulting_date='2024-03-05 10:00:00', consulting_type='대면',
+        consulting_content="긴 본문" * 100, consulting_opinion="소견", consulting_note="메모"
+    ))
+
+    summaries = ConsultingCRUD.search_summaries(student_name="김민")
+
+    assert summaries[0].to_dict() == {
+        'consulting_id': consulting_id, 'consulting_title': "진로", 'student_id': student_id,
+        'consulting_date': '2024-03-05 10:00:00', 'consulting_type': '대면',
+        'student_name': "김민수", 'student_grade': 3, 'student_class': 2,
+        'consulting_day': 20240305,
+    }
+    assert not hasattr(summaries[0], 'consulting_content')
+    # 목록과 같은 순서, 같은 조건
+    assert [s.consulting_id for s in ConsultingCRUD.search_summaries()] == \
+        [c.consulting_id for c in ConsultingCRUD.search_with_student()]
+    assert ConsultingCRUD.search_summaries(consulting_type='전화') == []
+
+
+# ---------- 전문 검색 ----------
+
+def fts_titles(query: str, **kwargs) -> list:
+    return sorted(hit.consulting.consulting_title
+                  for hit in ConsultingCRUD.fulltext_search(query, **kwargs))
+
+
+def test_fts_index_follows_writes(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ids = ConsultingCRUD.create_many([
+        Consulting("진로 상담", student_id, consulting_content="대학 진학 고민"),
+        Consulting("교우 관계", student_id, consulting_opinion="친구와 다툼"),
+    ])
+    consulting_id = ConsultingCRUD.create(Consulting("학부모 면담", student_id,
+                                                     consulting_note="진학 자료 전달"))
+    assert fts_titles("진학") == ["진로 상담", "학부모 면담"]
+
+    ConsultingCRUD.update(ids[0], consulting_content="학원 문제")
+    ConsultingCRUD.update_many({ids[1]: {'consulting_opinion': "진학 상담 필요"}})
+    assert fts_titles("진학") == ["교우 관계", "학부모 면담"]
+    assert fts_titles("학원") == ["진로 상담"]
+
+    ConsultingCRUD.delete(consulting_id)
+    StudentCRUD.delete(student_id)  # 학생 삭제 시 상담 기록도 함께 삭제
+    assert fts_titles("진학") == []
+    db.execute("INSERT INTO consultings_fts(consultings_fts) VALUES ('integrity-check')")
+
+
+def test_fulltext_search_filters_and_snippet(db):
+    ids = StudentCRUD.create_many([Student("김민수"), Student("이영희")])
+    ConsultingCRUD.create_many([
+        Consulting("진로", ids[0], consulting_date='2024-03-05', consulting_type='대면',
+                   consulting_content="이번 학기 진학 목표를 정함"),
+        Consulting("진로", ids[1], consulting_date='2024-04-05', consulting_type='전화',
+                   consulting_content="진학 상담"),
+    ])
+
+    hits = ConsultingCRUD.fulltext_search("진학", student_name="민수", highlight=('<b>', '</b>'))
+    assert [h.consulting.student_name for h in hits] == ["김민수"]
+    assert "<b>진학</b>" in hits[0].snippet
+
+    assert [h.consulting.student_name for h in ConsultingCRUD.fulltext_search(
+        "진학", consulting_type='전화')] == ["이영희"]
+    assert [h.consulting.student_name for h in ConsultingCRUD.fulltext_search(
+        "진학", start_date='2024-04-01', end_date='2024-04-30')] == ["이영희"]
+    assert len(ConsultingCRUD.fulltext_search("진학", limit=1)) == 1
+
+
+@pytest.mark.parametrize('consulting_type', ['전화', '대면', '기타'])
+def test_fulltext_search_filters_like_search(db, consulting_type):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ConsultingCRUD.create_many(
+        Consulting(f"진학 상담 {i}", student_id, consulting_date='2024-03-05',
+                   consulting_type=(None, '전화', '대면', '기타')[i % 4])
+        for i in range(12)
+    )
+
+    filters = dict(student_name="민수", consulting_type=consulting_type,
+                   start_date='2024-03-01', end_date='2024-03-31')
+    hits = ConsultingCRUD.fulltext_search("진학", **filters)
+
+    assert {h.consulting.consulting_id for h in hits} == \
+        {c.consulting_id for c in ConsultingCRUD.search(title="진학", **filters)}
+    assert len(hits) == 3
+
+
+def test_fulltext_search_limit_reports_more_results(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ConsultingCRUD.create_many(Consulting(f"진학 {i}", student_id) for i in range(5))
+
+    # 화면은 한 건 더 요청해 잘렸는지 확인한다
+    assert len(ConsultingCRUD.fulltext_search("진학", limit=4 + 1)) == 5
+    assert len(ConsultingCRUD.fulltext_search("진학", limit=5 + 1)) == 5
+
+
+@pytest.mark.parametrize('query', ['"', 'OR', 'NEAR(', '진학 AND', '*', "it's", 'a:b', '   '])
+def test_fulltext_search_treats_input_as_text(db, query):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ConsultingCRUD.create(Consulting("상담", student_id, consulting_content="진학 OR 취업"))
+    assert isinstance(ConsultingCRUD.fulltext_search(query), list)
+
+
+def test_fulltext_search_matches_operator_words_literally(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ConsultingCRUD.create(Consulting("상담", student_id, consulting_content="진학 OR 취업"))
+    assert fts_titles("OR") == ["상담"]
+    assert fts_titles("진학 취업") == ["상담"]
+    assert fts_titles("진학 군대") == []
+
+
+# ---------- 성능 프로필 ----------
+
+def test_default_profile_keeps_rollback_journal(db):
+    assert database.DB_PROFILE == 'safe'
+    assert db.execute("PRAGMA journal_mode").fetchone()[0] == 'delete'
+    assert db.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+
+
+def test_wal_profile_is_opt_in(db, monkeypatch):
+    monkeypatch.setattr(database, 'DB_PROFILE', 'balanced')
+    database.close_all_connections()
+    assert database.get_connection().execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+
+def test_profile_does_not_block_on_busy_database(db, monkeypatch):
+    # 다른 PC 가 DB 를 쓰는 중이면 journal_mode 를 바꾸지 못해도 연결은 열린다
+    other = sqlite3.connect(database.DB_PATH, isolation_level=None)
+    other.execute("BEGIN")
+    other.execute("SELECT COUNT(*) FROM students").fetchone()
+    monkeypatch.setattr(database, 'DB_PROFILE', 'balanced')
+    database.close_all_connections()
+
+    started = time.monotonic()
+    conn = database.get_connection()
+    assert time.monotonic() - started < 1
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'delete'
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    other.execute("COMMIT")
+    other.close()
+
+
+# ---------- 학년도 진급 ----------
+
+@pytest.mark.parametrize('today, expected', [
+    (date(2027, 1, 15), 2027),   # 2026학년도 진행 중 → 곧 시작할 2027학년도
+    (date(2027, 2, 28), 2027),
+    (date(2027, 3, 2), 2027),    # 이미 시작한 2027학년도 (진급 처리 전일 수 있음)
+    (date(2027, 3, 31), 2027),
+    (date(2026, 10, 18), 2027),  # 학년도 중간에는 다음 학년도 (진행 중인 학년도로 진급하지 않음)
+    (date(2027, 12, 1), 2028),
+])
+def test_rollover_year_default(today, expected):
+    assert school_year(today) in (expected - 1, expected)
+    assert rollover_year(today) == expected
+
+
+def test_rollover_promotes_once_per_year(db, monkeypatch):
+    from carenote import crud
+    monkeypatch.setattr(crud, 'school_year', lambda: 2026)
+    monkeypatch.setattr(crud, 'rollover_year', lambda: 2027)  # 2027년 1월에 실행
+    fifth = StudentCRUD.create(Student("김민수", student_grade=5, student_class=2))
+    sixth = StudentCRUD.create(Student("이영희", student_grade=6, student_class=1))
+
+    assert StudentCRUD.rollover(dry_run=True) == RolloverResult(2027, 1, 1, dry_run=True)
+    assert StudentCRUD.get(fifth).student_grade == 5
+
+    assert StudentCRUD.rollover() == RolloverResult(2027, 1, 1)
+    assert [(e.school_year, e.student_grade, e.student_class)
+            for e in StudentCRUD.get_enrollments(fifth)] == [(2026, 5, 2), (2027, 6, 2)]
+    graduate = StudentCRUD.get(sixth)
+    assert (graduate.student_graduated, graduate.student_grade) == (2026, None)
+
+    with pytest.raises(ValueError):
+        StudentCRUD.rollover(2027)
+
+
+def test_rollover_skips_students_entered_for_new_year(db, monkeypatch):
+    from carenote import crud
+    monkeypatch.setattr(crud, 'school_year', lambda: 2026)
+    # 2026학년도에 입학한 1학년 (등록할 때 2026학년도 이력이 기록됨)
+    first = StudentCRUD.create(Student("김민수", student_grade=1, student_class=1))
+    third = StudentCRUD.create_many([Student("이영희")])[0]
+    db.execute("INSERT INTO student_enrollments VALUES (?, 2025, 2, 1)", (third,))
+    db.execute("UPDATE students SET student_grade = 2, student_class = 1 WHERE student_id = ?",
+               (third,))
+    db.commit()
+
+    assert StudentCRUD.rollover(2026, dry_run=True) == RolloverResult(2026, 1, 0, dry_run=True)
+    assert StudentCRUD.rollover(2026) == RolloverResult(2026, 1, 0)
+
+    assert StudentCRUD.get(first).student_grade == 1
+    assert [(e.school_year, e.student_grade) for e in StudentCRUD.get_enrollments(first)] == \
+        [(2026, 1)]
+    assert StudentCRUD.get(third).student_grade == 3
+    assert [(e.school_year, e.student_grade) for e in StudentCRUD.get_enrollments(third)] == \
+        [(2025, 2), (2026, 3)]
+
+
+def test_rollover_keeps_existing_history(db, monkeypatch):
+    from carenote import crud
+    monkeypatch.setattr(crud, 'school_year', lambda: 2025)
+    student_id = StudentCRUD.create(Student("김민수", student_grade=1, student_class=1))
+    # 2026학년도가 시작된 뒤 진급 처리 전에 새 반을 입력
+    monkeypatch.setattr(crud, 'school_year', lambda: 2026)
+    StudentCRUD.update(student_id, student_grade=2, student_class=3)
+
+    assert StudentCRUD.rollover(2026) == RolloverResult(2026, 0, 0)
+
+    assert StudentCRUD.get(student_id).student_grade == 2
+    assert [(e.school_year, e.student_grade, e.student_class)
+            for e in StudentCRUD.get_enrollments(student_id)] == [(2025, 1, 1), (2026, 2, 3)]
+
+
+def test_rollover_preview_is_read_only(db):
+    StudentCRUD.create(Student("김민수", student_grade=3))
+    db.execute("PRAGMA busy_timeout = 0")
+    writer = sqlite3.connect(database.DB_PATH, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")  # 다른 PC 가 저장 중
+
+    assert StudentCRUD.rollover(2100, dry_run=True).promoted == 1
+    assert not db.in_transaction
+
+    writer.execute("ROLLBACK")
+    writer.close()
@@ -0,0 +1,85 @@
+"""내보내기 테스트 (CSV / JSONL)"""
+import csv
+import json
+
+import pytest
+
+from carenote.crud import ConsultingCRUD, StudentCRUD
+from carenote.export import export_consultings, export_students
+from carenote.models import Consulting, Student
+
+
+@pytest.fixture
+def seeded(db):
+    student_ids = StudentCRUD.create_many([
+        Student("김민수", student_grade=3, student_class=1),
+        Student("이영희", student_phone="010-1234-5678"),
+    ])
+    ConsultingCRUD.create_many([
+        Consulting("진로 상담", student_ids[0], consulting_date='2024-03-05 00:00:00',
+                   consulting_content='줄바꿈이 있는\n"상담" 내용, 쉼표'),
+        Consulting("교우 관계", student_ids[1], consulting_date='2024-03-06 00:00:00'),
+    ])
+    return student_ids
+
+
+def test_export_csv(seeded, tmp_path):
+    path = tmp_path / 'students.csv'
+
+    assert export_students(str(path)) == 2
+
+    assert path.read_bytes().startswith(b'\xef\xbb\xbf')  # 엑셀용 BOM
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['student_name', 'student_id', 'student_phone', 'student_grade',
+                       'student_class', 'student_sex', 'student_graduated']
+    assert [row[0] for row in rows[1:]] == ["김민수", "이영희"]
+    assert rows[1][3:5] == ['3', '1'] and rows[2][2] == "010-1234-5678"
+
+
+def test_export_jsonl(seeded, tmp_path):
+    path = tmp_path / 'consultings.jsonl'
+
+    assert export_consultings(str(path), 'jsonl') == 2
+
+    with open(path, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    # 목록 화면과 같은 최신순
+    assert [r['consulting_title'] for r in records] == ["교우 관계", "진로 상담"]
+    assert records[0]['student_id'] == seeded[1] and records[0]['consulting_content'] is None
+    assert records[1]['consulting_content'] == '줄바꿈이 있는\n"상담" 내용, 쉼표'
+    assert "김민수" not in path.read_text(encoding='utf-8')  # 상담 기록만
+
+
+def test_export_csv_round_trips_multiline_content(seeded, tmp_path):
+    path = tmp_path / 'consultings.csv'
+    export_consultings(str(path))
+
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    assert rows[1]['consulting_content'] == '줄바꿈이 있는\n"상담" 내용, 쉼표'
+
+
+def test_export_empty_database(db, tmp_path):
+    path = tmp_path / 'students.jsonl'
+    assert export_students(str(path), 'jsonl') == 0
+    assert path.read_text(encoding='utf-8') == ''
+
+
+def test_export_unknown_format(db, tmp_path):
+    path = tmp_path / 'students.xlsx'
+    with pytest.raises(ValueError, match="지원하지 않는 형식"):
+        export_students(str(path), 'xlsx')
+    assert not path.exists()
+
+
+def test_iter_all_reads_in_chunks(db):
+    names = [f"학생{i:02d}" for i in range(25)]
+    StudentCRUD.create_many(Student(n) for n in names)
+
+    students = StudentCRUD.iter_all(chunk_size=4)
+
+    assert next(students).student_name == names[0]
+    assert [s.student_name for s in students] == names[1:]
+    assert [s.student_name for s in StudentCRUD.iter_all()] == \
+        [s.student_name for s in StudentCRUD.get_all()]
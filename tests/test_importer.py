@@ -0,0 +1,83 @@
+"""학생 명단 가져오기 테스트"""
+import unicodedata
+
+import pytest
+
+from carenote.crud import StudentCRUD
+from carenote.importer import detect_encoding, import_students, normalize_row
+from carenote.models import Student
+
+NFD_NAME = unicodedata.normalize('NFD', "김민수")
+
+
+def write_csv(tmp_path, lines, encoding='utf-8-sig'):
+    path = tmp_path / 'roster.csv'
+    path.write_text('\n'.join(lines) + '\n', encoding=encoding)
+    return str(path)
+
+
+@pytest.mark.parametrize('values, expected', [
+    ({'student_name': NFD_NAME}, Student("김민수")),
+    ({'student_name': "이영희", 'student_grade': '3학년', 'student_class': '2반',
+      'student_sex': 'F', 'student_phone': '010-1234-5678'},
+     Student("이영희", student_phone='010-1234-5678', student_grade=3, student_class=2,
+             student_sex='여')),
+    ({'student_name': "박지훈", 'student_grade': ' 6 ', 'student_sex': '남자'},
+     Student("박지훈", student_grade=6, student_sex='남')),
+])
+def test_normalize_row(values, expected):
+    student = normalize_row(values)
+    assert student == expected
+    assert unicodedata.is_normalized('NFC', student.student_name)
+
+
+@pytest.mark.parametrize('values, message', [
+    ({'student_name': ''}, "이름"),
+    ({'student_name': "김민수", 'student_grade': '7'}, "학년"),
+    ({'student_name': "김민수", 'student_class': '5반'}, "반"),
+    ({'student_name': "김민수", 'student_sex': '?'}, "성별"),
+])
+def test_normalize_row_rejects_invalid_values(values, message):
+    with pytest.raises(ValueError, match=message):
+        normalize_row(values)
+
+
+def test_import_reports_errors_and_duplicates(db, tmp_path):
+    # 다른 시스템에서 NFD 로 저장된 기존 학생
+    StudentCRUD.create(Student(NFD_NAME, student_grade=3, student_class=1))
+    path = write_csv(tmp_path, [
+        "성명,학년,반,성별,연락처",
+        "김민수,3,1,남,",             # 2행: 기존 학생 (NFD) 과 중복
+        "김민수,4,1,남,",             # 3행: 다른 반이면 다른 학생
+        "이영희,2학년,3반,여,010-1",
+        "",                            # 빈 줄은 행으로 세지 않음
+        "박지훈,9,1,남,",             # 6행: 학년 오류
+        "이영희,2,3,여,",             # 7행: 앞 묶음과 중복
+        ",1,1,,",                      # 8행: 이름 없음
+        " 이영희 ,2,3,,",             # 9행: 공백만 다른 이름도 중복
+    ])
+
+    report = import_students(path, chunk_size=2)
+
+    assert (report.total, report.inserted, report.duplicates) == (7, 2, 3)
+    assert [line for line, _ in report.errors] == [6, 8]
+    assert "학년" in report.errors[0][1]
+    assert report.summary() == "전체 7행 중 2명 등록, 중복 3건, 오류 2건"
+    assert {(s.student_name, s.student_grade) for s in StudentCRUD.search()} == \
+        {(NFD_NAME, 3), ("김민수", 4), ("이영희", 2)}
+
+
+def test_import_cp949_file(db, tmp_path):
+    path = write_csv(tmp_path, ["이름,학년,반", "김민수,1,2"], encoding='cp949')
+    assert detect_encoding(path) == 'cp949'
+
+    report = import_students(path)
+
+    assert report.inserted == 1
+    assert [s.student_name for s in StudentCRUD.search()] == ["김민수"]
+
+
+def test_import_requires_name_column(db, tmp_path):
+    path = write_csv(tmp_path, ["학년,반", "1,2"])
+    with pytest.raises(ValueError, match="이름 열"):
+        import_students(path)
@@ -0,0 +1,72 @@
+"""스키마 마이그레이션 테스트"""
+import json
+import sqlite3
+
+import pytest
+
+from carenote import migrations
+from carenote.migrations import LATEST_VERSION, MIGRATIONS, get_version, migrate
+
+
+def migrated_to(path, version: int):
+    """version 까지만 마이그레이션한 데이터베이스 (이전 버전 프로그램이 만든 DB 재현)"""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    cursor = conn.cursor()
+    for v, _, func in MIGRATIONS:
+        if v <= version:
+            func(cursor)
+    conn.execute(f"PRAGMA user_version = {version}")
+    conn.commit()
+    return conn
+
+
+@pytest.mark.parametrize('history, grade, class_num, expected', [
+    # 학년도 중 반만 고친 기록은 새 학년도가 아니다
+    ([(3, 1), (4, 2)], 4, 3, [(2026, 4, 3), (2025, 3, 1)]),
+    # 같은 학년 안에서는 마지막 반, 학년이 바뀔 때마다 한 해씩
+    ([(1, 2), (1, 3), (2, 1), (3, 4), (3, 2)], 4, 1,
+     [(2026, 4, 1), (2025, 3, 2), (2024, 2, 1), (2023, 1, 3)]),
+    # 현재 학년/반과 같은 기록 (반 이름만 다시 저장)
+    ([(5, 1), (5, 1)], 5, 1, [(2026, 5, 1)]),
+    # 현재 학년/반이 없으면 이력은 모두 지난 학년도
+    ([(2, 1), (3, 3)], None, None, [(2025, 3, 3), (2024, 2, 1)]),
+    # 범위를 벗어난 기록은 무시
+    ([(7, 1), (2, 9), (2, 2)], 3, 1, [(2026, 3, 1), (2025, 2, 2)]),
+    ([], None, None, []),
+])
+def test_history_enrollments(history, grade, class_num, expected):
+    history_json = json.dumps([{'grade': g, 'class': c} for g, c in history])
+    rows = migrations._history_enrollments(history_json, grade, class_num, 2026)
+    assert sorted(rows, reverse=True) == expected
+
+
+def test_history_enrollments_ignores_broken_json():
+    assert migrations._history_enrollments('[{"grade": 3', 4, 2, 2026) == [(2026, 4, 2)]
+    assert migrations._history_enrollments('{"grade": 3}', 4, 2, 2026) == [(2026, 4, 2)]
+
+
+def test_v5_converts_history_and_keeps_legacy_column(tmp_path, monkeypatch):
+    monkeypatch.setattr(migrations, 'school_year', lambda: 2026)
+    conn = migrated_to(str(tmp_path / 'old.db'), 4)
+    history = json.dumps([{'grade': 3, 'class': 1}, {'grade': 4, 'class': 2}])
+    conn.execute(
+        "INSERT INTO students (student_name, student_grade, student_class, student_history) "
+        "VALUES ('김민수', 4, 3, ?)", (history,)
+    )
+    conn.execute("INSERT INTO students (student_name) VALUES ('이영희')")
+    conn.commit()
+
+    assert migrate(conn) == LATEST_VERSION - 4
+    assert get_version(conn) == LATEST_VERSION
+
+    rows = conn.execute(
+        "SELECT s.student_name, e.school_year, e.student_grade, e.student_class "
+        "FROM student_enrollments e JOIN students s USING (student_id) ORDER BY e.school_year"
+    ).fetchall()
+    assert rows == [('김민수', 2025, 3, 1), ('김민수', 2026, 4, 3)]
+    # 원본 이력은 남아 있다
+    assert conn.execute(
+        "SELECT student_history FROM students WHERE student_name = '김민수'"
+    ).fetchone()[0] == history
+    conn.close()
@@ -0,0 +1,50 @@
+"""데이터 모델 테스트 (슬롯 레코드, COLUMNS 순서, from_row / to_dict)"""
+import pytest
+
+from carenote.crud import ConsultingCRUD, StudentCRUD
+from carenote.models import Consulting, ConsultingWithStudent, Enrollment, Student
+
+
+def test_columns_follow_field_order():
+    assert Student.COLUMNS == ('student_name', 'student_id', 'student_phone', 'student_grade',
+                               'student_class', 'student_sex', 'student_graduated')
+    # 상속한 모델은 부모 필드 뒤에 추가 필드
+    assert ConsultingWithStudent.COLUMNS == \
+        (*Consulting.COLUMNS, 'student_name', 'student_grade', 'student_class')
+
+
+@pytest.mark.parametrize('model, table', [
+    (Student, 'students'),
+    (Enrollment, 'student_enrollments'),
+    (Consulting, 'consultings'),
+])
+def test_columns_exist_in_table(db, model, table):
+    table_columns = {row['name'] for row in db.execute(f"PRAGMA table_xinfo({table})")}
+    assert set(model.COLUMNS) <= table_columns
+
+
+def test_from_row_and_to_dict(db):
+    student_id = StudentCRUD.create(Student("김민수", student_grade=3))
+    row = db.execute(f"SELECT {', '.join(Student.COLUMNS)} FROM students").fetchone()
+
+    student = Student.from_row(row)
+
+    assert student == Student("김민수", student_id=student_id, student_grade=3)
+    assert Student.from_row(tuple(row)) == student
+    # None 인 필드는 제외
+    assert student.to_dict() == {'student_name': "김민수", 'student_id': student_id,
+                                 'student_grade': 3}
+    assert Student(**student.to_dict()) == student
+
+
+def test_records_use_slots(db):
+    student_id = StudentCRUD.create(Student("김민수"))
+    ConsultingCRUD.create(Consulting("상담", student_id))
+
+    for record in (StudentCRUD.get(student_id), ConsultingCRUD.search()[0],
+                   ConsultingCRUD.search_with_student()[0],
+                   ConsultingCRUD.search_summaries()[0]):
+        assert not hasattr(record, '__dict__')
+        with pytest.raises(AttributeError):
+            record.unknown_field = 1
+
@@ -0,0 +1,103 @@
+"""상담 통계 요약 테이블 테스트 (트리거 집계 == 전체 재집계)"""
+import random
+
+import pytest
+
+from carenote import statistics
+from carenote.crud import ConsultingCRUD, StudentCRUD
+from carenote.models import CONSULTING_OBJECTS, CONSULTING_TYPES, Consulting, Student
+
+
+def stats_table(conn) -> dict:
+    """consulting_stats 의 0 이 아닌 버킷"""
+    return {tuple(row[:5]): row[5]
+            for row in conn.execute("SELECT * FROM consulting_stats WHERE count != 0")}
+
+
+def recount(conn) -> dict:
+    """상담 기록에서 직접 다시 센 버킷"""
+    return {tuple(row[:5]): row[5] for row in conn.execute(statistics.RECOUNT_SQL)}
+
+
+def random_consulting(rng, student_ids):
+    return Consulting(
+        "상담", rng.choice(student_ids),
+        consulting_date=rng.choice([f"2024-{rng.randint(1, 12):02d}-15", '2025/01/03', None]),
+        consulting_type=rng.choice(CONSULTING_TYPES + (None,)),
+        consulting_object=rng.choice(CONSULTING_OBJECTS + (None,)),
+    )
+
+
+def test_trigger_counts_match_full_recount(db):
+    rng = random.Random(7)
+    student_ids = StudentCRUD.create_many(
+        Student(f"학생{i}", student_grade=rng.choice((None, 1, 2, 3, 4, 5, 6)),
+                student_class=rng.choice((None, 1, 2, 3, 4)))
+        for i in range(40)
+    )
+    consulting_ids = ConsultingCRUD.create_many(
+        random_consulting(rng, student_ids) for _ in range(300)
+    )
+    # create_many 는 날짜 형식을 검증하므로 형식이 다른 날짜는 직접 넣는다
+    db.execute("INSERT INTO consultings (consulting_title, student_id, consulting_date) "
+               "VALUES ('상담', ?, '지난주')", (student_ids[0],))
+    db.commit()
+    assert stats_table(db) == recount(db)
+
+    for consulting_id in rng.sample(consulting_ids, 30):
+        ConsultingCRUD.update(consulting_id, consulting_type=rng.choice(CONSULTING_TYPES),
+                              consulting_date=f"2023-{rng.randint(1, 12):02d}-01")
+    ConsultingCRUD.update_many({cid: {'consulting_object': '가족'}
+                                for cid in rng.sample(consulting_ids, 20)})
+    ConsultingCRUD.update(consulting_ids[0], student_id=student_ids[1])
+    assert stats_table(db) == recount(db)
+
+    StudentCRUD.update(student_ids[2], student_grade=6, student_class=4)
+    StudentCRUD.update_many({sid: {'student_class': 1} for sid in student_ids[3:10]})
+    StudentCRUD.rollover(2100)
+    assert stats_table(db) == recount(db)
+
+    ConsultingCRUD.delete(consulting_ids[5])
+    ConsultingCRUD.delete_many(consulting_ids[100:120])
+    StudentCRUD.delete(student_ids[11])
+    StudentCRUD.delete_many(student_ids[12:15])
+    assert stats_table(db) == recount(db)
+    assert statistics.total() == db.execute("SELECT COUNT(*) FROM consultings").fetchone()[0]
+
+
+def test_count_by(db):
+    student_id = StudentCRUD.create(Student("김민수", student_grade=3, student_class=2))
+    other_id = StudentCRUD.create(Student("이영희"))
+    ConsultingCRUD.create_many([
+        Consulting("상담", student_id, consulting_date='2024-03-05', consulting_type='대면'),
+        Consulting("상담", student_id, consulting_date='2024-03-20', consulting_type='전화'),
+        Consulting("상담", other_id, consulting_date='2024-04-01', consulting_type='대면',
+                   consulting_object='가족'),
+    ])
+
+    assert statistics.count_by('type') == {'대면': 2, '전화': 1}
+    assert statistics.count_by('object') == {None: 2, '가족': 1}
+    assert statistics.count_by('month') == {202403: 2, 202404: 1}
+    assert statistics.count_by('grade', 'class') == {(None, None): 1, (3, 2): 2}
+    assert statistics.count_by('type', start_date='2024-04-10') == {'대면': 1}
+    assert statistics.total(end_date='2024-03-31') == 2
+
+    # 학생 학년/반이 바뀌면 현재 학년/반 기준으로 옮겨진다
+    StudentCRUD.update(other_id, student_grade=1, student_class=1)
+    assert statistics.count_by('grade') == {1: 1, 3: 2}
+
+
+def test_rebuild_restores_counts(db):
+    student_id = StudentCRUD.create(Student("김민수", student_grade=3))
+    ConsultingCRUD.create_many([Consulting("상담", student_id, consulting_date='2024-03-05')] * 3)
+    db.execute("DELETE FROM consulting_stats")
+    db.commit()
+
+    statistics.rebuild()
+
+    assert statistics.count_by('grade') == {3: 3}
+
+
+def test_unknown_dimension(db):
+    with pytest.raises(ValueError):
+        statistics.count_by('teacher')
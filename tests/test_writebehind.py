@@ -0,0 +1,199 @@
+"""저장 지연 쓰기 대기열 테스트 (일괄 반영, 저널 재생, 재시도)"""
+import json
+import sqlite3
+
+import pytest
+
+from carenote import writebehind
+from carenote.crud import ConsultingCRUD, StudentCRUD
+from carenote.models import Consulting, Student
+from carenote.writebehind import Journal, JournalEntry, WriteBehindQueue, replay_journal
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / 'write_journal.jsonl')
+
+
+def applied_ids(conn) -> set:
+    return {row[0] for row in conn.execute("SELECT entry_id FROM write_journal_applied")}
+
+
+def test_queue_flushes_batches_and_empties_journal(db, journal_path):
+    student_id = StudentCRUD.create(Student("김민수"))
+    events = []
+    queue = WriteBehindQueue(journal_path, listener=lambda *args: events.append(args),
+                             batch_delay=0.05)
+    queue.start()
+
+    queue.create_student(Student("이영희", student_grade=2))
+    for i in range(5):
+        queue.create_consulting(Consulting(f"상담 {i}", student_id, consulting_date='2024-03-05'))
+    queue.update_student(student_id, student_class=3)
+
+    assert queue.close() == 0
+    assert len(ConsultingCRUD.get_by_student(student_id)) == 5
+    assert StudentCRUD.get(student_id).student_class == 3
+    assert [s.student_name for s in StudentCRUD.search(name="이영희")] == ["이영희"]
+    assert Journal(journal_path).pending() == []
+
+    results = [result for _, result, _ in events if result is not None]
+    assert sum(len(r.applied) for r in results) == 7
+    assert len(results) < 7  # 한 트랜잭션에 여러 요청
+    assert events[-1][0] == 0
+
+
+def test_submit_validates_before_acknowledging(db, journal_path):
+    queue = WriteBehindQueue(journal_path)
+    with pytest.raises(ValueError):
+        queue.create_consulting(Consulting("상담", 1, consulting_date='모름'))
+    with pytest.raises(ValueError):
+        queue.update_student(1, created_at="2024-01-01")
+    assert Journal(journal_path).pending() == []
+
+
+def test_replay_applies_leftovers_once(db, journal_path):
+    student_id = StudentCRUD.create(Student("김민수"))
+    entries = [
+        JournalEntry(f"entry-{i}", 'consulting.create',
+                     Consulting(f"상담 {i}", student_id, consulting_date='2024-03-05').to_dict())
+        for i in range(3)
+    ]
+    # 0 번은 반영 후 완료 기록 전에 종료, 1 번은 완료 기록까지 끝남, 2 번은 반영 전에 종료
+    writebehind.apply_entries(entries[:2])
+    journal = Journal(journal_path)
+    journal.append([e.to_record() for e in entries] + [{'done': ['entry-1']}])
+    with open(journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"id": "entry-3", "op": "consul')  # 기록 도중 잘린 줄
+
+    result = replay_journal(journal_path)
+
+    assert [e.entry_id for e in result.skipped] == ['entry-0']
+    assert [e.entry_id for e, _ in result.applied] == ['entry-2']
+    assert sorted(c.consulting_title for c in ConsultingCRUD.get_by_student(student_id)) == \
+        ["상담 0", "상담 1", "상담 2"]
+    assert journal.pending() == []
+
+
+def test_failed_entry_does_not_block_batch(db, journal_path):
+    student_id = StudentCRUD.create(Student("김민수"))
+    entries = [
+        JournalEntry("ok", 'consulting.create', {'consulting_title': "상담", 'student_id': student_id}),
+        JournalEntry("deleted-student", 'consulting.create',
+                     {'consulting_title': "상담", 'student_id': 9999}),
+        JournalEntry("tampered", 'student.update',
+                     {'student_id': student_id, 'updates': {'student_name = 1 --': 'x'}}),
+    ]
+
+    result = writebehind.apply_entries(entries)
+
+    assert [e.entry_id for e, _ in result.applied] == ["ok"]
+    assert {e.entry_id for e, _ in result.failed} == {"deleted-student", "tampered"}
+    assert len(ConsultingCRUD.get_by_student(student_id)) == 1
+    assert applied_ids(db) == {"ok"}
+
+
+def test_busy_database_is_retried(db, journal_path, monkeypatch):
+    monkeypatch.setattr(writebehind, 'RETRY_START_DELAY', 0.01)
+    student_id = StudentCRUD.create(Student("김민수"))
+    real_apply = writebehind.apply_entries
+    attempts = []
+
+    def flaky_apply(entries, prune_ids=()):
+        attempts.append(len(entries))
+        if len(attempts) <= 2:
+            raise sqlite3.OperationalError("database is locked")
+        return real_apply(entries, prune_ids)
+
+    monkeypatch.setattr(writebehind, 'apply_entries', flaky_apply)
+    errors = []
+    queue = WriteBehindQueue(journal_path, batch_delay=0,
+                             listener=lambda pending, result, error: error and errors.append(error))
+    queue.start()
+    queue.create_consulting(Consulting("상담", student_id))
+
+    assert queue.close() == 0
+    assert len(attempts) == 3 and len(errors) == 2
+    assert len(ConsultingCRUD.get_by_student(student_id)) == 1
+
+
+def test_unflushed_entries_stay_in_journal(db, journal_path, monkeypatch):
+    monkeypatch.setattr(writebehind, 'RETRY_START_DELAY', 0.01)
+
+    def locked(entries, prune_ids=()):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(writebehind, 'apply_entries', locked)
+    queue = WriteBehindQueue(journal_path, batch_delay=0)
+    queue.start()
+    queue.create_student(Student("김민수"))
+
+    assert queue.close(timeout=0.1) == 1
+    pending = Journal(journal_path).pending()
+    assert [(e.op, e.data) for e in pending] == [('student.create', {'student_name': "김민수"})]
+    with open(journal_path, encoding='utf-8') as f:
+        assert all(json.loads(line) for line in f)
+
+
+def test_pending_skips_malformed_records(journal_path):
+    with open(journal_path, 'w', encoding='utf-8') as f:
+        for line in ['{"op": "student.create", "data": {}}', '[1, 2]', 'null', '"text"',
+                     '{"id": 1, "op": "student.create", "data": {}}',
+                     '{"id": "a", "op": "student.create", "data": "x"}',
+                     '{"id": "ok", "op": "student.create", "data": {"student_name": "김민수"}}',
+                     '{"done": "ok"}', '{"done": [["ok"]]}']:
+            f.write(line + '\n')
+
+    assert [e.entry_id for e in Journal(journal_path).pending()] == ["ok"]
+
+
+def test_each_process_writes_its_own_journal(db, journal_path):
+    first = WriteBehindQueue(journal_path)
+    second = WriteBehindQueue(journal_path)
+    assert first.journal.path == journal_path
+    assert second.journal.path != journal_path
+
+    first.create_student(Student("김민수"))
+    second.create_student(Student("이영희"))
+
+    # 다른 쪽이 쓰고 있는 저널은 재생하지 않는다
+    assert replay_journal(journal_path).applied == []
+    assert first.close() == 1 and second.close() == 1
+
+    result = replay_journal(journal_path)
+    assert sorted(e.data['student_name'] for e, _ in result.applied) == ["김민수", "이영희"]
+    assert all(j.pending() == [] for j in Journal.family(journal_path))
+
+
+def test_start_adopts_orphaned_journals(db, journal_path):
+    # 두 번째로 실행된 프로세스가 반영하지 못하고 종료되면서 남긴 저널
+    orphan = Journal(journal_path.replace('.jsonl', '.2.jsonl'))
+    orphan.append([JournalEntry("orphan", 'student.create', {'student_name': "김민수"})
+                   .to_record()])
+
+    queue = WriteBehindQueue(journal_path, batch_delay=0)
+    queue.start()
+
+    assert queue.close() == 0
+    assert [s.student_name for s in StudentCRUD.search()] == ["김민수"]
+    assert orphan.pending() == []
+
+
+def test_replay_on_locked_database_leaves_journal_for_queue(db, journal_path, monkeypatch):
+    Journal(journal_path).append([JournalEntry("left", 'student.create', {'student_name': "김민수"})
+                                  .to_record()])
+
+    def locked(entries, prune_ids=()):
+        raise sqlite3.OperationalError("database is locked")
+
+    with monkeypatch.context() as m:
+        m.setattr(writebehind, 'apply_entries', locked)
+        with pytest.raises(sqlite3.OperationalError):
+            replay_journal(journal_path)
+
+    # 시작 후 쓰기 스레드가 같은 저널을 잡아 다시 반영
+    queue = WriteBehindQueue(journal_path, batch_delay=0)
+    assert queue.journal.path == journal_path
+    queue.start()
+    assert queue.close() == 0
+    assert [s.student_name for s in StudentCRUD.search()] == ["김민수"]